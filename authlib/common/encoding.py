@@ -33,8 +33,10 @@ def json_loads(s):
     return json.loads(s)
 
 
-def json_dumps(data, ensure_ascii=False):
-    return json.dumps(data, ensure_ascii=ensure_ascii, separators=(",", ":"))
+def json_dumps(data, ensure_ascii=False, sort_keys=False):
+    return json.dumps(
+        data, ensure_ascii=ensure_ascii, separators=(",", ":"), sort_keys=sort_keys
+    )
 
 
 def urlsafe_b64decode(s):
@@ -1,7 +1,10 @@
+import hashlib
 import os
 import random
 import string
 
+from .encoding import to_bytes
+
 UNICODE_ASCII_CHARACTER_SET = string.ascii_letters + string.digits
 
 
@@ -17,3 +20,10 @@ def is_secure_transport(uri):
 
     uri = uri.lower()
     return uri.startswith(("https://", "http://localhost:"))
+
+
+def hash_token(token_string):
+    """Return the SHA-256 digest of a token, to be used as a cache key
+    instead of the token itself.
+    """
+    return hashlib.sha256(to_bytes(token_string)).digest()
@@ -6,6 +6,8 @@ from .errors import OAuthError
 from .errors import TokenExpiredError
 from .errors import UnsupportedTokenTypeError
 from .framework_integration import FrameworkIntegration
+from .jwks import AsyncJWKSManager
+from .jwks import JWKSManager
 from .registry import BaseOAuth
 from .sync_app import BaseApp
 from .sync_app import OAuth1Mixin
@@ -19,6 +21,8 @@ __all__ = [
     "OAuth2Mixin",
     "OpenIDMixin",
     "FrameworkIntegration",
+    "JWKSManager",
+    "AsyncJWKSManager",
     "OAuthError",
     "MissingRequestTokenError",
     "MissingTokenError",
@@ -1,5 +1,7 @@
+import asyncio
 import logging
 import time
+from contextlib import asynccontextmanager
 
 from authlib.common.urls import urlparse
 
@@ -13,9 +15,27 @@ log = logging.getLogger(__name__)
 __all__ = ["AsyncOAuth1Mixin", "AsyncOAuth2Mixin"]
 
 
-class AsyncOAuth1Mixin(OAuth1Base):
+class _AsyncRequestMixin:
+    @asynccontextmanager
+    async def _open_session(self, session):
+        if self._session_pool is None:
+            async with session:
+                yield session
+        else:
+            try:
+                yield session
+            finally:
+                await self._session_pool.close_session(session)
+
+    async def aclose(self):
+        """Close the connections kept in the connection pool of this app."""
+        if self._session_pool is not None:
+            await self._session_pool.aclose()
+
+
+class AsyncOAuth1Mixin(_AsyncRequestMixin, OAuth1Base):
     async def request(self, method, url, token=None, **kwargs):
-        async with self._get_oauth_client() as session:
+        async with self._open_session(self._get_oauth_client()) as session:
             return await _http_request(self, session, method, url, token, kwargs)
 
     async def create_authorization_url(self, redirect_uri=None, **kwargs):
@@ -31,7 +51,7 @@ class AsyncOAuth1Mixin(OAuth1Base):
         if self.authorize_params:
             kwargs.update(self.authorize_params)
 
-        async with self._get_oauth_client() as client:
+        async with self._open_session(self._get_oauth_client()) as client:
             client.redirect_uri = redirect_uri
             params = {}
             if self.request_token_params:
@@ -51,7 +71,7 @@ class AsyncOAuth1Mixin(OAuth1Base):
         :param kwargs: Extra parameters to fetch access token.
         :return: A token dict.
         """
-        async with self._get_oauth_client() as client:
+        async with self._open_session(self._get_oauth_client()) as client:
             if request_token is None:
                 raise MissingRequestTokenError()
             # merge request token with verifier
@@ -64,7 +84,7 @@ class AsyncOAuth1Mixin(OAuth1Base):
         return token
 
 
-class AsyncOAuth2Mixin(OAuth2Base):
+class AsyncOAuth2Mixin(_AsyncRequestMixin, OAuth2Base):
     async def _on_update_token(self, token, refresh_token=None, access_token=None):
         if self._update_token:
             await self._update_token(
@@ -73,21 +93,68 @@ class AsyncOAuth2Mixin(OAuth2Base):
                 access_token=access_token,
             )
 
+    _server_metadata_async_lock = None
+    _server_metadata_task = None
+
+    def _get_server_metadata_async_lock(self):
+        # create the lock in the running event loop
+        if self._server_metadata_async_lock is None:
+            self._server_metadata_async_lock = asyncio.Lock()
+        return self._server_metadata_async_lock
+
     async def load_server_metadata(self):
-        if self._server_metadata_url and "_loaded_at" not in self.server_metadata:
-            async with self.client_cls(**self.client_kwargs) as client:
-                resp = await client.request(
-                    "GET", self._server_metadata_url, withhold_token=True
+        """Load the metadata of ``server_metadata_url``, the expired
+        metadata is refreshed in a background task while it is stale.
+        """
+        if not self._server_metadata_url:
+            return self.server_metadata
+
+        lock = self._get_server_metadata_async_lock()
+        status = self._get_server_metadata_status(time.time())
+        if status == "stale":
+            # claim the refresh before yielding to the event loop, so that
+            # concurrent calls never start another refresh task
+            task = self._server_metadata_task
+            if not lock.locked() and (task is None or task.done()):
+                self._server_metadata_task = asyncio.ensure_future(
+                    self._refresh_server_metadata_in_background()
                 )
-                resp.raise_for_status()
-                metadata = resp.json()
-                metadata["_loaded_at"] = time.time()
-            self.server_metadata.update(metadata)
+        elif status != "fresh":
+            async with lock:
+                status = self._get_server_metadata_status(time.time())
+                if status == "missing" or status == "expired":
+                    await self._refresh_server_metadata()
         return self.server_metadata
 
+    async def _refresh_server_metadata(self):
+        url = self._server_metadata_url
+        cached = await self.framework.get_server_metadata(url)
+        if cached and time.time() < cached["exp"]:
+            # refreshed by another process
+            self._update_server_metadata(cached["data"], cached["exp"])
+            return
+
+        async with self._open_session(
+            self._create_session(**self.client_kwargs)
+        ) as client:
+            resp = await client.request("GET", url, withhold_token=True)
+            metadata, expires_at = self._parse_server_metadata_response(resp)
+
+        timeout = self._get_server_metadata_cache_timeout(expires_at)
+        await self.framework.set_server_metadata(url, metadata, expires_at, timeout)
+        self._update_server_metadata(metadata, expires_at)
+
+    async def _refresh_server_metadata_in_background(self):
+        try:
+            async with self._get_server_metadata_async_lock():
+                if self._get_server_metadata_status(time.time()) != "fresh":
+                    await self._refresh_server_metadata()
+        except Exception:
+            log.exception("Failed to refresh the server metadata")
+
     async def request(self, method, url, token=None, **kwargs):
         metadata = await self.load_server_metadata()
-        async with self._get_oauth_client(**metadata) as session:
+        async with self._open_session(self._get_oauth_client(**metadata)) as session:
             return await _http_request(self, session, method, url, token, kwargs)
 
     async def create_authorization_url(self, redirect_uri=None, **kwargs):
@@ -107,7 +174,7 @@ class AsyncOAuth2Mixin(OAuth2Base):
         if self.authorize_params:
             kwargs.update(self.authorize_params)
 
-        async with self._get_oauth_client(**metadata) as client:
+        async with self._open_session(self._get_oauth_client(**metadata)) as client:
             client.redirect_uri = redirect_uri
             return self._create_oauth2_authorization_url(
                 client, authorization_endpoint, **kwargs
@@ -123,7 +190,7 @@ class AsyncOAuth2Mixin(OAuth2Base):
         """
         metadata = await self.load_server_metadata()
         token_endpoint = self.access_token_url or metadata.get("token_endpoint")
-        async with self._get_oauth_client(**metadata) as client:
+        async with self._open_session(self._get_oauth_client(**metadata)) as client:
             if redirect_uri is not None:
                 client.redirect_uri = redirect_uri
             params = {}
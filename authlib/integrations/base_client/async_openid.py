@@ -1,30 +1,78 @@
-from authlib.jose import JsonWebKey
 from authlib.jose import JsonWebToken
 from authlib.oidc.core import CodeIDToken
 from authlib.oidc.core import ImplicitIDToken
 from authlib.oidc.core import UserInfo
 
+from .jwks import AsyncJWKSManager
+from .jwks import parse_max_age
+
 __all__ = ["AsyncOpenIDMixin"]
 
 
 class AsyncOpenIDMixin:
+    #: seconds to cache the JWK set of ``jwks_uri`` when the response
+    #: has no Cache-Control max-age
+    jwks_expires_in = 3600
+    #: min seconds between two refetches of the JWK set for unknown kid
+    jwks_refresh_interval = 60
+    #: seconds before expiry to refresh the JWK set in background, 0 to disable
+    jwks_refresh_ahead = 0
+    #: min seconds to cache the JWK set, even for ``no-cache`` responses
+    jwks_min_expires_in = 0
+
     async def fetch_jwk_set(self, force=False):
+        """Fetch the JWK set of ``jwks_uri``, or return the configured
+        ``jwks``. The JWKS manager of this client calls this method and
+        caches the parsed JWK set. Subclasses can override it to load the
+        JWK set in another way, which is then cached for ``jwks_expires_in``
+        seconds.
+        """
+        jwk_set, _ = await self._fetch_jwk_set(force)
+        return jwk_set
+
+    async def _load_jwk_set(self, force=False):
+        if type(self).fetch_jwk_set is AsyncOpenIDMixin.fetch_jwk_set:
+            # keep the Cache-Control max-age of the response
+            return await self._fetch_jwk_set(force)
+        jwk_set = await self.fetch_jwk_set(force)
+        return jwk_set, self.jwks_expires_in
+
+    async def _fetch_jwk_set(self, force=False):
         metadata = await self.load_server_metadata()
         jwk_set = metadata.get("jwks")
         if jwk_set and not force:
-            return jwk_set
+            return jwk_set, None
 
         uri = metadata.get("jwks_uri")
         if not uri:
             raise RuntimeError('Missing "jwks_uri" in metadata')
 
-        async with self.client_cls(**self.client_kwargs) as client:
+        async with self._open_session(
+            self._create_session(**self.client_kwargs)
+        ) as client:
             resp = await client.request("GET", uri, withhold_token=True)
             resp.raise_for_status()
             jwk_set = resp.json()
 
-        self.server_metadata["jwks"] = jwk_set
-        return jwk_set
+        max_age = parse_max_age(resp.headers)
+        if max_age is None:
+            max_age = self.jwks_expires_in
+        return jwk_set, max_age
+
+    def get_jwks_manager(self):
+        """Get the :class:`AsyncJWKSManager` which keeps the parsed JWK set
+        of this client.
+        """
+        manager = getattr(self, "_jwks_manager", None)
+        if manager is None:
+            manager = AsyncJWKSManager(
+                self._load_jwk_set,
+                refresh_interval=self.jwks_refresh_interval,
+                min_expires_in=self.jwks_min_expires_in,
+                refresh_ahead=self.jwks_refresh_ahead,
+            )
+            self._jwks_manager = manager
+        return manager
 
     async def userinfo(self, **kwargs):
         """Fetch user info from ``userinfo_endpoint``."""
@@ -59,20 +107,21 @@ class AsyncOpenIDMixin:
 
         jwt = JsonWebToken(alg_values)
 
-        jwk_set = await self.fetch_jwk_set()
+        manager = self.get_jwks_manager()
+        key_set = await manager.get_key_set()
         try:
             claims = jwt.decode(
                 token["id_token"],
-                key=JsonWebKey.import_key_set(jwk_set),
+                key=key_set,
                 claims_cls=claims_cls,
                 claims_options=claims_options,
                 claims_params=claims_params,
             )
         except ValueError:
-            jwk_set = await self.fetch_jwk_set(force=True)
+            key_set = await manager.refresh_key_set(key_set)
             claims = jwt.decode(
                 token["id_token"],
-                key=JsonWebKey.import_key_set(jwk_set),
+                key=key_set,
                 claims_cls=claims_cls,
                 claims_options=claims_options,
                 claims_params=claims_params,
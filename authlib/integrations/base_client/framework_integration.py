@@ -56,6 +56,26 @@ class FrameworkIntegration:
             session.pop(key, None)
             self._clear_session_state(session)
 
+    def get_server_metadata(self, url):
+        """Get the server metadata of ``url`` shared in the cache, which
+        is a dict of ``data`` and ``exp``.
+        """
+        if not self.cache:
+            return None
+        value = self._get_cache_data(f"_server_metadata_{self.name}")
+        if value and value.get("url") == url:
+            return value
+        return None
+
+    def set_server_metadata(self, url, metadata, expires_at, timeout):
+        """Share the server metadata of ``url`` with other processes via
+        the cache, the entry is removed from cache after ``timeout``.
+        """
+        if self.cache:
+            key = f"_server_metadata_{self.name}"
+            value = {"url": url, "data": metadata, "exp": expires_at}
+            self.cache.set(key, json.dumps(value), timeout)
+
     def update_token(self, token, refresh_token=None, access_token=None):
         raise NotImplementedError()
 
@@ -0,0 +1,215 @@
+import asyncio
+import logging
+import re
+import threading
+import time
+
+from authlib.jose import JsonWebKey
+
+log = logging.getLogger(__name__)
+
+__all__ = ["JWKSManager", "AsyncJWKSManager", "parse_max_age"]
+
+_MAX_AGE_PATTERN = re.compile(r"(?:^|[,\s])max-age\s*=\s*\"?(\d+)\"?", re.I)
+
+
+def parse_max_age(headers):
+    """Parse the ``max-age`` directive of the Cache-Control header. It
+    returns 0 for ``no-cache`` and ``no-store`` responses, and ``None``
+    when there is no such directive.
+    """
+    value = headers.get("Cache-Control") if headers is not None else None
+    if not isinstance(value, str):
+        return None
+
+    directives = value.lower()
+    if "no-store" in directives or "no-cache" in directives:
+        return 0
+
+    m = _MAX_AGE_PATTERN.search(value)
+    if m:
+        return int(m.group(1))
+    return None
+
+
+class _BaseJWKSManager:
+    def __init__(self, fetch, refresh_interval=60, refresh_ahead=0, min_expires_in=0):
+        self._fetch = fetch
+        self.refresh_interval = refresh_interval
+        self.refresh_ahead = refresh_ahead
+        self.min_expires_in = min_expires_in
+        self.key_set = None
+        #: the JWK set dict of ``key_set``
+        self.jwk_set = None
+        #: expiry of ``key_set``, a ``time.monotonic()`` value
+        self.expires_at = None
+        self._refreshed_at = None
+        self._refreshing = False
+
+    def _is_fresh(self, key_set, now):
+        if key_set is None or key_set is not self.key_set:
+            return False
+        return self.expires_at is None or now < self.expires_at
+
+    def _should_refresh_ahead(self, now):
+        if not self.refresh_ahead or self.expires_at is None or self._refreshing:
+            return False
+        return now >= self.expires_at - self.refresh_ahead
+
+    def _can_refresh(self, now):
+        if self._refreshed_at is None:
+            return True
+        return now - self._refreshed_at >= self.refresh_interval
+
+    def _update(self, jwk_set, expires_in):
+        now = time.monotonic()
+        self.key_set = JsonWebKey.import_key_set(jwk_set)
+        self.jwk_set = jwk_set
+        if expires_in is None:
+            # a configured JWK set, which is not fetched from remote
+            self.expires_at = None
+        else:
+            self.expires_at = now + max(expires_in, self.min_expires_in)
+            self._refreshed_at = now
+        return self.key_set
+
+
+class JWKSManager(_BaseJWKSManager):
+    """Keep the parsed JWK set of a remote provider. The JWK set is loaded
+    with the ``fetch`` function, which accepts a ``force`` parameter and
+    returns a ``(jwk_set, expires_in)`` tuple. An ``expires_in`` of
+    ``None`` means the JWK set never expires.
+
+    Concurrent refreshes are collapsed into a single ``fetch`` call, and
+    refreshes for unknown ``kid`` values are rate limited with
+    ``refresh_interval``.
+
+    :param fetch: function to fetch the JWK set
+    :param refresh_interval: min seconds between two forced refreshes
+    :param refresh_ahead: seconds before expiry to refresh the JWK set in
+        a background thread, 0 to disable
+    :param min_expires_in: min seconds to keep a fetched JWK set, e.g. for
+        ``no-cache`` responses, 0 to follow the ``expires_in`` of ``fetch``
+    """
+
+    def __init__(self, fetch, refresh_interval=60, refresh_ahead=0, min_expires_in=0):
+        super().__init__(fetch, refresh_interval, refresh_ahead, min_expires_in)
+        self._lock = threading.Lock()
+
+    def get_key_set(self):
+        """Get the cached KeySet, fetch a new one if it is expired."""
+        key_set = self.key_set
+        now = time.monotonic()
+        if self._is_fresh(key_set, now):
+            if self._should_refresh_ahead(now):
+                self._refresh_in_background(key_set)
+            return key_set
+        return self._refresh(key_set)
+
+    def refresh_key_set(self, key_set):
+        """Refresh the given KeySet when a ``kid`` is missing from it. When
+        the last refresh happened less than ``refresh_interval`` seconds
+        ago, the current KeySet is returned without fetching.
+        """
+        with self._lock:
+            if key_set is not self.key_set:
+                return self.key_set
+            if not self._can_refresh(time.monotonic()):
+                return self.key_set
+            return self._fetch_key_set(force=True)
+
+    def _refresh(self, stale):
+        with self._lock:
+            if self._is_fresh(self.key_set, time.monotonic()):
+                # refreshed by another thread
+                return self.key_set
+            return self._fetch_key_set(force=stale is not None)
+
+    def _fetch_key_set(self, force):
+        jwk_set, expires_in = self._fetch(force)
+        return self._update(jwk_set, expires_in)
+
+    def _refresh_in_background(self, key_set):
+        # never wait for the lock, the current KeySet is still valid
+        if not self._lock.acquire(blocking=False):
+            return
+        if self._refreshing or key_set is not self.key_set:
+            self._lock.release()
+            return
+        self._refreshing = True
+
+        def refresh():
+            try:
+                self._fetch_key_set(force=True)
+            except Exception:
+                log.exception("Failed to refresh the JWK set")
+            finally:
+                self._refreshing = False
+                self._lock.release()
+
+        try:
+            thread = threading.Thread(target=refresh, daemon=True)
+            thread.start()
+        except Exception:
+            self._refreshing = False
+            self._lock.release()
+            raise
+
+
+class AsyncJWKSManager(_BaseJWKSManager):
+    """The asyncio version of :class:`JWKSManager`, the ``fetch`` function
+    is a coroutine function.
+    """
+
+    def __init__(self, fetch, refresh_interval=60, refresh_ahead=0, min_expires_in=0):
+        super().__init__(fetch, refresh_interval, refresh_ahead, min_expires_in)
+        self._lock = None
+        self._task = None
+
+    def _get_lock(self):
+        # create the lock in the running event loop
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        return self._lock
+
+    async def get_key_set(self):
+        """Get the cached KeySet, fetch a new one if it is expired."""
+        key_set = self.key_set
+        now = time.monotonic()
+        if self._is_fresh(key_set, now):
+            if self._should_refresh_ahead(now):
+                self._refreshing = True
+                self._task = asyncio.ensure_future(self._refresh_in_background())
+            return key_set
+        return await self._refresh(key_set)
+
+    async def refresh_key_set(self, key_set):
+        """Refresh the given KeySet when a ``kid`` is missing from it. When
+        the last refresh happened less than ``refresh_interval`` seconds
+        ago, the current KeySet is returned without fetching.
+        """
+        async with self._get_lock():
+            if key_set is not self.key_set:
+                return self.key_set
+            if not self._can_refresh(time.monotonic()):
+                return self.key_set
+            return await self._fetch_key_set(force=True)
+
+    async def _refresh(self, stale):
+        async with self._get_lock():
+            if self._is_fresh(self.key_set, time.monotonic()):
+                return self.key_set
+            return await self._fetch_key_set(force=stale is not None)
+
+    async def _fetch_key_set(self, force):
+        jwk_set, expires_in = await self._fetch(force)
+        return self._update(jwk_set, expires_in)
+
+    async def _refresh_in_background(self):
+        try:
+            async with self._get_lock():
+                await self._fetch_key_set(force=True)
+        except Exception:
+            log.exception("Failed to refresh the JWK set")
+        finally:
+            self._refreshing = False
@@ -1,5 +1,7 @@
 import logging
+import threading
 import time
+from contextlib import contextmanager
 
 from authlib.common.security import generate_token
 from authlib.common.urls import urlparse
@@ -8,6 +10,7 @@ from authlib.consts import default_user_agent
 from .errors import MismatchingStateError
 from .errors import MissingRequestTokenError
 from .errors import MissingTokenError
+from .jwks import parse_max_age
 
 log = logging.getLogger(__name__)
 
@@ -65,7 +68,41 @@ class BaseApp:
         return self.request("DELETE", url, **kwargs)
 
 
+class _SessionPoolMixin:
+    #: the class of the connection pool shared by the sessions of this
+    #: app, e.g. :class:`~authlib.integrations.requests_client.ConnectionPool`,
+    #: ``None`` to create a new connection pool for every session
+    session_pool_cls = None
+
+    def _init_session_pool(self):
+        if self.session_pool_cls is None:
+            self._session_pool = None
+        else:
+            self._session_pool = self.session_pool_cls(self.client_kwargs)
+
+    def _create_session(self, *args, **kwargs):
+        if self._session_pool is None:
+            return self.client_cls(*args, **kwargs)
+        return self._session_pool.create_session(self.client_cls, *args, **kwargs)
+
+
 class _RequestMixin:
+    @contextmanager
+    def _open_session(self, session):
+        if self._session_pool is None:
+            with session:
+                yield session
+        else:
+            try:
+                yield session
+            finally:
+                self._session_pool.close_session(session)
+
+    def close(self):
+        """Close the connections kept in the connection pool of this app."""
+        if self._session_pool is not None:
+            self._session_pool.close()
+
     def _get_requested_token(self, request):
         if self._fetch_token and request:
             return self._fetch_token(request)
@@ -89,7 +126,7 @@ class _RequestMixin:
         return session.request(method, url, **kwargs)
 
 
-class OAuth1Base:
+class OAuth1Base(_SessionPoolMixin):
     client_cls = None
 
     def __init__(
@@ -126,9 +163,10 @@ class OAuth1Base:
         self._fetch_token = fetch_token
         self._user_agent = user_agent or default_user_agent
         self._kwargs = kwargs
+        self._init_session_pool()
 
     def _get_oauth_client(self):
-        session = self.client_cls(
+        session = self._create_session(
             self.client_id, self.client_secret, **self.client_kwargs
         )
         session.headers["User-Agent"] = self._user_agent
@@ -137,7 +175,7 @@ class OAuth1Base:
 
 class OAuth1Mixin(_RequestMixin, OAuth1Base):
     def request(self, method, url, token=None, **kwargs):
-        with self._get_oauth_client() as session:
+        with self._open_session(self._get_oauth_client()) as session:
             return self._send_token_request(session, method, url, token, kwargs)
 
     def create_authorization_url(self, redirect_uri=None, **kwargs):
@@ -153,7 +191,7 @@ class OAuth1Mixin(_RequestMixin, OAuth1Base):
         if self.authorize_params:
             kwargs.update(self.authorize_params)
 
-        with self._get_oauth_client() as client:
+        with self._open_session(self._get_oauth_client()) as client:
             client.redirect_uri = redirect_uri
             params = self.request_token_params or {}
             request_token = client.fetch_request_token(self.request_token_url, **params)
@@ -169,7 +207,7 @@ class OAuth1Mixin(_RequestMixin, OAuth1Base):
         :param kwargs: Extra parameters to fetch access token.
         :return: A token dict.
         """
-        with self._get_oauth_client() as client:
+        with self._open_session(self._get_oauth_client()) as client:
             if request_token is None:
                 raise MissingRequestTokenError()
             # merge request token with verifier
@@ -182,8 +220,17 @@ class OAuth1Mixin(_RequestMixin, OAuth1Base):
         return token
 
 
-class OAuth2Base:
+class OAuth2Base(_SessionPoolMixin):
     client_cls = None
+    #: seconds to cache the metadata of ``server_metadata_url`` when the
+    #: response has no Cache-Control max-age
+    server_metadata_expires_in = 3600
+    #: seconds to keep using expired metadata while it is refreshed in
+    #: background, 0 to always refresh before using it
+    server_metadata_stale_while_revalidate = 600
+    #: min seconds to cache the metadata, also for ``no-cache`` responses,
+    #: 0 to follow the Cache-Control header of the response
+    server_metadata_min_expires_in = 0
 
     def __init__(
         self,
@@ -223,7 +270,12 @@ class OAuth2Base:
         self._user_agent = user_agent or default_user_agent
 
         self._server_metadata_url = server_metadata_url
+        self._server_metadata_expires_at = None
+        self._server_metadata_lock = threading.Lock()
+        # the fetched metadata is merged into a copy of the given one
+        self._client_metadata = dict(kwargs)
         self.server_metadata = kwargs
+        self._init_session_pool()
 
     def _on_update_token(self, token, refresh_token=None, access_token=None):
         raise NotImplementedError()
@@ -238,7 +290,7 @@ class OAuth2Base:
         if self.access_token_url:
             client_kwargs["token_endpoint"] = self.access_token_url
 
-        session = self.client_cls(
+        session = self._create_session(
             client_id=self.client_id,
             client_secret=self.client_secret,
             update_token=self._on_update_token,
@@ -254,6 +306,39 @@ class OAuth2Base:
         session.headers["User-Agent"] = self._user_agent
         return session
 
+    def _get_server_metadata_status(self, now):
+        expires_at = self._server_metadata_expires_at
+        if expires_at is None:
+            return "missing"
+        if now < expires_at:
+            return "fresh"
+        if now < expires_at + self.server_metadata_stale_while_revalidate:
+            return "stale"
+        return "expired"
+
+    def _get_server_metadata_cache_timeout(self, expires_at):
+        return (
+            int(expires_at - time.time()) + self.server_metadata_stale_while_revalidate
+        )
+
+    def _parse_server_metadata_response(self, resp):
+        resp.raise_for_status()
+        metadata = resp.json()
+        max_age = parse_max_age(getattr(resp, "headers", None))
+        if max_age is None:
+            max_age = self.server_metadata_expires_in
+        max_age = max(max_age, self.server_metadata_min_expires_in)
+        return metadata, time.time() + max_age
+
+    def _update_server_metadata(self, metadata, expires_at):
+        # replace the fetched metadata, keys removed by the provider are
+        # not kept from the previous fetch
+        server_metadata = dict(self._client_metadata)
+        server_metadata.update(metadata)
+        server_metadata["_loaded_at"] = time.time()
+        self.server_metadata = server_metadata
+        self._server_metadata_expires_at = expires_at
+
     @staticmethod
     def _format_state_params(state_data, params):
         if state_data is None:
@@ -315,22 +400,67 @@ class OAuth2Mixin(_RequestMixin, OAuth2Base):
 
     def request(self, method, url, token=None, **kwargs):
         metadata = self.load_server_metadata()
-        with self._get_oauth_client(**metadata) as session:
+        with self._open_session(self._get_oauth_client(**metadata)) as session:
             return self._send_token_request(session, method, url, token, kwargs)
 
     def load_server_metadata(self):
-        if self._server_metadata_url and "_loaded_at" not in self.server_metadata:
-            with self.client_cls(**self.client_kwargs) as session:
-                resp = session.request(
-                    "GET", self._server_metadata_url, withhold_token=True
-                )
-                resp.raise_for_status()
-                metadata = resp.json()
-
-            metadata["_loaded_at"] = time.time()
-            self.server_metadata.update(metadata)
+        """Load the metadata of ``server_metadata_url``. The metadata is
+        cached for ``server_metadata_expires_in`` seconds, or the max-age
+        of the response. Expired metadata is still used for
+        ``server_metadata_stale_while_revalidate`` seconds while it is
+        refreshed in a background thread. When the registry has a
+        ``cache``, the metadata is shared with other processes through
+        the cache.
+        """
+        if not self._server_metadata_url:
+            return self.server_metadata
+
+        status = self._get_server_metadata_status(time.time())
+        if status == "stale":
+            self._refresh_server_metadata_in_background()
+        elif status != "fresh":
+            with self._server_metadata_lock:
+                status = self._get_server_metadata_status(time.time())
+                if status == "missing" or status == "expired":
+                    self._refresh_server_metadata()
         return self.server_metadata
 
+    def _refresh_server_metadata(self):
+        url = self._server_metadata_url
+        cached = self.framework.get_server_metadata(url)
+        if cached and time.time() < cached["exp"]:
+            # refreshed by another process
+            self._update_server_metadata(cached["data"], cached["exp"])
+            return
+
+        with self._open_session(self._create_session(**self.client_kwargs)) as session:
+            resp = session.request("GET", url, withhold_token=True)
+            metadata, expires_at = self._parse_server_metadata_response(resp)
+
+        timeout = self._get_server_metadata_cache_timeout(expires_at)
+        self.framework.set_server_metadata(url, metadata, expires_at, timeout)
+        self._update_server_metadata(metadata, expires_at)
+
+    def _refresh_server_metadata_in_background(self):
+        if not self._server_metadata_lock.acquire(blocking=False):
+            # the metadata is being refreshed
+            return
+
+        def refresh():
+            try:
+                self._refresh_server_metadata()
+            except Exception:
+                log.exception("Failed to refresh the server metadata")
+            finally:
+                self._server_metadata_lock.release()
+
+        try:
+            thread = threading.Thread(target=refresh, daemon=True)
+            thread.start()
+        except Exception:
+            self._server_metadata_lock.release()
+            raise
+
     def create_authorization_url(self, redirect_uri=None, **kwargs):
         """Generate the authorization url and state for HTTP redirect.
 
@@ -349,7 +479,7 @@ class OAuth2Mixin(_RequestMixin, OAuth2Base):
         if self.authorize_params:
             kwargs.update(self.authorize_params)
 
-        with self._get_oauth_client(**metadata) as client:
+        with self._open_session(self._get_oauth_client(**metadata)) as client:
             if redirect_uri is not None:
                 client.redirect_uri = redirect_uri
             return self._create_oauth2_authorization_url(
@@ -366,7 +496,7 @@ class OAuth2Mixin(_RequestMixin, OAuth2Base):
         """
         metadata = self.load_server_metadata()
         token_endpoint = self.access_token_url or metadata.get("token_endpoint")
-        with self._get_oauth_client(**metadata) as client:
+        with self._open_session(self._get_oauth_client(**metadata)) as client:
             if redirect_uri is not None:
                 client.redirect_uri = redirect_uri
             params = {}
@@ -1,29 +1,75 @@
-from authlib.jose import JsonWebKey
 from authlib.jose import JsonWebToken
 from authlib.jose import jwt
 from authlib.oidc.core import CodeIDToken
 from authlib.oidc.core import ImplicitIDToken
 from authlib.oidc.core import UserInfo
 
+from .jwks import JWKSManager
+from .jwks import parse_max_age
+
 
 class OpenIDMixin:
+    #: seconds to cache the JWK set of ``jwks_uri`` when the response
+    #: has no Cache-Control max-age
+    jwks_expires_in = 3600
+    #: min seconds between two refetches of the JWK set for unknown kid
+    jwks_refresh_interval = 60
+    #: seconds before expiry to refresh the JWK set in background, 0 to disable
+    jwks_refresh_ahead = 0
+    #: min seconds to cache the JWK set, even for ``no-cache`` responses
+    jwks_min_expires_in = 0
+
     def fetch_jwk_set(self, force=False):
+        """Fetch the JWK set of ``jwks_uri``, or return the configured
+        ``jwks``. The JWKS manager of this client calls this method and
+        caches the parsed JWK set. Subclasses can override it to load the
+        JWK set in another way, which is then cached for ``jwks_expires_in``
+        seconds.
+        """
+        jwk_set, _ = self._fetch_jwk_set(force)
+        return jwk_set
+
+    def _load_jwk_set(self, force=False):
+        if type(self).fetch_jwk_set is OpenIDMixin.fetch_jwk_set:
+            # keep the Cache-Control max-age of the response
+            return self._fetch_jwk_set(force)
+        jwk_set = self.fetch_jwk_set(force)
+        return jwk_set, self.jwks_expires_in
+
+    def _fetch_jwk_set(self, force=False):
         metadata = self.load_server_metadata()
         jwk_set = metadata.get("jwks")
         if jwk_set and not force:
-            return jwk_set
+            return jwk_set, None
 
         uri = metadata.get("jwks_uri")
         if not uri:
             raise RuntimeError('Missing "jwks_uri" in metadata')
 
-        with self.client_cls(**self.client_kwargs) as session:
+        with self._open_session(self._create_session(**self.client_kwargs)) as session:
             resp = session.request("GET", uri, withhold_token=True)
             resp.raise_for_status()
             jwk_set = resp.json()
 
-        self.server_metadata["jwks"] = jwk_set
-        return jwk_set
+        max_age = parse_max_age(resp.headers)
+        if max_age is None:
+            max_age = self.jwks_expires_in
+        return jwk_set, max_age
+
+    def get_jwks_manager(self):
+        """Get the :class:`JWKSManager` which keeps the parsed JWK set of
+        this client.
+        """
+        manager = getattr(self, "_jwks_manager", None)
+        if manager is None:
+            manager = JWKSManager(
+                self._load_jwk_set,
+                refresh_interval=self.jwks_refresh_interval,
+                min_expires_in=self.jwks_min_expires_in,
+                refresh_ahead=self.jwks_refresh_ahead,
+            )
+            self._jwks_manager = manager
+        return manager
 
     def userinfo(self, **kwargs):
         """Fetch user info from ``userinfo_endpoint``."""
@@ -79,13 +125,15 @@ class OpenIDMixin:
         return UserInfo(claims)
 
     def create_load_key(self):
+        manager = self.get_jwks_manager()
+
         def load_key(header, _):
-            jwk_set = JsonWebKey.import_key_set(self.fetch_jwk_set())
+            key_set = manager.get_key_set()
             try:
-                return jwk_set.find_by_kid(header.get("kid"))
+                return key_set.find_by_kid(header.get("kid"))
             except ValueError:
                 # re-try with new jwk set
-                jwk_set = JsonWebKey.import_key_set(self.fetch_jwk_set(force=True))
-                return jwk_set.find_by_kid(header.get("kid"))
+                key_set = manager.refresh_key_set(key_set)
+                return key_set.find_by_kid(header.get("kid"))
 
         return load_key
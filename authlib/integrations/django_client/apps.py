@@ -5,6 +5,7 @@ from ..base_client import OAuth1Mixin
 from ..base_client import OAuth2Mixin
 from ..base_client import OAuthError
 from ..base_client import OpenIDMixin
+from ..requests_client import ConnectionPool
 from ..requests_client import OAuth1Session
 from ..requests_client import OAuth2Session
 
@@ -32,6 +33,7 @@ class DjangoAppMixin:
 
 class DjangoOAuth1App(DjangoAppMixin, OAuth1Mixin, BaseApp):
     client_cls = OAuth1Session
+    session_pool_cls = ConnectionPool
 
     def authorize_access_token(self, request, **kwargs):
         """Fetch access token in one step.
@@ -56,6 +58,7 @@ class DjangoOAuth1App(DjangoAppMixin, OAuth1Mixin, BaseApp):
 
 class DjangoOAuth2App(DjangoAppMixin, OAuth2Mixin, OpenIDMixin, BaseApp):
     client_cls = OAuth2Session
+    session_pool_cls = ConnectionPool
 
     def authorize_access_token(self, request, **kwargs):
         """Fetch access token in one step.
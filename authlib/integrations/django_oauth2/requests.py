@@ -1,5 +1,3 @@
-from collections import defaultdict
-
 from django.http import HttpRequest
 from django.utils.functional import cached_property
 
@@ -23,21 +21,13 @@ class DjangoOAuth2Request(OAuth2Request):
     def form(self):
         return self._request.POST
 
-    @cached_property
-    def data(self):
-        data = {}
-        data.update(self._request.GET.dict())
-        data.update(self._request.POST.dict())
-        return data
-
-    @cached_property
-    def datalist(self):
-        values = defaultdict(list)
-        for k in self.args:
-            values[k].extend(self.args.getlist(k))
-        for k in self.form:
-            values[k].extend(self.form.getlist(k))
-        return values
+    def iter_parameters(self):
+        for k, values in self._request.GET.lists():
+            for v in values:
+                yield k, v
+        for k, values in self._request.POST.lists():
+            for v in values:
+                yield k, v
 
 
 class DjangoJsonRequest(JsonRequest):
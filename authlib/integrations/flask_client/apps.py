@@ -8,6 +8,7 @@ from ..base_client import OAuth1Mixin
 from ..base_client import OAuth2Mixin
 from ..base_client import OAuthError
 from ..base_client import OpenIDMixin
+from ..requests_client import ConnectionPool
 from ..requests_client import OAuth1Session
 from ..requests_client import OAuth2Session
 
@@ -53,6 +54,7 @@ class FlaskAppMixin:
 
 class FlaskOAuth1App(FlaskAppMixin, OAuth1Mixin, BaseApp):
     client_cls = OAuth1Session
+    session_pool_cls = ConnectionPool
 
     def authorize_access_token(self, **kwargs):
         """Fetch access token in one step.
@@ -78,6 +80,7 @@ class FlaskOAuth1App(FlaskAppMixin, OAuth1Mixin, BaseApp):
 
 class FlaskOAuth2App(FlaskAppMixin, OAuth2Mixin, OpenIDMixin, BaseApp):
     client_cls = OAuth2Session
+    session_pool_cls = ConnectionPool
 
     def authorize_access_token(self, **kwargs):
         """Fetch access token in one step.
@@ -1,6 +1,3 @@
-from collections import defaultdict
-from functools import cached_property
-
 from flask.wrappers import Request
 
 from authlib.oauth2.rfc6749 import JsonRequest
@@ -24,12 +21,9 @@ class FlaskOAuth2Request(OAuth2Request):
     def data(self):
         return self._request.values
 
-    @cached_property
-    def datalist(self):
-        values = defaultdict(list)
-        for k in self.data:
-            values[k].extend(self.data.getlist(k))
-        return values
+    def iter_parameters(self):
+        yield from self._request.args.items(multi=True)
+        yield from self._request.form.items(multi=True)
 
 
 class FlaskJsonRequest(JsonRequest):
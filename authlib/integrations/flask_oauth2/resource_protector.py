@@ -93,8 +93,9 @@ class ResourceProtector(_ResourceProtector):
 
     def __call__(self, scopes=None, optional=False, **kwargs):
         claims = kwargs
-        # backward compatibility
-        claims["scopes"] = scopes
+        # backward compatibility, the required scopes are compiled once,
+        # instead of for each request
+        claims["scopes"] = self.compile_requirement(scopes)
 
         def wrapper(f):
             @functools.wraps(f)
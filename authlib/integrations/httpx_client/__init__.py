@@ -15,6 +15,8 @@ from .oauth2_client import AsyncOAuth2Client
 from .oauth2_client import OAuth2Auth
 from .oauth2_client import OAuth2Client
 from .oauth2_client import OAuth2ClientAuth
+from .utils import AsyncConnectionPool
+from .utils import ConnectionPool
 
 __all__ = [
     "OAuthError",
@@ -33,4 +35,6 @@ __all__ = [
     "AsyncOAuth2Client",
     "AssertionClient",
     "AsyncAssertionClient",
+    "ConnectionPool",
+    "AsyncConnectionPool",
 ]
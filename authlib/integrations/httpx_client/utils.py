@@ -1,3 +1,11 @@
+import asyncio
+import weakref
+from urllib.request import getproxies
+
+from httpx import AsyncClient
+from httpx import AsyncHTTPTransport
+from httpx import Client
+from httpx import HTTPTransport
 from httpx import Request
 
 HTTPX_CLIENT_KWARGS = [
@@ -21,6 +29,16 @@ HTTPX_CLIENT_KWARGS = [
 ]
 
 
+HTTPX_TRANSPORT_KWARGS = [
+    "verify",
+    "cert",
+    "trust_env",
+    "http1",
+    "http2",
+    "limits",
+]
+
+
 def extract_client_kwargs(kwargs):
     client_kwargs = {}
     for k in HTTPX_CLIENT_KWARGS:
@@ -39,3 +57,106 @@ def build_request(url, headers, body, initial_request: Request) -> Request:
         updated_request.extensions = initial_request.extensions
 
     return updated_request
+
+
+def _get_transport_kwargs(client_kwargs):
+    client_kwargs = client_kwargs or {}
+    if any(k in client_kwargs for k in ("transport", "mounts", "proxy")):
+        return None
+    if client_kwargs.get("trust_env", True) and getproxies():
+        # proxy transports are created per client
+        return None
+    return {k: client_kwargs[k] for k in HTTPX_TRANSPORT_KWARGS if k in client_kwargs}
+
+
+class ConnectionPool:
+    """Share one transport between the clients of an OAuth app, so that
+    connections are kept alive between the requests of an app, while
+    every client still keeps its own token. The transport is created
+    with the transport options (``verify``, ``cert``, ``http2``,
+    ``limits``, etc.) of ``client_kwargs``. Clients are not pooled when
+    ``client_kwargs`` contains a ``transport``, ``mounts`` or ``proxy``,
+    or when proxies are configured in environment variables.
+
+    :param client_kwargs: the ``client_kwargs`` of the OAuth app
+    """
+
+    def __init__(self, client_kwargs=None):
+        transport_kwargs = _get_transport_kwargs(client_kwargs)
+        if transport_kwargs is None:
+            self.transport = None
+        else:
+            self.transport = HTTPTransport(**transport_kwargs)
+
+    def _is_pooled(self, session):
+        return self.transport is not None and isinstance(session, Client)
+
+    def create_session(self, session_cls, *args, **kwargs):
+        if self.transport is not None and issubclass(session_cls, Client):
+            kwargs["transport"] = self.transport
+        return session_cls(*args, **kwargs)
+
+    def close_session(self, session):
+        # closing a pooled client would close the shared transport
+        if not self._is_pooled(session):
+            session.close()
+
+    def close(self):
+        """Close the connections kept in this pool."""
+        if self.transport is not None:
+            self.transport.close()
+
+
+class AsyncConnectionPool:
+    """The asyncio version of :class:`ConnectionPool`. The connections of
+    an ``AsyncHTTPTransport`` are bound to an event loop, so the clients
+    share one transport per running event loop. Clients created outside
+    of a running event loop are not pooled.
+
+    :param client_kwargs: the ``client_kwargs`` of the OAuth app
+    """
+
+    def __init__(self, client_kwargs=None):
+        self._transport_kwargs = _get_transport_kwargs(client_kwargs)
+        self._transports = weakref.WeakKeyDictionary()
+        self._sessions = weakref.WeakSet()
+
+    @property
+    def transport(self):
+        """The shared transport of the running event loop, or None."""
+        if self._transport_kwargs is None:
+            return None
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return None
+        transport = self._transports.get(loop)
+        if transport is None:
+            transport = AsyncHTTPTransport(**self._transport_kwargs)
+            self._transports[loop] = transport
+        return transport
+
+    def create_session(self, session_cls, *args, **kwargs):
+        transport = None
+        if issubclass(session_cls, AsyncClient):
+            transport = self.transport
+        if transport is None:
+            return session_cls(*args, **kwargs)
+        kwargs["transport"] = transport
+        session = session_cls(*args, **kwargs)
+        self._sessions.add(session)
+        return session
+
+    async def close_session(self, session):
+        if session not in self._sessions:
+            await session.aclose()
+
+    async def aclose(self):
+        """Close the connections kept in this pool for the running event
+        loop. The transports of other event loops are discarded.
+        """
+        transports = self._transports
+        self._transports = weakref.WeakKeyDictionary()
+        transport = transports.get(asyncio.get_running_loop())
+        if transport is not None:
+            await transport.aclose()
@@ -11,6 +11,7 @@ from .oauth1_session import OAuth1Auth
 from .oauth1_session import OAuth1Session
 from .oauth2_session import OAuth2Auth
 from .oauth2_session import OAuth2Session
+from .utils import ConnectionPool
 
 __all__ = [
     "OAuthError",
@@ -25,4 +26,5 @@ __all__ = [
     "OAuth2Session",
     "OAuth2Auth",
     "AssertionSession",
+    "ConnectionPool",
 ]
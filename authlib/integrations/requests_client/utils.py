@@ -1,3 +1,6 @@
+from requests import Session
+from requests.adapters import HTTPAdapter
+
 REQUESTS_SESSION_KWARGS = [
     "proxies",
     "hooks",
@@ -13,3 +16,47 @@ def update_session_configure(session, kwargs):
     for k in REQUESTS_SESSION_KWARGS:
         if k in kwargs:
             setattr(session, k, kwargs.pop(k))
+
+
+class ConnectionPool:
+    """Share one connection pool between the sessions of an OAuth app.
+    Sessions created with :meth:`create_session` mount a shared
+    ``HTTPAdapter``, so that connections are kept alive between the
+    requests of an app, while every session still keeps its own token.
+    The session options (``verify``, ``cert``, ``proxies``, etc.) of
+    ``client_kwargs`` are set on every session of the pool.
+
+    :param client_kwargs: the ``client_kwargs`` of the OAuth app
+    """
+
+    def __init__(self, client_kwargs=None):
+        client_kwargs = client_kwargs or {}
+        self.session_kwargs = {
+            k: client_kwargs[k] for k in REQUESTS_SESSION_KWARGS if k in client_kwargs
+        }
+        self.adapter = HTTPAdapter()
+
+    def create_session(self, session_cls, *args, **kwargs):
+        session = session_cls(*args, **kwargs)
+        if isinstance(session, Session):
+            session_kwargs = dict(self.session_kwargs)
+            # options given to this session take precedence
+            for k in kwargs:
+                session_kwargs.pop(k, None)
+            update_session_configure(session, session_kwargs)
+            session.mount("https://", self.adapter)
+            session.mount("http://", self.adapter)
+        return session
+
+    def close_session(self, session):
+        adapters = getattr(session, "adapters", None)
+        if adapters:
+            # detach the shared adapter, it is closed in :meth:`close`
+            for prefix, adapter in list(adapters.items()):
+                if adapter is self.adapter:
+                    del adapters[prefix]
+        session.close()
+
+    def close(self):
+        """Close the connections kept in this pool."""
+        self.adapter.close()
@@ -6,6 +6,7 @@ from ..base_client import OAuthError
 from ..base_client.async_app import AsyncOAuth1Mixin
 from ..base_client.async_app import AsyncOAuth2Mixin
 from ..base_client.async_openid import AsyncOpenIDMixin
+from ..httpx_client import AsyncConnectionPool
 from ..httpx_client import AsyncOAuth1Client
 from ..httpx_client import AsyncOAuth2Client
 
@@ -40,6 +41,7 @@ class StarletteAppMixin:
 
 class StarletteOAuth1App(StarletteAppMixin, AsyncOAuth1Mixin, BaseApp):
     client_cls = AsyncOAuth1Client
+    session_pool_cls = AsyncConnectionPool
 
     async def authorize_access_token(self, request, **kwargs):
         params = dict(request.query_params)
@@ -61,6 +63,7 @@ class StarletteOAuth2App(
     StarletteAppMixin, AsyncOAuth2Mixin, AsyncOpenIDMixin, BaseApp
 ):
     client_cls = AsyncOAuth2Client
+    session_pool_cls = AsyncConnectionPool
 
     async def authorize_access_token(self, request, **kwargs):
         error = request.query_params.get("error")
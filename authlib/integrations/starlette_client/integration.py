@@ -55,6 +55,22 @@ class StarletteIntegration(FrameworkIntegration):
             session.pop(key, None)
             self._clear_session_state(session)
 
+    async def get_server_metadata(self, url: str) -> Optional[dict[str, Any]]:
+        if not self.cache:
+            return None
+        value = await self._get_cache_data(f"_server_metadata_{self.name}")
+        if value and value.get("url") == url:
+            return value
+        return None
+
+    async def set_server_metadata(
+        self, url: str, metadata: dict[str, Any], expires_at: float, timeout: int
+    ):
+        if self.cache:
+            key = f"_server_metadata_{self.name}"
+            value = {"url": url, "data": metadata, "exp": expires_at}
+            await self.cache.set(key, json.dumps(value), timeout)
+
     def update_token(self, token, refresh_token=None, access_token=None):
         pass
 
@@ -10,6 +10,9 @@ from .rfc7515 import JsonWebSignature
 from .rfc7515 import JWSAlgorithm
 from .rfc7515 import JWSHeader
 from .rfc7515 import JWSObject
+from .rfc7515 import JWSSigner
+from .rfc7515 import JWSVerifier
+from .rfc7515 import SigningPool
 from .rfc7516 import JsonWebEncryption
 from .rfc7516 import JWEAlgorithm
 from .rfc7516 import JWEEncAlgorithm
@@ -17,17 +20,22 @@ from .rfc7516 import JWEZipAlgorithm
 from .rfc7517 import JsonWebKey
 from .rfc7517 import Key
 from .rfc7517 import KeySet
+from .rfc7517 import PreparedKeyCache
 from .rfc7518 import ECDHESAlgorithm
 from .rfc7518 import ECKey
+from .rfc7518 import EphemeralKeyPool
 from .rfc7518 import OctKey
 from .rfc7518 import RSAKey
 from .rfc7518 import register_jwe_rfc7518
 from .rfc7518 import register_jws_rfc7518
 from .rfc7519 import BaseClaims
+from .rfc7519 import ClaimsOptions
 from .rfc7519 import JsonWebToken
 from .rfc7519 import JWTClaims
+from .rfc7519 import JWTTemplate
 from .rfc8037 import OKPKey
 from .rfc8037 import register_jws_rfc8037
+from .util import HeaderCache
 
 # register algorithms
 register_jws_rfc7518(JsonWebSignature)
@@ -55,6 +63,9 @@ __all__ = [
     "JWSAlgorithm",
     "JWSHeader",
     "JWSObject",
+    "JWSSigner",
+    "JWSVerifier",
+    "SigningPool",
     "JsonWebEncryption",
     "JWEAlgorithm",
     "JWEEncAlgorithm",
@@ -62,12 +73,17 @@ __all__ = [
     "JsonWebKey",
     "Key",
     "KeySet",
+    "PreparedKeyCache",
+    "HeaderCache",
+    "EphemeralKeyPool",
     "OctKey",
     "RSAKey",
     "ECKey",
     "OKPKey",
     "JsonWebToken",
+    "JWTTemplate",
     "BaseClaims",
+    "ClaimsOptions",
     "JWTClaims",
     "jwt",
 ]
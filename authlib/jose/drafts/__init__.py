@@ -1,4 +1,5 @@
 from ._jwe_algorithms import JWE_DRAFT_ALG_ALGORITHMS
+from ._jwe_algorithms import ECDH1PUAlgorithm
 from ._jwe_enc_cryptography import C20PEncAlgorithm
 
 try:
@@ -16,4 +17,4 @@ def register_jwe_draft(cls):
         cls.register_algorithm(XC20PEncAlgorithm(256))  # XC20P
 
 
-__all__ = ["register_jwe_draft"]
+__all__ = ["register_jwe_draft", "ECDH1PUAlgorithm"]
@@ -17,6 +17,9 @@ class ECDH1PUAlgorithm(JWEAlgorithmWithTagAwareKeyAgreement):
     EXTRA_HEADERS = ["epk", "apu", "apv", "skid"]
     ALLOWED_KEY_CLS = (ECKey, OKPKey)
 
+    #: Optional :class:`EphemeralKeyPool` of pre-generated ephemeral keys
+    EPHEMERAL_KEY_POOL = None
+
     # https://datatracker.ietf.org/doc/html/draft-madden-jose-ecdh-1pu-04
     def __init__(self, key_size=None):
         if key_size is None:
@@ -114,6 +117,9 @@ class ECDH1PUAlgorithm(JWEAlgorithmWithTagAwareKeyAgreement):
         return self.compute_derived_key(shared_key, fixed_info, bit_size)
 
     def _generate_ephemeral_key(self, key):
+        pool = self.EPHEMERAL_KEY_POOL
+        if pool is not None:
+            return pool.get(type(key), key["crv"])
         return key.generate_key(key["crv"], is_private=True)
 
     def _prepare_headers(self, epk):
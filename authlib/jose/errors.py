@@ -72,6 +72,11 @@ class UnsupportedCompressionAlgorithmError(JoseError):
     description = "Unsupported 'zip' value in header"
 
 
+class ExceededSizeError(JoseError):
+    error = "exceeded_size"
+    description = "Decoded data exceeds the size limit"
+
+
 class InvalidUseError(JoseError):
     error = "invalid_use"
     description = "Key 'use' is not valid for your usage"
@@ -11,5 +11,16 @@ from .jws import JsonWebSignature
 from .models import JWSAlgorithm
 from .models import JWSHeader
 from .models import JWSObject
+from .signer import JWSSigner
+from .signer import JWSVerifier
+from .signing_pool import SigningPool
 
-__all__ = ["JsonWebSignature", "JWSAlgorithm", "JWSHeader", "JWSObject"]
+__all__ = [
+    "JsonWebSignature",
+    "JWSAlgorithm",
+    "JWSHeader",
+    "JWSObject",
+    "JWSSigner",
+    "JWSVerifier",
+    "SigningPool",
+]
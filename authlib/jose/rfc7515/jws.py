@@ -1,18 +1,31 @@
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
 from authlib.common.encoding import json_b64encode
+from authlib.common.encoding import json_dumps
 from authlib.common.encoding import to_bytes
 from authlib.common.encoding import to_unicode
 from authlib.common.encoding import urlsafe_b64encode
 from authlib.jose.errors import BadSignatureError
 from authlib.jose.errors import DecodeError
 from authlib.jose.errors import InvalidHeaderParameterNameError
+from authlib.jose.errors import JoseError
 from authlib.jose.errors import MissingAlgorithmError
 from authlib.jose.errors import UnsupportedAlgorithmError
+from authlib.jose.rfc7517 import PreparedKeyCache
+from authlib.jose.util import Base64Encoder
+from authlib.jose.util import HeaderCache
 from authlib.jose.util import ensure_dict
 from authlib.jose.util import extract_header
 from authlib.jose.util import extract_segment
+from authlib.jose.util import iter_chunks
+from authlib.jose.util import load_key_async
+from authlib.jose.util import run_async
 
 from .models import JWSHeader
 from .models import JWSObject
+from .signer import JWSSigner
+from .signer import JWSVerifier
 
 
 class JsonWebSignature:
@@ -30,23 +43,54 @@ class JsonWebSignature:
             "typ",
             "cty",
             "crit",
+            # RFC7797
+            "b64",
         ]
     )
 
     #: Defined available JWS algorithms in the registry
     ALGORITHMS_REGISTRY = {}
 
-    def __init__(self, algorithms=None, private_headers=None):
+    #: Process wide cache of prepared keys, shared by all instances
+    #: which are not created with a ``key_cache`` parameter
+    KEY_CACHE = PreparedKeyCache()
+
+    #: Process wide cache of the parsed protected headers of compact
+    #: serializations, a subclass with its own ``ALGORITHMS_REGISTRY``
+    #: needs its own cache
+    HEADER_CACHE = HeaderCache()
+
+    #: Algorithms cheap enough to run on the event loop in the ``*_async``
+    #: methods, the other algorithms run in an executor
+    INLINE_ALGORITHMS = frozenset(["none", "HS256", "HS384", "HS512"])
+
+    #: Default executor of the ``*_async`` methods, None is the default
+    #: executor of the running event loop
+    EXECUTOR = None
+
+    def __init__(
+        self, algorithms=None, private_headers=None, key_cache=None, signing_pool=None
+    ):
         self._private_headers = private_headers
         self._algorithms = algorithms
+        if key_cache is None:
+            key_cache = self.KEY_CACHE
+        elif key_cache is False:
+            # opt out of the prepared key cache
+            key_cache = None
+        self._key_cache = key_cache
+        # a SigningPool to sign the compact serializations of its keys
+        self._signing_pool = signing_pool
 
     @classmethod
     def register_algorithm(cls, algorithm):
         if not algorithm or algorithm.algorithm_type != "JWS":
             raise ValueError(f"Invalid algorithm for JWS, {algorithm!r}")
         cls.ALGORITHMS_REGISTRY[algorithm.name] = algorithm
+        # cached headers may refer to the replaced algorithm
+        cls.HEADER_CACHE.clear()
 
-    def serialize_compact(self, protected, payload, key):
+    def serialize_compact(self, protected, payload, key, detached=False):
         """Generate a JWS Compact Serialization. The JWS Compact Serialization
         represents digitally signed or MACed content as a compact, URL-safe
         string, per `Section 7.1`_.
@@ -57,58 +101,257 @@ class JsonWebSignature:
             BASE64URL(JWS Payload) || '.' ||
             BASE64URL(JWS Signature)
 
+        With ``"b64": false`` in the protected header, the payload is not
+        encoded, per :rfc:`7797`. With ``detached=True``, the payload
+        segment is left empty, and the payload can be a file-like object
+        or an iterable of bytes, which is fed to the signature in chunks.
+
+        When ``key`` is None and the instance has a ``signing_pool`` which
+        contains the ``kid`` of the header, the signature is computed by
+        the pool.
+
         :param protected: A dict of protected header
         :param payload: A bytes/string of payload
         :param key: Private key used to generate signature
+        :param detached: Detach the payload from the serialization
         :return: byte
         """
+        pool_kid = None if detached else self._get_pool_kid(protected, key)
+        if pool_kid is not None:
+            signing_input = self._prepare_signing_input(protected, payload)
+            signature = self._signing_pool.sign(
+                protected["alg"], pool_kid, signing_input
+            )
+            return signing_input + b"." + urlsafe_b64encode(signature)
+
         jws_header = JWSHeader(protected, None)
         self._validate_private_headers(protected)
+        b64 = _get_b64(protected, ValueError)
         algorithm, key = self._prepare_algorithm_key(protected, payload, key)
 
         protected_segment = json_b64encode(jws_header.protected)
-        payload_segment = urlsafe_b64encode(to_bytes(payload))
+        if detached:
+            stream = algorithm.prepare_stream_signer(key)
+            stream.update(protected_segment + b".")
+            _stream_payload([stream], payload, b64)
+            signature = urlsafe_b64encode(stream.finalize())
+            return b".".join([protected_segment, b"", signature])
+
+        payload_segment = _encode_compact_payload(to_bytes(payload), b64)
 
         # calculate signature
         signing_input = b".".join([protected_segment, payload_segment])
         signature = urlsafe_b64encode(algorithm.sign(signing_input, key))
         return b".".join([protected_segment, payload_segment, signature])
 
-    def deserialize_compact(self, s, key, decode=None):
+    def deserialize_compact(self, s, key, decode=None, detached_payload=None):
         """Exact JWS Compact Serialization, and validate with the given key.
         If key is not provided, the returned dict will contain the signature,
         and signing input values. Via `Section 7.1`_.
 
+        The payload of a detached serialization is given by
+        ``detached_payload``, a bytes/string, a file-like object or an
+        iterable of bytes. A file-like object or an iterable is fed to the
+        signature in chunks, the ``payload`` of the result is None.
+
         :param s: text of JWS Compact Serialization
         :param key: key used to verify the signature
         :param decode: a function to decode payload data
+        :param detached_payload: payload of a detached serialization
         :return: JWSObject
         :raise: BadSignatureError
 
         .. _`Section 7.1`: https://tools.ietf.org/html/rfc7515#section-7.1
         """
-        try:
-            s = to_bytes(s)
-            signing_input, signature_segment = s.rsplit(b".", 1)
-            protected_segment, payload_segment = signing_input.split(b".", 1)
-        except ValueError as exc:
-            raise DecodeError("Not enough segments") from exc
+        if detached_payload is not None:
+            return self._deserialize_detached_compact(s, key, decode, detached_payload)
 
-        protected = _extract_header(protected_segment)
-        jws_header = JWSHeader(protected, None)
+        signing_input, signature, rv, algorithm = self._parse_compact(s, decode)
+        return self._verify_compact(signing_input, signature, rv, algorithm, key)
 
-        payload = _extract_payload(payload_segment)
-        if decode:
-            payload = decode(payload)
+    async def serialize_compact_async(
+        self, protected, payload, key, detached=False, executor=None
+    ):
+        """An awaitable version of :meth:`serialize_compact`. Algorithms
+        in ``INLINE_ALGORITHMS``, e.g. HMAC, sign on the event loop, the
+        other ones sign in the ``executor``, defaults to ``EXECUTOR``.
 
-        signature = _extract_signature(signature_segment)
-        rv = JWSObject(jws_header, payload, "compact")
-        algorithm, key = self._prepare_algorithm_key(jws_header, payload, key)
-        if algorithm.verify(signing_input, signature, key):
-            return rv
-        raise BadSignatureError(rv)
+        :param protected: A dict of protected header
+        :param payload: A bytes/string of payload
+        :param key: Private key, or a (coroutine) function to load it
+        :param detached: Detach the payload from the serialization
+        :param executor: optional ``concurrent.futures`` executor
+        :return: byte
+        """
+        pool_kid = None if detached else self._get_pool_kid(protected, key)
+        if pool_kid is not None:
+            signing_input = self._prepare_signing_input(protected, payload)
+            signature = await self._signing_pool.sign_async(
+                protected["alg"], pool_kid, signing_input
+            )
+            return signing_input + b"." + urlsafe_b64encode(signature)
+
+        key = await load_key_async(key, protected, payload)
+        return await run_async(
+            protected.get("alg") in self.INLINE_ALGORITHMS,
+            executor or self.EXECUTOR,
+            self.serialize_compact,
+            protected,
+            payload,
+            key,
+            detached,
+        )
+
+    async def deserialize_compact_async(self, s, key, decode=None, executor=None):
+        """An awaitable version of :meth:`deserialize_compact`. The key
+        can be a coroutine function, which is called with the header and
+        payload, e.g. to fetch a JWK set::
+
+            async def load_key(header, payload):
+                jwk_set = await fetch_jwk_set()
+                return jwk_set.find_by_kid(header["kid"])
+
+
+            data = await jws.deserialize_compact_async(s, load_key)
+
+        Algorithms in ``INLINE_ALGORITHMS`` verify on the event loop, the
+        other ones verify in the ``executor``, defaults to ``EXECUTOR``.
+
+        :param s: text of JWS Compact Serialization
+        :param key: key, or a (coroutine) function to load it
+        :param decode: a function to decode payload data
+        :param executor: optional ``concurrent.futures`` executor
+        :return: JWSObject
+        :raise: BadSignatureError
+        """
+        signing_input, signature, rv, algorithm = self._parse_compact(s, decode)
+        # never call the key loader for a token of a disallowed algorithm
+        algorithm = self._get_algorithm(rv.header, algorithm)
+        key = await load_key_async(key, rv.header, rv.payload)
+        return await run_async(
+            rv.header.get("alg") in self.INLINE_ALGORITHMS,
+            executor or self.EXECUTOR,
+            self._verify_compact,
+            signing_input,
+            signature,
+            rv,
+            algorithm,
+            key,
+        )
+
+    def verify_many(self, tokens, key, decode=None, executor=None, chunk_size=64):
+        """Verify a batch of JWS Compact Serializations with the given key.
+        Tokens are grouped by the ``alg`` and ``kid`` of their headers, and
+        the key of each group is prepared only once. When ``key`` is a
+        function, it is called for every token, and the tokens are grouped
+        by the ``alg`` and the prepared key instead.
+
+        The signatures can be verified in a ``concurrent.futures``
+        executor, in chunks of ``chunk_size`` tokens. With a
+        ``ProcessPoolExecutor``, keys are sent to the worker processes as
+        JWK dicts, and custom algorithms must be registered when the
+        worker imports Authlib.
+
+        :param tokens: list of JWS Compact Serializations
+        :param key: key used to verify the signatures
+        :param decode: a function to decode payload data
+        :param executor: optional executor to verify the signatures
+        :param chunk_size: max number of tokens in an executor task
+        :return: list of JWSObject or the error raised for each
+            token, in the order of ``tokens``
+        """
+        results = [None] * len(tokens)
+        groups = {}
+        for index, s in enumerate(tokens):
+            try:
+                signing_input, signature, rv, algorithm = self._parse_compact(s, decode)
+            except JoseError as error:
+                results[index] = error
+                continue
+
+            if callable(key):
+                # the key may depend on the payload, load it for each token
+                try:
+                    algorithm, _key = self._prepare_algorithm_key(
+                        rv.header, rv.payload, key, algorithm
+                    )
+                except (JoseError, ValueError) as error:
+                    results[index] = error
+                    continue
+                group_key = (algorithm.name, id(_key))
+            elif key is None:
+                # every token may embed its own "jwk"
+                group_key = index
+                _key = None
+            else:
+                group_key = (rv.header.get("alg"), rv.header.get("kid"))
+                _key = None
+            item = (index, signing_input, signature, rv, algorithm)
+            group = groups.setdefault(group_key, (_key, []))
+            group[1].append(item)
+
+        tasks = []
+        for _key, items in groups.values():
+            if _key is None:
+                rv, algorithm = items[0][3:]
+                try:
+                    algorithm, _key = self._prepare_algorithm_key(
+                        rv.header, rv.payload, key, algorithm
+                    )
+                except (JoseError, ValueError) as error:
+                    for item in items:
+                        results[item[0]] = error
+                    continue
+            else:
+                algorithm = items[0][4]
+
+            for i in range(0, len(items), chunk_size):
+                tasks.append((algorithm, _key, items[i : i + chunk_size]))
+
+        for (_, _, items), verified in zip(tasks, _run_tasks(tasks, executor)):
+            if isinstance(verified, Exception):
+                # the task failed, e.g. a worker process died
+                for index, *_ in items:
+                    results[index] = verified
+                continue
+            for (index, _, _, rv, _), ok in zip(items, verified):
+                results[index] = rv if ok else BadSignatureError(rv)
+        return results
+
+    def signer(self, header, key):
+        """Create a :class:`JWSSigner` to generate JWS Compact Serializations
+        with the given protected header and key. The header is validated,
+        encoded and the key is prepared only once, which saves the per call
+        overhead of :meth:`serialize_compact` for a fixed header.
+
+        :param header: A dict of protected header
+        :param key: Private key used to generate signature
+        :return: JWSSigner
+        """
+        jws_header = JWSHeader(header, None)
+        self._validate_private_headers(header)
+        _get_b64(header, ValueError)
+        pool_kid = self._get_pool_kid(header, key)
+        if pool_kid is not None:
+            alg = header["alg"]
+            sign = partial(self._signing_pool.sign, alg, pool_kid)
+            return JWSSigner(dict(header), self.ALGORITHMS_REGISTRY[alg], sign)
+
+        algorithm, key = self._prepare_algorithm_key(jws_header, None, key)
+        return JWSSigner(dict(header), algorithm, algorithm.prepare_signer(key))
+
+    def verifier(self, alg, key):
+        """Create a :class:`JWSVerifier` to validate JWS Compact
+        Serializations signed with the given algorithm and key.
+
+        :param alg: A string of algorithm name, e.g. "RS256"
+        :param key: Public key used to verify the signature
+        :return: JWSVerifier
+        """
+        algorithm, key = self._prepare_algorithm_key({"alg": alg}, None, key)
+        return JWSVerifier(self, algorithm, algorithm.prepare_verifier(key))
 
-    def serialize_json(self, header_obj, payload, key):
+    def serialize_json(self, header_obj, payload, key, detached=False):
         """Generate a JWS JSON Serialization. The JWS JSON Serialization
         represents digitally signed or MACed content as a JSON object,
         per `Section 7.2`_.
@@ -116,6 +359,7 @@ class JsonWebSignature:
         :param header_obj: A dict/list of header
         :param payload: A string/dict of payload
         :param key: Private key used to generate signature
+        :param detached: Detach the payload from the serialization
         :return: JWSObject
 
         Example ``header_obj`` of JWS JSON Serialization::
@@ -127,41 +371,83 @@ class JsonWebSignature:
 
         Pass a dict to generate flattened JSON Serialization, pass a list of
         header dict to generate standard JSON Serialization.
-        """
-        payload_segment = json_b64encode(payload)
 
-        def _sign(jws_header):
+        The payload is not encoded when the protected headers contain
+        ``"b64": false``, per :rfc:`7797`. With ``detached=True``, the
+        ``payload`` member is omitted, and the payload can be a file-like
+        object or an iterable of bytes, which is read only once for all
+        the signatures.
+        """
+        if isinstance(header_obj, dict):
+            jws_headers = [JWSHeader.from_dict(header_obj)]
+        else:
+            jws_headers = [JWSHeader.from_dict(h) for h in header_obj]
+        b64 = _get_json_b64(jws_headers, ValueError)
+
+        if detached:
+            payload_segment = None
+        elif b64:
+            payload_segment = json_b64encode(payload)
+        else:
+            if isinstance(payload, dict):
+                payload = json_dumps(payload)
+            payload_segment = to_bytes(payload)
+
+        signers = []
+        for jws_header in jws_headers:
             self._validate_private_headers(jws_header)
             _alg, _key = self._prepare_algorithm_key(jws_header, payload, key)
-
             protected_segment = json_b64encode(jws_header.protected)
-            signing_input = b".".join([protected_segment, payload_segment])
-            signature = urlsafe_b64encode(_alg.sign(signing_input, _key))
-
+            signers.append((jws_header, protected_segment, _alg, _key))
+
+        if detached:
+            streams = []
+            for _, protected_segment, _alg, _key in signers:
+                stream = _alg.prepare_stream_signer(_key)
+                stream.update(protected_segment + b".")
+                streams.append(stream)
+            _stream_payload(streams, payload, b64)
+            signatures = [stream.finalize() for stream in streams]
+        else:
+            signatures = [
+                _alg.sign(b".".join([protected_segment, payload_segment]), _key)
+                for _, protected_segment, _alg, _key in signers
+            ]
+
+        items = []
+        for (jws_header, protected_segment, _, _), signature in zip(
+            signers, signatures
+        ):
             rv = {
                 "protected": to_unicode(protected_segment),
-                "signature": to_unicode(signature),
+                "signature": to_unicode(urlsafe_b64encode(signature)),
             }
             if jws_header.header is not None:
                 rv["header"] = jws_header.header
-            return rv
+            items.append(rv)
 
         if isinstance(header_obj, dict):
-            data = _sign(JWSHeader.from_dict(header_obj))
-            data["payload"] = to_unicode(payload_segment)
+            data = items[0]
+            if payload_segment is not None:
+                data["payload"] = to_unicode(payload_segment)
             return data
 
-        signatures = [_sign(JWSHeader.from_dict(h)) for h in header_obj]
-        return {"payload": to_unicode(payload_segment), "signatures": signatures}
+        if payload_segment is None:
+            return {"signatures": items}
+        return {"payload": to_unicode(payload_segment), "signatures": items}
 
-    def deserialize_json(self, obj, key, decode=None):
+    def deserialize_json(self, obj, key, decode=None, detached_payload=None):
         """Exact JWS JSON Serialization, and validate with the given key.
         If key is not provided, it will return a dict without signature
         verification. Header will still be validated. Via `Section 7.2`_.
 
+        The payload of a detached serialization is given by
+        ``detached_payload``, the same as :meth:`deserialize_compact`.
+
         :param obj: text of JWS JSON Serialization
         :param key: key used to verify the signature
         :param decode: a function to decode payload data
+        :param detached_payload: payload of a detached serialization
         :return: JWSObject
         :raise: BadSignatureError
 
@@ -170,36 +456,61 @@ class JsonWebSignature:
         obj = ensure_dict(obj, "JWS")
 
         payload_segment = obj.get("payload")
-        if payload_segment is None:
+        if detached_payload is not None:
+            if payload_segment:
+                raise DecodeError('Unexpected "payload" value')
+        elif payload_segment is None:
             raise DecodeError('Missing "payload" value')
 
-        payload_segment = to_bytes(payload_segment)
-        payload = _extract_payload(payload_segment)
-        if decode:
-            payload = decode(payload)
-
-        if "signatures" not in obj:
+        if "signatures" in obj:
+            items = [_extract_json_signature(h) for h in obj["signatures"]]
+        else:
             # flattened JSON JWS
-            jws_header, valid = self._validate_json_jws(
-                payload_segment, payload, obj, key
+            items = [_extract_json_signature(obj)]
+        b64 = _get_json_b64([item[1] for item in items], DecodeError)
+
+        if detached_payload is not None:
+            payload = _decode_detached_payload(detached_payload, decode)
+        else:
+            payload_segment = to_bytes(payload_segment)
+            if b64:
+                payload = _extract_payload(payload_segment)
+            else:
+                payload = payload_segment
+            if decode:
+                payload = decode(payload)
+
+        verifiers = []
+        for protected_segment, jws_header, signature in items:
+            algorithm, _key = self._prepare_algorithm_key(jws_header, payload, key)
+            verifiers.append((protected_segment, signature, algorithm, _key))
+
+        if detached_payload is not None:
+            streams = []
+            for protected_segment, _, algorithm, _key in verifiers:
+                stream = algorithm.prepare_stream_verifier(_key)
+                stream.update(protected_segment + b".")
+                streams.append(stream)
+            _stream_payload(streams, detached_payload, b64)
+            is_valid = all(
+                stream.finalize(item[1]) for stream, item in zip(streams, verifiers)
             )
-
-            rv = JWSObject(jws_header, payload, "flat")
-            if valid:
-                return rv
-            raise BadSignatureError(rv)
-
-        headers = []
-        is_valid = True
-        for header_obj in obj["signatures"]:
-            jws_header, valid = self._validate_json_jws(
-                payload_segment, payload, header_obj, key
+        else:
+            is_valid = all(
+                [
+                    algorithm.verify(
+                        b".".join([protected_segment, payload_segment]),
+                        signature,
+                        _key,
+                    )
+                    for protected_segment, signature, algorithm, _key in verifiers
+                ]
             )
-            headers.append(jws_header)
-            if not valid:
-                is_valid = False
 
-        rv = JWSObject(headers, payload, "json")
+        if "signatures" in obj:
+            rv = JWSObject([item[1] for item in items], payload, "json")
+        else:
+            rv = JWSObject(items[0][1], payload, "flat")
         if is_valid:
             return rv
         raise BadSignatureError(rv)
@@ -243,22 +554,103 @@ class JsonWebSignature:
             return self.deserialize_json(s, key, decode)
         return self.deserialize_compact(s, key, decode)
 
-    def _prepare_algorithm_key(self, header, payload, key):
+    def _parse_compact(self, s, decode):
+        try:
+            s = to_bytes(s)
+            signing_input, signature_segment = s.rsplit(b".", 1)
+            protected_segment, payload_segment = signing_input.split(b".", 1)
+        except ValueError as exc:
+            raise DecodeError("Not enough segments") from exc
+
+        protected, algorithm = self._extract_compact_header(protected_segment)
+        jws_header = JWSHeader(protected, None)
+
+        if _get_b64(protected, DecodeError):
+            payload = _extract_payload(payload_segment)
+        else:
+            payload = payload_segment
+        if decode:
+            payload = decode(payload)
+
+        signature = _extract_signature(signature_segment)
+        rv = JWSObject(jws_header, payload, "compact")
+        return signing_input, signature, rv, algorithm
+
+    def _extract_compact_header(self, header_segment):
+        # the cached algorithms are resolved from the registry of this class
+        namespace = id(self.ALGORITHMS_REGISTRY)
+        cached = self.HEADER_CACHE.get(header_segment, namespace)
+        if cached is not None:
+            protected, algorithm = cached
+            return dict(protected), algorithm
+
+        protected = _extract_header(header_segment)
+        alg = protected.get("alg")
+        algorithm = None
+        if isinstance(alg, str):
+            algorithm = self.ALGORITHMS_REGISTRY.get(alg)
+        if algorithm is not None:
+            self.HEADER_CACHE.set(
+                header_segment, protected, algorithm, namespace=namespace
+            )
+        return protected, algorithm
+
+    def _get_pool_kid(self, header, key):
+        # only sign with the pool when no key is given, a given key is
+        # never replaced by a pool key of the same kid
+        if self._signing_pool is None or key is not None:
+            return None
+        alg = header.get("alg")
+        kid = header.get("kid")
+        if alg in self.INLINE_ALGORITHMS or kid not in self._signing_pool:
+            return None
+        if self._algorithms is not None and alg not in self._algorithms:
+            return None
+        if alg not in self.ALGORITHMS_REGISTRY:
+            return None
+        return kid
+
+    def _prepare_signing_input(self, protected, payload):
+        jws_header = JWSHeader(protected, None)
+        self._validate_private_headers(protected)
+        b64 = _get_b64(protected, ValueError)
+        protected_segment = json_b64encode(jws_header.protected)
+        payload_segment = _encode_compact_payload(to_bytes(payload), b64)
+        return protected_segment + b"." + payload_segment
+
+    def _verify_compact(self, signing_input, signature, rv, algorithm, key):
+        algorithm, key = self._prepare_algorithm_key(
+            rv.header, rv.payload, key, algorithm
+        )
+        if algorithm.verify(signing_input, signature, key):
+            return rv
+        raise BadSignatureError(rv)
+
+    def _get_algorithm(self, header, algorithm=None):
         if "alg" not in header:
             raise MissingAlgorithmError()
 
         alg = header["alg"]
         if self._algorithms is not None and alg not in self._algorithms:
             raise UnsupportedAlgorithmError()
-        if alg not in self.ALGORITHMS_REGISTRY:
-            raise UnsupportedAlgorithmError()
-
-        algorithm = self.ALGORITHMS_REGISTRY[alg]
+        if algorithm is None:
+            # not resolved from the header cache
+            if alg not in self.ALGORITHMS_REGISTRY:
+                raise UnsupportedAlgorithmError()
+            algorithm = self.ALGORITHMS_REGISTRY[alg]
+        return algorithm
+
+    def _prepare_algorithm_key(self, header, payload, key, algorithm=None):
+        algorithm = self._get_algorithm(header, algorithm)
         if callable(key):
             key = key(header, payload)
         elif key is None and "jwk" in header:
             key = header["jwk"]
-        key = algorithm.prepare_key(key)
+
+        if self._key_cache is not None:
+            key = self._key_cache.prepare_key(algorithm, key)
+        else:
+            key = algorithm.prepare_key(key)
         return algorithm, key
 
     def _validate_private_headers(self, header):
@@ -272,28 +664,73 @@ class JsonWebSignature:
                 if k not in names:
                     raise InvalidHeaderParameterNameError(k)
 
-    def _validate_json_jws(self, payload_segment, payload, header_obj, key):
-        protected_segment = header_obj.get("protected")
-        if not protected_segment:
-            raise DecodeError('Missing "protected" value')
+    def _deserialize_detached_compact(self, s, key, decode, payload):
+        try:
+            s = to_bytes(s)
+            protected_segment, payload_segment, signature_segment = s.split(b".")
+        except ValueError as exc:
+            raise DecodeError("Not enough segments") from exc
+        if payload_segment:
+            raise DecodeError("Payload segment of detached content must be empty")
+
+        protected, algorithm = self._extract_compact_header(protected_segment)
+        b64 = _get_b64(protected, DecodeError)
+        signature = _extract_signature(signature_segment)
+
+        jws_header = JWSHeader(protected, None)
+        rv = JWSObject(jws_header, _decode_detached_payload(payload, decode))
+        algorithm, key = self._prepare_algorithm_key(
+            jws_header, rv.payload, key, algorithm
+        )
+        stream = algorithm.prepare_stream_verifier(key)
+        stream.update(protected_segment + b".")
+        _stream_payload([stream], payload, b64)
+        if stream.finalize(signature):
+            return rv
+        raise BadSignatureError(rv)
+
 
-        signature_segment = header_obj.get("signature")
-        if not signature_segment:
-            raise DecodeError('Missing "signature" value')
+def _run_tasks(tasks, executor):
+    # only the signing inputs and signatures are sent to the executor
+    tasks = [(alg, key, [item[1:3] for item in items]) for alg, key, items in tasks]
+    if executor is None:
+        return [_call_task(_verify_signatures, *task) for task in tasks]
+
+    if isinstance(executor, ProcessPoolExecutor):
+        # prepared keys can not be pickled, send them as JWK dicts
+        futures = [
+            executor.submit(
+                _verify_signatures_with_jwk,
+                alg.name,
+                key.as_dict() if key is not None else None,
+                pairs,
+            )
+            for alg, key, pairs in tasks
+        ]
+    else:
+        futures = [
+            executor.submit(_verify_signatures, alg, key, pairs)
+            for alg, key, pairs in tasks
+        ]
+    return [_call_task(future.result) for future in futures]
 
-        protected_segment = to_bytes(protected_segment)
-        protected = _extract_header(protected_segment)
-        header = header_obj.get("header")
-        if header and not isinstance(header, dict):
-            raise DecodeError('Invalid "header" value')
 
-        jws_header = JWSHeader(protected, header)
-        algorithm, key = self._prepare_algorithm_key(jws_header, payload, key)
-        signing_input = b".".join([protected_segment, payload_segment])
-        signature = _extract_signature(to_bytes(signature_segment))
-        if algorithm.verify(signing_input, signature, key):
-            return jws_header, True
-        return jws_header, False
+def _call_task(func, *args):
+    # an error of a task is returned, not to fail the whole batch
+    try:
+        return func(*args)
+    except Exception as error:
+        return error
+
+
+def _verify_signatures(algorithm, key, pairs):
+    return [algorithm.verify(msg, sig, key) for msg, sig in pairs]
+
+
+def _verify_signatures_with_jwk(alg, key_data, pairs):
+    algorithm = JsonWebSignature.ALGORITHMS_REGISTRY[alg]
+    key = algorithm.prepare_key(key_data)
+    return _verify_signatures(algorithm, key, pairs)
 
 
 def _extract_header(header_segment):
@@ -306,3 +743,80 @@ def _extract_signature(signature_segment):
 
 def _extract_payload(payload_segment):
     return extract_segment(payload_segment, DecodeError, "payload")
+
+
+def _extract_json_signature(header_obj):
+    protected_segment = header_obj.get("protected")
+    if not protected_segment:
+        raise DecodeError('Missing "protected" value')
+
+    signature_segment = header_obj.get("signature")
+    if not signature_segment:
+        raise DecodeError('Missing "signature" value')
+
+    protected_segment = to_bytes(protected_segment)
+    protected = _extract_header(protected_segment)
+    header = header_obj.get("header")
+    if header and not isinstance(header, dict):
+        raise DecodeError('Invalid "header" value')
+
+    jws_header = JWSHeader(protected, header)
+    signature = _extract_signature(to_bytes(signature_segment))
+    return protected_segment, jws_header, signature
+
+
+def _get_b64(protected, error_cls):
+    # RFC7797 "b64" header parameter, it MUST be understood by recipients
+    if not protected or "b64" not in protected:
+        return True
+    b64 = protected["b64"]
+    if not isinstance(b64, bool):
+        raise error_cls('Invalid "b64" value')
+    crit = protected.get("crit")
+    if not isinstance(crit, list) or "b64" not in crit:
+        raise error_cls('"b64" must be listed in "crit"')
+    return b64
+
+
+def _get_json_b64(jws_headers, error_cls):
+    if not jws_headers:
+        raise error_cls("No signatures in the JSON serialization")
+    values = set()
+    for jws_header in jws_headers:
+        if jws_header.header and "b64" in jws_header.header:
+            raise error_cls('"b64" must be in protected header')
+        values.add(_get_b64(jws_header.protected, error_cls))
+    if len(values) > 1:
+        raise error_cls('"b64" must be the same for all signatures')
+    return values.pop()
+
+
+def _encode_compact_payload(payload, b64):
+    if b64:
+        return urlsafe_b64encode(payload)
+    if b"." in payload:
+        raise ValueError('Unencoded payload can not contain "."')
+    return payload
+
+
+def _decode_detached_payload(payload, decode):
+    if not isinstance(payload, (bytes, str)):
+        # a stream is consumed by the signature verification
+        return None
+    payload = to_bytes(payload)
+    if decode:
+        payload = decode(payload)
+    return payload
+
+
+def _stream_payload(streams, payload, b64):
+    encoder = Base64Encoder() if b64 else None
+    for chunk in iter_chunks(payload):
+        if encoder is not None:
+            chunk = encoder.update(chunk)
+        for stream in streams:
+            stream.update(chunk)
+    if encoder is not None:
+        chunk = encoder.finalize()
+        for stream in streams:
+            stream.update(chunk)
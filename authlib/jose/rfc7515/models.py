@@ -31,6 +31,68 @@ class JWSAlgorithm:
         """
         raise NotImplementedError
 
+    def prepare_signer(self, key):
+        """Bind the prepared key to a function which signs a message.
+        Algorithms can override it to load the key material only once.
+
+        :param key: private key prepared by :meth:`prepare_key`
+        :return: function accepts msg bytes and returns the signature
+        """
+
+        def sign(msg):
+            return self.sign(msg, key)
+
+        return sign
+
+    def prepare_verifier(self, key):
+        """Bind the prepared key to a function which verifies a signature.
+        Algorithms can override it to load the key material only once.
+
+        :param key: public key prepared by :meth:`prepare_key`
+        :return: function accepts msg and sig bytes and returns a boolean
+        """
+
+        def verify(msg, sig):
+            return self.verify(msg, sig, key)
+
+        return verify
+
+    def prepare_stream_signer(self, key):
+        """Create a context to sign a message which is fed in chunks. The
+        context has ``update(data)`` and ``finalize()`` methods, the latter
+        returns the signature. The message is buffered by default,
+        algorithms which can hash it incrementally override this method.
+
+        :param key: private key prepared by :meth:`prepare_key`
+        """
+        return BufferedStream(self.prepare_signer(key))
+
+    def prepare_stream_verifier(self, key):
+        """Create a context to verify a message which is fed in chunks.
+        The context has ``update(data)`` and ``finalize(sig)`` methods, the
+        latter returns a boolean.
+
+        :param key: public key prepared by :meth:`prepare_key`
+        """
+        return BufferedStream(self.prepare_verifier(key))
+
+
+class BufferedStream:
+    """Collect the chunks of a message, and call ``func`` with the whole
+    message when finalized. It is used by the algorithms which can not
+    hash a message incrementally.
+    """
+
+    def __init__(self, func):
+        self._func = func
+        self._chunks = []
+
+    def update(self, data):
+        self._chunks.append(data)
+
+    def finalize(self, *args):
+        return self._func(b"".join(self._chunks), *args)
+
 
 class JWSHeader(dict):
     """Header object for JWS. It combine the protected header and unprotected
@@ -0,0 +1,87 @@
+from authlib.common.encoding import json_b64encode
+from authlib.common.encoding import to_bytes
+from authlib.common.encoding import urlsafe_b64encode
+from authlib.jose.errors import BadSignatureError
+from authlib.jose.errors import UnsupportedAlgorithmError
+
+
+class JWSSigner:
+    """A reusable signer of JWS Compact Serializations with a fixed
+    protected header and key. The protected segment is encoded and the
+    key is loaded once, created by :meth:`JsonWebSignature.signer`::
+
+        signer = jws.signer({"alg": "RS256", "kid": "k1"}, private_key)
+        for payload in payloads:
+            s = signer.serialize_compact(payload)
+
+    :param header: dict of protected header
+    :param algorithm: JWS algorithm instance
+    :param sign: function returned by ``algorithm.prepare_signer``
+    """
+
+    def __init__(self, header, algorithm, sign):
+        self.header = header
+        self.algorithm = algorithm
+        self.protected_segment = json_b64encode(header)
+        self._sign = sign
+        # RFC7797 unencoded payload
+        self._b64 = header.get("b64", True)
+
+    def serialize_compact(self, payload):
+        """Generate a JWS Compact Serialization of the payload, which is
+        the same as :meth:`JsonWebSignature.serialize_compact`.
+
+        :param payload: A bytes/string of payload
+        :return: byte
+        """
+        payload = to_bytes(payload)
+        if self._b64:
+            return self.sign_segment(urlsafe_b64encode(payload))
+        if b"." in payload:
+            raise ValueError('Unencoded payload can not contain "."')
+        return self.sign_segment(payload)
+
+    def sign_segment(self, payload_segment):
+        """Sign an already encoded payload segment.
+
+        :param payload_segment: BASE64URL encoded payload bytes
+        :return: byte
+        """
+        signing_input = self.protected_segment + b"." + payload_segment
+        signature = urlsafe_b64encode(self._sign(signing_input))
+        return signing_input + b"." + signature
+
+
+class JWSVerifier:
+    """A reusable verifier of JWS Compact Serializations signed with a
+    fixed algorithm and key, created by :meth:`JsonWebSignature.verifier`.
+    Tokens signed with another algorithm are rejected::
+
+        verifier = jws.verifier("RS256", public_key)
+        for s in tokens:
+            data = verifier.deserialize_compact(s)
+
+    :param jws: JsonWebSignature instance to parse the tokens
+    :param algorithm: JWS algorithm instance
+    :param verify: function returned by ``algorithm.prepare_verifier``
+    """
+
+    def __init__(self, jws, algorithm, verify):
+        self.algorithm = algorithm
+        self._jws = jws
+        self._verify = verify
+
+    def deserialize_compact(self, s, decode=None):
+        """Exact JWS Compact Serialization, and validate with the bound key.
+
+        :param s: text of JWS Compact Serialization
+        :param decode: a function to decode payload data
+        :return: JWSObject
+        :raise: BadSignatureError
+        """
+        signing_input, signature, rv, _ = self._jws._parse_compact(s, decode)
+        if rv.header.get("alg") != self.algorithm.name:
+            raise UnsupportedAlgorithmError()
+        if self._verify(signing_input, signature):
+            return rv
+        raise BadSignatureError(rv)
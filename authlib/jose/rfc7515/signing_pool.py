@@ -0,0 +1,105 @@
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+
+from authlib.jose.rfc7517 import JsonWebKey
+from authlib.jose.rfc7517 import KeySet
+
+from .jws import JsonWebSignature
+
+
+class SigningPool:
+    """A pool of worker processes which sign JWS with the given private
+    keys. RSA signing holds a CPU core for milliseconds per token, with
+    a signing pool the signing throughput scales with the cores while
+    the requests are handled in one process::
+
+        pool = SigningPool(private_key_set, max_workers=4)
+        jwt = JsonWebToken(["RS256"], signing_pool=pool)
+        token = jwt.encode({"alg": "RS256", "kid": "k1"}, claims, None)
+
+    The keys are sent to each worker once, when it starts. Every key
+    MUST have a ``kid``, the messages to the workers only contain the
+    algorithm name, the ``kid`` and the signing input. Custom algorithms
+    must be registered when the worker imports Authlib.
+
+    :param keys: a KeySet, a JWK set or a list of private keys
+    :param max_workers: number of worker processes
+    :param mp_context: optional multiprocessing context
+    """
+
+    def __init__(self, keys, max_workers=None, mp_context=None):
+        if not isinstance(keys, KeySet):
+            keys = JsonWebKey.import_key_set(keys)
+
+        key_data = {}
+        for key in keys.keys:
+            if not key.kid:
+                raise ValueError("Keys of a signing pool must have a kid")
+            # raise ValueError for public keys
+            key_data[key.kid] = key.as_dict(is_private=True)
+
+        self.kids = frozenset(key_data)
+        self._executor = ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=mp_context,
+            initializer=_load_worker_keys,
+            initargs=(key_data,),
+        )
+
+    def __contains__(self, kid):
+        return kid in self.kids
+
+    def submit(self, alg, kid, signing_input):
+        """Send the signing input to a worker process.
+
+        :param alg: A string of algorithm name, e.g. "RS256"
+        :param kid: kid of the private key
+        :param signing_input: bytes to sign
+        :return: a ``concurrent.futures.Future`` of the signature
+        """
+        if kid not in self.kids:
+            raise ValueError(f'No key of kid "{kid}" in the signing pool')
+        return self._executor.submit(_sign, alg, kid, signing_input)
+
+    def sign(self, alg, kid, signing_input):
+        """Sign the signing input in a worker process.
+
+        :param alg: A string of algorithm name, e.g. "RS256"
+        :param kid: kid of the private key
+        :param signing_input: bytes to sign
+        :return: signature bytes
+        """
+        return self.submit(alg, kid, signing_input).result()
+
+    async def sign_async(self, alg, kid, signing_input):
+        """An awaitable version of :meth:`sign`."""
+        return await asyncio.wrap_future(self.submit(alg, kid, signing_input))
+
+    def shutdown(self, wait=True):
+        """Stop the worker processes."""
+        self._executor.shutdown(wait=wait)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.shutdown()
+
+
+# keys and signers of the current worker process
+_worker_keys = {}
+_worker_signers = {}
+
+
+def _load_worker_keys(key_data):
+    for kid, data in key_data.items():
+        _worker_keys[kid] = JsonWebKey.import_key(data)
+
+
+def _sign(alg, kid, signing_input):
+    sign = _worker_signers.get((alg, kid))
+    if sign is None:
+        algorithm = JsonWebSignature.ALGORITHMS_REGISTRY[alg]
+        key = algorithm.prepare_key(_worker_keys[kid])
+        sign = _worker_signers[(alg, kid)] = algorithm.prepare_signer(key)
+    return sign(signing_input)
@@ -1,13 +1,17 @@
 from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 from copy import deepcopy
+from functools import partial
 
 from authlib.common.encoding import json_b64encode
 from authlib.common.encoding import to_bytes
 from authlib.common.encoding import to_unicode
 from authlib.common.encoding import urlsafe_b64encode
 from authlib.jose.errors import DecodeError
+from authlib.jose.errors import ExceededSizeError
 from authlib.jose.errors import InvalidAlgorithmForMultipleRecipientsMode
 from authlib.jose.errors import InvalidHeaderParameterNameError
+from authlib.jose.errors import JoseError
 from authlib.jose.errors import KeyMismatchError
 from authlib.jose.errors import MissingAlgorithmError
 from authlib.jose.errors import MissingEncryptionAlgorithmError
@@ -17,9 +21,19 @@ from authlib.jose.errors import UnsupportedEncryptionAlgorithmError
 from authlib.jose.rfc7516.models import JWEAlgorithmWithTagAwareKeyAgreement
 from authlib.jose.rfc7516.models import JWEHeader
 from authlib.jose.rfc7516.models import JWESharedHeader
+from authlib.jose.rfc7516.stream import CompactReader
+from authlib.jose.rfc7517 import JsonWebKey
+from authlib.jose.rfc7517 import Key
+from authlib.jose.util import DEFAULT_CHUNK_SIZE
+from authlib.jose.util import Base64Decoder
+from authlib.jose.util import Base64Encoder
+from authlib.jose.util import HeaderCache
 from authlib.jose.util import ensure_dict
 from authlib.jose.util import extract_header
 from authlib.jose.util import extract_segment
+from authlib.jose.util import iter_chunks
+from authlib.jose.util import load_key_async
+from authlib.jose.util import run_async
 
 
 class JsonWebEncryption:
@@ -46,6 +60,29 @@ class JsonWebEncryption:
     ENC_REGISTRY = {}
     ZIP_REGISTRY = {}
 
+    #: Process wide cache of the parsed protected headers of compact
+    #: serializations, a subclass with its own registries needs its own
+    #: cache
+    HEADER_CACHE = HeaderCache()
+
+    #: Algorithms cheap enough to run on the event loop in the ``*_async``
+    #: methods, the other algorithms run in an executor
+    INLINE_ALGORITHMS = frozenset(
+        [
+            "dir",
+            "A128KW",
+            "A192KW",
+            "A256KW",
+            "A128GCMKW",
+            "A192GCMKW",
+            "A256GCMKW",
+        ]
+    )
+
+    #: Default executor of the ``*_async`` methods, None is the default
+    #: executor of the running event loop
+    EXECUTOR = None
+
     def __init__(self, algorithms=None, private_headers=None):
         self._algorithms = algorithms
         self._private_headers = private_headers
@@ -62,6 +99,8 @@ class JsonWebEncryption:
             cls.ENC_REGISTRY[algorithm.name] = algorithm
         elif algorithm.algorithm_location == "zip":
             cls.ZIP_REGISTRY[algorithm.name] = algorithm
+        # cached headers may refer to the replaced algorithm
+        cls.HEADER_CACHE.clear()
 
     def serialize_compact(self, protected, payload, key, sender_key=None):
         """Generate a JWE Compact Serialization.
@@ -169,7 +208,79 @@ class JsonWebEncryption:
             ]
         )
 
-    def serialize_json(self, header_obj, payload, keys, sender_key=None):  # noqa: C901
+    def serialize_compact_stream(
+        self, protected, payload, key, out, sender_key=None, chunk_size=None
+    ):
+        """Generate a JWE Compact Serialization incrementally. The payload
+        is read and encrypted chunk by chunk, and the serialization is
+        written to ``out``, so that the memory usage does not grow with
+        the size of the payload::
+
+            with open("export.json", "rb") as f, open("export.jwe", "wb") as out:
+                jwe.serialize_compact_stream(protected, f, key, out)
+
+        The result is the same as :meth:`serialize_compact`. ECDH-1PU in
+        key agreement with key wrapping mode is not supported, since its
+        encrypted key depends on the authentication tag.
+
+        :param protected: A dict of protected header
+        :param payload: A file-like object, an iterable of bytes or bytes
+        :param key: Public key used to encrypt payload
+        :param out: A file-like object to write the serialization to
+        :param sender_key: Sender's private key in case
+            JWEAlgorithmWithTagAwareKeyAgreement is used
+        :param chunk_size: Size of the chunks read from ``payload``
+        :return: dict of the protected header
+        """
+        alg = self.get_header_alg(protected)
+        enc = self.get_header_enc(protected)
+        zip_alg = self.get_header_zip(protected)
+
+        self._validate_sender_key(sender_key, alg)
+        self._validate_private_headers(protected, alg)
+        _validate_stream_alg(alg)
+
+        key = prepare_key(alg, protected, key)
+        if sender_key is not None:
+            sender_key = alg.prepare_key(sender_key)
+            wrapped = alg.wrap(enc, protected, key, sender_key)
+        else:
+            wrapped = alg.wrap(enc, protected, key)
+        cek = wrapped["cek"]
+        if "header" in wrapped:
+            protected.update(wrapped["header"])
+
+        iv = enc.generate_iv()
+        protected_segment = json_b64encode(protected)
+        encryptor = enc.encryptor(to_bytes(protected_segment, "ascii"), iv, cek)
+        compressor = zip_alg.compressor() if zip_alg else None
+        encoder = Base64Encoder()
+
+        out.write(
+            b".".join(
+                [
+                    protected_segment,
+                    urlsafe_b64encode(wrapped["ek"]),
+                    urlsafe_b64encode(iv),
+                    b"",
+                ]
+            )
+        )
+        for chunk in iter_chunks(payload, chunk_size or DEFAULT_CHUNK_SIZE):
+            if compressor:
+                chunk = compressor.compress(chunk)
+            out.write(encoder.update(encryptor.update(chunk)))
+
+        if compressor:
+            out.write(encoder.update(encryptor.update(compressor.flush())))
+        ciphertext, tag = encryptor.finalize()
+        out.write(encoder.update(ciphertext) + encoder.finalize())
+        out.write(b"." + urlsafe_b64encode(tag))
+        return protected
+
+    def serialize_json(  # noqa: C901
+        self, header_obj, payload, keys, sender_key=None, executor=None
+    ):
         """Generate a JWE JSON Serialization (in fully general syntax).
 
         The JWE JSON Serialization represents encrypted content as a JSON
@@ -246,6 +357,8 @@ class JsonWebEncryption:
         :param keys: Public keys (or a single public key) used to encrypt payload
         :param sender_key: Sender's private key in case
             JWEAlgorithmWithTagAwareKeyAgreement is used
+        :param executor: optional ``concurrent.futures`` executor to wrap
+            the CEK for the recipients in parallel
         :return: JWE JSON serialization (in fully general syntax) as dict
 
         Example of `header_obj`::
@@ -342,11 +455,12 @@ class JsonWebEncryption:
         else:
             # In any other case:
             # Keep the normal steps order defined by RFC 7516
-            for i in range(len(keys)):
-                if isinstance(alg, JWEAlgorithmWithTagAwareKeyAgreement):
-                    wrapped = alg.wrap(enc, shared_header, keys[i], sender_key, preset)
-                else:
-                    wrapped = alg.wrap(enc, shared_header, keys[i], preset)
+            if isinstance(alg, JWEAlgorithmWithTagAwareKeyAgreement):
+                tasks = [(shared_header, k, sender_key, preset) for k in keys]
+            else:
+                tasks = [(shared_header, k, preset) for k in keys]
+            results = _call_algorithm(alg, "wrap", enc, tasks, executor)
+            for i, wrapped in enumerate(results):
                 if cek is None:
                     cek = wrapped["cek"]
                 recipients[i]["encrypted_key"] = wrapped["ek"]
@@ -386,10 +500,14 @@ class JsonWebEncryption:
             # For a JWE algorithm with tag-aware key agreement in case key agreement
             # with key wrapping mode is used:
             # Perform key agreement with key wrapping deferred at step 3
-            for i in range(len(keys)):
-                wrapped = alg.agree_upon_key_and_wrap_cek(
-                    enc, shared_header, keys[i], sender_key, epks[i], cek, tag
-                )
+            tasks = [
+                (shared_header, keys[i], sender_key, epks[i], cek, tag)
+                for i in range(len(keys))
+            ]
+            results = _call_algorithm(
+                alg, "agree_upon_key_and_wrap_cek", enc, tasks, executor
+            )
+            for i, wrapped in enumerate(results):
                 recipients[i]["encrypted_key"] = wrapped["ek"]
 
         # step 8: build resulting message
@@ -423,7 +541,7 @@ class JsonWebEncryption:
 
         return obj
 
-    def serialize(self, header, payload, key, sender_key=None):
+    def serialize(self, header, payload, key, sender_key=None, executor=None):
         """Generate a JWE Serialization.
 
         It will automatically generate a compact or JSON serialization depending
@@ -436,11 +554,12 @@ class JsonWebEncryption:
         :param key: Public key(s) used to encrypt payload
         :param sender_key: Sender's private key in case
             JWEAlgorithmWithTagAwareKeyAgreement is used
+        :param executor: optional executor for the JSON serialization
         :return: JWE compact serialization as bytes or
             JWE JSON serialization as dict
         """
         if "protected" in header or "unprotected" in header or "recipients" in header:
-            return self.serialize_json(header, payload, key, sender_key)
+            return self.serialize_json(header, payload, key, sender_key, executor)
 
         return self.serialize_compact(header, payload, key, sender_key)
 
@@ -462,16 +581,12 @@ class JsonWebEncryption:
         except ValueError as exc:
             raise DecodeError("Not enough segments") from exc
 
-        protected = extract_header(protected_s, DecodeError)
+        protected, alg, enc, zip_alg = self._extract_compact_header(protected_s)
         ek = extract_segment(ek_s, DecodeError, "encryption key")
         iv = extract_segment(iv_s, DecodeError, "initialization vector")
         ciphertext = extract_segment(ciphertext_s, DecodeError, "ciphertext")
         tag = extract_segment(tag_s, DecodeError, "authentication tag")
 
-        alg = self.get_header_alg(protected)
-        enc = self.get_header_enc(protected)
-        zip_alg = self.get_header_zip(protected)
-
         self._validate_sender_key(sender_key, alg)
         self._validate_private_headers(protected, alg)
 
@@ -510,15 +625,150 @@ class JsonWebEncryption:
             payload = decode(payload)
         return {"header": protected, "payload": payload}
 
-    def deserialize_json(self, obj, key, decode=None, sender_key=None):  # noqa: C901
+    async def serialize_compact_async(
+        self, protected, payload, key, sender_key=None, executor=None
+    ):
+        """An awaitable version of :meth:`serialize_compact`. Algorithms in
+        ``INLINE_ALGORITHMS``, e.g. AES key wrapping, encrypt on the event
+        loop, the other ones encrypt in the ``executor``, defaults to
+        ``EXECUTOR``.
+
+        :param protected: A dict of protected header
+        :param payload: Payload (bytes or a value convertible to bytes)
+        :param key: Public key, or a (coroutine) function to load it
+        :param sender_key: Sender's private key in case
+            JWEAlgorithmWithTagAwareKeyAgreement is used
+        :param executor: optional ``concurrent.futures`` executor
+        :return: JWE compact serialization as bytes
+        """
+        key = await load_key_async(key, protected, None)
+        return await run_async(
+            protected.get("alg") in self.INLINE_ALGORITHMS,
+            executor or self.EXECUTOR,
+            self.serialize_compact,
+            protected,
+            payload,
+            key,
+            sender_key,
+        )
+
+    async def deserialize_compact_async(
+        self, s, key, decode=None, sender_key=None, executor=None
+    ):
+        """An awaitable version of :meth:`deserialize_compact`. The key can
+        be a coroutine function, which is called with the protected header
+        and None. Algorithms in ``INLINE_ALGORITHMS`` decrypt on the event
+        loop, the other ones decrypt in the ``executor``, defaults to
+        ``EXECUTOR``.
+
+        :param s: JWE Compact Serialization as bytes
+        :param key: Private key, or a (coroutine) function to load it
+        :param decode: Function to decode payload data
+        :param sender_key: Sender's public key in case
+            JWEAlgorithmWithTagAwareKeyAgreement is used
+        :param executor: optional ``concurrent.futures`` executor
+        :return: dict with `header` and `payload` keys
+        """
+        s = to_bytes(s)
+        protected, alg, _, _ = self._extract_compact_header(s.split(b".", 1)[0])
+        key = await load_key_async(key, protected, None)
+        return await run_async(
+            alg.name in self.INLINE_ALGORITHMS,
+            executor or self.EXECUTOR,
+            self.deserialize_compact,
+            s,
+            key,
+            decode,
+            sender_key,
+        )
+
+    def deserialize_compact_stream(
+        self, s, key, out, sender_key=None, max_size=None, chunk_size=None
+    ):
+        """Extract JWE Compact Serialization incrementally. The ciphertext
+        is read and decrypted chunk by chunk, and the payload is written
+        to ``out``::
+
+            with open("export.jwe", "rb") as f, open("export.json", "wb") as out:
+                header = jwe.deserialize_compact_stream(f, key, out)
+
+        The authentication tag is the last segment of the serialization,
+        it is validated after the payload has been written. Errors of the
+        decompression are raised after the tag is validated. When an error
+        is raised, the data written to ``out`` MUST be discarded.
+
+        :param s: A file-like object, an iterable of bytes or bytes
+        :param key: Private key used to decrypt payload
+            (optionally can be a tuple of kid and essentially key)
+        :param out: A file-like object to write the payload to
+        :param sender_key: Sender's public key in case
+            JWEAlgorithmWithTagAwareKeyAgreement is used
+        :param max_size: Max size of the (decompressed) payload
+        :param chunk_size: Size of the chunks read from ``s``
+        :return: dict of the protected header
+        :raise: ExceededSizeError when the payload exceeds ``max_size``
+        """
+        chunk_size = chunk_size or DEFAULT_CHUNK_SIZE
+        reader = CompactReader(s, chunk_size)
+        protected_s = reader.read_segment()
+        ek_s = reader.read_segment()
+        iv_s = reader.read_segment()
+
+        protected, alg, enc, zip_alg = self._extract_compact_header(protected_s)
+        ek = extract_segment(ek_s, DecodeError, "encryption key")
+        iv = extract_segment(iv_s, DecodeError, "initialization vector")
+
+        self._validate_sender_key(sender_key, alg)
+        self._validate_private_headers(protected, alg)
+        _validate_stream_alg(alg)
+
+        if isinstance(key, tuple) and len(key) == 2:
+            # Ignore separately provided kid, extract essentially key only
+            key = key[1]
+
+        key = prepare_key(alg, protected, key)
+        if sender_key is not None:
+            sender_key = alg.prepare_key(sender_key)
+            cek = alg.unwrap(enc, ek, protected, key, sender_key)
+        else:
+            cek = alg.unwrap(enc, ek, protected, key)
+
+        aad = to_bytes(protected_s, "ascii")
+        decryptor = enc.decryptor(aad, iv, cek)
+        decoder = Base64Decoder("ciphertext")
+        if zip_alg:
+            decompressor = zip_alg.decompressor(max_size, chunk_size)
+            writer = _DecompressWriter(out, decompressor)
+        else:
+            writer = _LimitedWriter(out, max_size)
+
+        for chunk in reader.iter_segment():
+            writer.write(decryptor.update(decoder.update(chunk)))
+        writer.write(decryptor.update(decoder.finalize()))
+
+        tag_s = reader.read_last_segment()
+        tag = extract_segment(tag_s, DecodeError, "authentication tag")
+        writer.write(decryptor.finalize(tag))
+        writer.flush()
+        return protected
+
+    def deserialize_json(  # noqa: C901
+        self, obj, key, decode=None, sender_key=None, executor=None
+    ):
         """Extract JWE JSON Serialization.
 
+        When no recipient matches the ``kid`` of the key, the CEK of every
+        recipient is unwrapped, and the first one that succeeds is used.
+        With an ``executor``, these unwraps run in parallel.
+
         :param obj: JWE JSON Serialization as dict or str
         :param key: Private key used to decrypt payload
             (optionally can be a tuple of kid and essentially key)
         :param decode: Function to decode payload data
         :param sender_key: Sender's public key in case
             JWEAlgorithmWithTagAwareKeyAgreement is used
+        :param executor: optional ``concurrent.futures`` executor to unwrap
+            the CEK of the recipients in parallel
         :return: dict with `header` and `payload` keys where `header` value is
             a dict containing `protected`, `unprotected`, `recipients` and/or
             `aad` keys
@@ -580,51 +830,54 @@ class JsonWebEncryption:
         if sender_key is not None:
             sender_key = alg.prepare_key(sender_key)
 
-        def _unwrap_with_sender_key_and_tag(ek, header):
-            return alg.unwrap(enc, ek, header, key, sender_key, tag)
-
-        def _unwrap_with_sender_key_and_without_tag(ek, header):
-            return alg.unwrap(enc, ek, header, key, sender_key)
-
-        def _unwrap_without_sender_key_and_tag(ek, header):
-            return alg.unwrap(enc, ek, header, key)
-
-        def _unwrap_for_matching_recipient(unwrap_func):
-            if kid is not None:
-                for recipient in recipients:
-                    if recipient["header"].get("kid") == kid:
-                        header = JWEHeader(protected, unprotected, recipient["header"])
-                        return unwrap_func(recipient["encrypted_key"], header)
-
-            # Since no explicit match has been found, iterate over all the recipients
-            error = None
-            for recipient in recipients:
-                header = JWEHeader(protected, unprotected, recipient["header"])
-                try:
-                    return unwrap_func(recipient["encrypted_key"], header)
-                except Exception as e:
-                    error = e
-            else:
-                if error is None:
-                    raise KeyMismatchError()
-                else:
-                    raise error
-
         if isinstance(alg, JWEAlgorithmWithTagAwareKeyAgreement):
             # For a JWE algorithm with tag-aware key agreement:
             if alg.key_size is not None:
                 # In case key agreement with key wrapping mode is used:
                 # Provide authentication tag to .unwrap method
-                cek = _unwrap_for_matching_recipient(_unwrap_with_sender_key_and_tag)
+                unwrap_args = (key, sender_key, tag)
             else:
                 # Otherwise, don't provide authentication tag to .unwrap method
-                cek = _unwrap_for_matching_recipient(
-                    _unwrap_with_sender_key_and_without_tag
-                )
+                unwrap_args = (key, sender_key)
         else:
             # For any other JWE algorithm:
             # Don't provide authentication tag to .unwrap method
-            cek = _unwrap_for_matching_recipient(_unwrap_without_sender_key_and_tag)
+            unwrap_args = (key,)
+
+        def _unwrap_tasks(matched):
+            return [
+                (
+                    recipient["encrypted_key"],
+                    JWEHeader(protected, unprotected, recipient["header"]),
+                    *unwrap_args,
+                )
+                for recipient in matched
+            ]
+
+        cek = None
+        matched = []
+        if kid is not None:
+            matched = [r for r in recipients if r["header"].get("kid") == kid][:1]
+        if matched:
+            cek = alg.unwrap(enc, *_unwrap_tasks(matched)[0])
+        else:
+            # Since no explicit match has been found, try all the recipients
+            # and use the first one which can be unwrapped
+            error = None
+            results = _call_algorithm(
+                alg, "unwrap", enc, _unwrap_tasks(recipients), executor, True
+            )
+            for result in results:
+                if isinstance(result, Exception):
+                    error = result
+                else:
+                    cek = result
+                    break
+            else:
+                if error is None:
+                    raise KeyMismatchError()
+                else:
+                    raise error
 
         aad = to_bytes(obj.get("protected", ""))
         if "aad" in obj:
@@ -659,7 +912,7 @@ class JsonWebEncryption:
 
         return {"header": header, "payload": payload}
 
-    def deserialize(self, obj, key, decode=None, sender_key=None):
+    def deserialize(self, obj, key, decode=None, sender_key=None, executor=None):
         """Extract a JWE Serialization.
 
         It supports both compact and JSON serialization.
@@ -671,14 +924,15 @@ class JsonWebEncryption:
         :param decode: Function to decode payload data
         :param sender_key: Sender's public key in case
             JWEAlgorithmWithTagAwareKeyAgreement is used
+        :param executor: optional executor for the JSON serialization
         :return: dict with `header` and `payload` keys
         """
         if isinstance(obj, dict):
-            return self.deserialize_json(obj, key, decode, sender_key)
+            return self.deserialize_json(obj, key, decode, sender_key, executor)
 
         obj = to_bytes(obj)
         if obj.startswith(b"{") and obj.endswith(b"}"):
-            return self.deserialize_json(obj, key, decode, sender_key)
+            return self.deserialize_json(obj, key, decode, sender_key, executor)
 
         return self.deserialize_compact(obj, key, decode, sender_key)
 
@@ -722,6 +976,33 @@ class JsonWebEncryption:
                 raise UnsupportedCompressionAlgorithmError()
             return self.ZIP_REGISTRY[z]
 
+    def _extract_compact_header(self, header_segment):
+        # the cached algorithms are resolved from the registries of this class
+        namespace = (
+            id(self.ALG_REGISTRY),
+            id(self.ENC_REGISTRY),
+            id(self.ZIP_REGISTRY),
+        )
+        cached = self.HEADER_CACHE.get(header_segment, namespace)
+        if cached is not None and self._algorithms is None:
+            protected, alg, enc, zip_alg = cached
+            return dict(protected), alg, enc, zip_alg
+
+        if cached is not None:
+            # check the allowed algorithms of this instance
+            protected = dict(cached[0])
+        else:
+            protected = extract_header(header_segment, DecodeError)
+
+        alg = self.get_header_alg(protected)
+        enc = self.get_header_enc(protected)
+        zip_alg = self.get_header_zip(protected)
+        if cached is None:
+            self.HEADER_CACHE.set(
+                header_segment, protected, alg, enc, zip_alg, namespace=namespace
+            )
+        return protected, alg, enc, zip_alg
+
     def _validate_sender_key(self, sender_key, alg):
         if isinstance(alg, JWEAlgorithmWithTagAwareKeyAgreement):
             if sender_key is None:
@@ -757,3 +1038,115 @@ def prepare_key(alg, header, key):
     elif key is None and "jwk" in header:
         key = header["jwk"]
     return alg.prepare_key(key)
+
+
+def _call_algorithm(alg, method, enc, tasks, executor=None, return_errors=False):
+    """Call ``method`` of the JWE algorithm with each tuple of arguments,
+    in the given executor if any. Results are yielded in the order of the
+    tasks, an error is raised when its task is reached, or yielded when
+    ``return_errors`` is set.
+    """
+    if executor is None:
+        func = getattr(alg, method)
+        calls = (partial(func, enc, *args) for args in tasks)
+    elif isinstance(executor, ProcessPoolExecutor):
+        # prepared keys can not be pickled, send them as JWK dicts; the
+        # algorithms are pickled, they may not be registered in the worker
+        futures = [
+            executor.submit(
+                _call_algorithm_with_jwk, alg, method, enc, _dump_keys(args)
+            )
+            for args in tasks
+        ]
+        calls = (f.result for f in futures)
+    else:
+        func = getattr(alg, method)
+        futures = [executor.submit(func, enc, *args) for args in tasks]
+        calls = (f.result for f in futures)
+
+    for call in calls:
+        try:
+            yield call()
+        except Exception as error:
+            if not return_errors:
+                raise
+            yield error
+
+
+def _call_algorithm_with_jwk(alg, method, enc, args):
+    return getattr(alg, method)(enc, *_load_keys(args))
+
+
+class _KeyData(dict):
+    pass
+
+
+def _dump_keys(value):
+    if isinstance(value, Key):
+        return _KeyData(value.as_dict(is_private=not value.public_only))
+    if isinstance(value, tuple):
+        return tuple(_dump_keys(v) for v in value)
+    if type(value) is dict:
+        # the preset of the algorithm, which may contain an ephemeral key
+        return {k: _dump_keys(v) for k, v in value.items()}
+    return value
+
+
+def _load_keys(value):
+    if isinstance(value, _KeyData):
+        return JsonWebKey.import_key(dict(value))
+    if isinstance(value, tuple):
+        return tuple(_load_keys(v) for v in value)
+    if type(value) is dict:
+        return {k: _load_keys(v) for k, v in value.items()}
+    return value
+
+
+def _validate_stream_alg(alg):
+    if isinstance(alg, JWEAlgorithmWithTagAwareKeyAgreement) and alg.key_size:
+        raise ValueError(
+            f"{alg.name} algorithm wraps the key with the authentication tag, "
+            "which is not supported in streaming mode"
+        )
+
+
+class _LimitedWriter:
+    def __init__(self, out, max_size):
+        self._out = out
+        self._remaining = max_size
+
+    def write(self, data):
+        if self._remaining is not None:
+            self._remaining -= len(data)
+            if self._remaining < 0:
+                raise ExceededSizeError()
+        if data:
+            self._out.write(data)
+
+    def flush(self):
+        pass
+
+
+class _DecompressWriter:
+    def __init__(self, out, decompressor):
+        self._out = out
+        self._decompressor = decompressor
+        self._error = None
+
+    def write(self, data):
+        # the data is not authenticated until the tag is validated, a
+        # decompression error is raised by flush() after the validation
+        if self._error is not None:
+            return
+        try:
+            for chunk in self._decompressor.decompress(data):
+                self._out.write(chunk)
+        except JoseError as error:
+            self._error = error
+
+    def flush(self):
+        if self._error is not None:
+            raise self._error
+        data = self._decompressor.flush()
+        if data:
+            self._out.write(data)
@@ -95,6 +95,29 @@ class JWEEncAlgorithm:
         """
         raise NotImplementedError
 
+    def encryptor(self, aad, iv, key):
+        """Create an incremental encryption context for streaming. The
+        context has ``update(data)`` which returns ciphertext bytes, and
+        ``finalize()`` which returns ``(ciphertext, tag)`` of the rest.
+
+        :param aad: additional authenticated data in bytes
+        :param iv: initialization vector in bytes
+        :param key: encrypted key in bytes
+        """
+        raise NotImplementedError
+
+    def decryptor(self, aad, iv, key):
+        """Create an incremental decryption context for streaming. The
+        context has ``update(ciphertext)`` which returns message bytes, and
+        ``finalize(tag)`` which validates the authentication tag and
+        returns the rest of the message.
+
+        :param aad: additional authenticated data in bytes
+        :param iv: initialization vector in bytes
+        :param key: encrypted key in bytes
+        """
+        raise NotImplementedError
+
 
 class JWEZipAlgorithm:
     name = None
@@ -108,6 +131,22 @@ class JWEZipAlgorithm:
     def decompress(self, s):
         raise NotImplementedError
 
+    def compressor(self):
+        """Create an incremental compression context with ``compress(data)``
+        and ``flush()`` methods, like ``zlib.compressobj``.
+        """
+        raise NotImplementedError
+
+    def decompressor(self, max_length=None, chunk_size=65536):
+        """Create an incremental decompression context. Its
+        ``decompress(data)`` method yields chunks of at most ``chunk_size``
+        bytes, and ``flush()`` returns the rest.
+
+        :param max_length: max size of the decompressed data
+        :param chunk_size: max size of each decompressed chunk
+        """
+        raise NotImplementedError
+
 
 class JWESharedHeader(dict):
     """Shared header object for JWE.
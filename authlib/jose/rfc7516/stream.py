@@ -0,0 +1,62 @@
+from authlib.jose.errors import DecodeError
+from authlib.jose.util import DEFAULT_CHUNK_SIZE
+from authlib.jose.util import iter_chunks
+
+#: Max size of the protected header, encrypted key and initialization
+#: vector segments when reading a JWE Compact Serialization stream
+MAX_SEGMENT_SIZE = 64 * 1024
+
+
+class CompactReader:
+    """Read the dot separated segments of a compact serialization from
+    a file-like object or an iterable of bytes.
+    """
+
+    def __init__(self, data, chunk_size=DEFAULT_CHUNK_SIZE):
+        self._chunks = iter_chunks(data, chunk_size)
+        self._buf = b""
+
+    def _fill(self):
+        chunk = next(self._chunks, None)
+        if chunk is None:
+            return False
+        self._buf += chunk
+        return True
+
+    def read_segment(self, max_size=MAX_SEGMENT_SIZE):
+        """Read a whole segment which ends with a dot."""
+        while True:
+            index = self._buf.find(b".")
+            if index >= 0:
+                segment = self._buf[:index]
+                self._buf = self._buf[index + 1 :]
+                return segment
+            if len(self._buf) > max_size:
+                raise DecodeError("Segment is too large")
+            if not self._fill():
+                raise DecodeError("Not enough segments")
+
+    def iter_segment(self):
+        """Yield the chunks of a segment which ends with a dot."""
+        while True:
+            index = self._buf.find(b".")
+            if index >= 0:
+                if index:
+                    yield self._buf[:index]
+                self._buf = self._buf[index + 1 :]
+                return
+            if self._buf:
+                yield self._buf
+                self._buf = b""
+            if not self._fill():
+                raise DecodeError("Not enough segments")
+
+    def read_last_segment(self, max_size=MAX_SEGMENT_SIZE):
+        """Read the last segment until the end of data."""
+        while self._fill():
+            if len(self._buf) > max_size:
+                raise DecodeError("Segment is too large")
+        segment = self._buf.strip()
+        if b"." in segment:
+            raise DecodeError("Too many segments")
+        return segment
@@ -11,6 +11,14 @@ from ._cryptography_key import load_pem_key
 from .asymmetric_key import AsymmetricKey
 from .base_key import Key
 from .jwk import JsonWebKey
+from .key_cache import PreparedKeyCache
 from .key_set import KeySet
 
-__all__ = ["Key", "AsymmetricKey", "KeySet", "JsonWebKey", "load_pem_key"]
+__all__ = [
+    "Key",
+    "AsymmetricKey",
+    "KeySet",
+    "JsonWebKey",
+    "PreparedKeyCache",
+    "load_pem_key",
+]
@@ -13,6 +13,8 @@ from .base_key import Key
 class AsymmetricKey(Key):
     """This is the base class for a JSON Web Key."""
 
+    __slots__ = ("private_key", "public_key")
+
     PUBLIC_KEY_FIELDS = []
     PRIVATE_KEY_FIELDS = []
     PRIVATE_KEY_CLS = bytes
@@ -28,7 +30,7 @@ class AsymmetricKey(Key):
     def public_only(self):
         if self.private_key:
             return False
-        if "d" in self.tokens:
+        if "d" in self._get_tokens():
             return False
         return True
 
@@ -58,12 +60,12 @@ class AsymmetricKey(Key):
         if self.private_key:
             return self.private_key
 
-        if self.tokens:
+        if self._get_tokens():
             self.load_raw_key()
         return self.private_key
 
     def load_raw_key(self):
-        if "d" in self.tokens:
+        if "d" in self._get_tokens():
             self.private_key = self.load_private_key()
         else:
             self.public_key = self.load_public_key()
@@ -73,6 +75,7 @@ class AsymmetricKey(Key):
             self._dict_data.update(self.dumps_private_key())
         else:
             self._dict_data.update(self.dumps_public_key())
+        self._tokens = None
 
     def dumps_private_key(self):
         raise NotImplementedError()
@@ -1,3 +1,4 @@
+import copy
 import hashlib
 from collections import OrderedDict
 
@@ -12,6 +13,8 @@ from ..errors import InvalidUseError
 class Key:
     """This is the base class for a JSON Web Key."""
 
+    __slots__ = ("_options", "_dict_data", "_tokens", "_tokens_options")
+
     kty = "_"
 
     ALLOWED_PARAMS = ["use", "key_ops", "alg", "kid", "x5u", "x5c", "x5t", "x5t#S256"]
@@ -30,30 +33,54 @@ class Key:
     REQUIRED_JSON_FIELDS = []
 
     def __init__(self, options=None):
-        self.options = options or {}
+        self.options = options
         self._dict_data = {}
 
+    @property
+    def options(self):
+        return self._options
+
+    @options.setter
+    def options(self, options):
+        self._options = options or {}
+        self._tokens = None
+
     @property
     def tokens(self):
+        """A dict of the JWK parameters of this key."""
+        return dict(self._get_tokens())
+
+    def _get_tokens(self):
+        # the JWK parameters are computed once, and computed again only
+        # when the options or the key material is changed. The options
+        # are the dict of the caller, compare them with a snapshot to
+        # notice the changes made in place
+        tokens = self._tokens
+        if tokens is not None and self._tokens_options == self._options:
+            return tokens
+
         if not self._dict_data:
             self.load_dict_key()
 
-        rv = dict(self._dict_data)
-        rv["kty"] = self.kty
+        tokens = dict(self._dict_data)
+        tokens["kty"] = self.kty
         for k in self.ALLOWED_PARAMS:
-            if k not in rv and k in self.options:
-                rv[k] = self.options[k]
-        return rv
+            if k not in tokens and k in self._options:
+                tokens[k] = self._options[k]
+
+        self._tokens = tokens
+        self._tokens_options = copy.deepcopy(self._options)
+        return tokens
 
     @property
     def kid(self):
-        return self.tokens.get("kid")
+        return self._get_tokens().get("kid")
 
     def keys(self):
-        return self.tokens.keys()
+        return self._get_tokens().keys()
 
     def __getitem__(self, item):
-        return self.tokens[item]
+        return self._get_tokens()[item]
 
     @property
     def public_only(self):
@@ -71,14 +98,15 @@ class Key:
         :param operation: key operation value, such as "sign", "encrypt".
         :raise: ValueError
         """
-        key_ops = self.tokens.get("key_ops")
+        tokens = self._get_tokens()
+        key_ops = tokens.get("key_ops")
         if key_ops is not None and operation not in key_ops:
             raise ValueError(f'Unsupported key_op "{operation}"')
 
         if operation in self.PRIVATE_KEY_OPS and self.public_only:
             raise ValueError(f'Invalid key_op "{operation}" for public key')
 
-        use = self.tokens.get("use")
+        use = tokens.get("use")
         if use:
             if operation in ["sign", "verify"]:
                 if use != "sig":
@@ -102,8 +130,9 @@ class Key:
         fields.sort()
         data = OrderedDict()
 
+        tokens = self._get_tokens()
         for k in fields:
-            data[k] = self.tokens[k]
+            data[k] = tokens[k]
 
         json_data = json_dumps(data)
         digest_data = hashlib.sha256(to_bytes(json_data)).digest()
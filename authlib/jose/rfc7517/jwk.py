@@ -1,6 +1,7 @@
 from authlib.common.encoding import json_loads
 
 from ._cryptography_key import load_pem_key
+from .asymmetric_key import AsymmetricKey
 from .key_set import KeySet
 
 
@@ -45,14 +46,19 @@ class JsonWebKey:
 
     @classmethod
     def import_key_set(cls, raw):
-        """Import KeySet from string, dict or a list of keys.
+        """Import KeySet from string, dict or a list of keys. The raw
+        cryptography keys are loaded eagerly, and the returned key set
+        is indexed by ``kid``.
 
         :return: KeySet instance
         """
         raw = _transform_raw_key(raw)
         if isinstance(raw, dict) and "keys" in raw:
-            keys = raw.get("keys")
-            return KeySet([cls.import_key(k) for k in keys])
+            keys = [cls.import_key(k) for k in raw.get("keys")]
+            for key in keys:
+                if isinstance(key, AsymmetricKey):
+                    key.get_public_key()
+            return KeySet(keys)
         raise ValueError("Invalid key set format")
 
 
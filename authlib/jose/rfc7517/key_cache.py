@@ -0,0 +1,75 @@
+import hashlib
+
+from authlib.common.encoding import json_dumps
+from authlib.common.encoding import to_bytes
+from authlib.common.lru import LRUCache
+
+
+class PreparedKeyCache:
+    """A bounded, thread-safe cache of prepared :class:`Key` objects. Keys
+    are cached by the algorithm name and a digest of the raw key material,
+    so that the same PEM string or JWK dict is only imported once::
+
+        cache = PreparedKeyCache(maxsize=64)
+        key = cache.prepare_key(algorithm, raw_pem)
+        print(cache.hits, cache.misses)
+
+    Only ``str``, ``bytes`` and ``dict`` key material is cached, other
+    values (``Key`` instances, cryptography keys) are passed through to
+    ``algorithm.prepare_key`` directly.
+
+    :param maxsize: max number of prepared keys to keep
+    """
+
+    def __init__(self, maxsize=256):
+        self._cache = LRUCache(maxsize)
+
+    @property
+    def hits(self):
+        return self._cache.hits
+
+    @property
+    def misses(self):
+        return self._cache.misses
+
+    def prepare_key(self, algorithm, raw_data):
+        """Prepare the key for the given algorithm, reusing the prepared
+        key when the same material has been seen before.
+
+        :param algorithm: JWS or JWE algorithm instance
+        :param raw_data: raw key material
+        :return: Key instance
+        """
+        digest = _digest_key_material(raw_data)
+        if digest is None:
+            return algorithm.prepare_key(raw_data)
+
+        cache_key = (algorithm.name, digest)
+        key = self._cache.get(cache_key)
+        if key is None:
+            if isinstance(raw_data, dict):
+                # the imported key keeps a reference of the dict
+                raw_data = dict(raw_data)
+            key = algorithm.prepare_key(raw_data)
+            self._cache.set(cache_key, key)
+        return key
+
+    def clear(self):
+        """Remove all prepared keys and reset the counters."""
+        self._cache.clear()
+
+    def __len__(self):
+        return len(self._cache)
+
+
+def _digest_key_material(raw_data):
+    if isinstance(raw_data, (str, bytes)):
+        data = b"r" + to_bytes(raw_data)
+    elif isinstance(raw_data, dict):
+        try:
+            data = b"d" + to_bytes(json_dumps(raw_data, sort_keys=True))
+        except (TypeError, ValueError):
+            return None
+    else:
+        return None
+    return hashlib.sha256(data).digest()
@@ -2,11 +2,54 @@ from authlib.common.encoding import json_dumps
 
 
 class KeySet:
-    """This class represents a JSON Web Key Set."""
+    """This class represents a JSON Web Key Set. Keys are indexed by
+    ``kid`` and by ``(kty, alg, use)``, so that looking up a key does
+    not need to scan the whole set. The index is rebuilt when ``keys``
+    is assigned, or when keys are added to or removed from the list.
+    After replacing a key of the list in place, assign ``keys`` again::
+
+        key_set.keys[0] = new_key
+        key_set.keys = key_set.keys
+    """
 
     def __init__(self, keys):
         self.keys = keys
 
+    @property
+    def keys(self):
+        return self._keys
+
+    @keys.setter
+    def keys(self, keys):
+        # keep the reference of the given list
+        self._keys = keys
+        self._invalidate()
+
+    def _invalidate(self):
+        self._indexed_keys = None
+
+    def _build_index(self):
+        kid_index = {}
+        type_index = {}
+        for position, k in enumerate(self._keys):
+            tokens = k._get_tokens()
+            # the first key wins when there are duplicated kid values
+            kid_index.setdefault(tokens.get("kid"), k)
+            index_key = (tokens["kty"], tokens.get("alg"), tokens.get("use"))
+            type_index.setdefault(index_key, []).append((position, k))
+
+        self._kid_index = kid_index
+        self._type_index = type_index
+        self._indexed_keys = (self._keys, len(self._keys))
+
+    def _ensure_index(self):
+        # rebuild the index when keys are added to or removed from the list
+        indexed = self._indexed_keys
+        if indexed is None or indexed[0] is not self._keys:
+            self._build_index()
+        elif indexed[1] != len(self._keys):
+            self._build_index()
+
     def as_dict(self, is_private=False, **params):
         """Represent this key as a dict of the JSON Web Key Set."""
         return {"keys": [k.as_dict(is_private, **params) for k in self.keys]}
@@ -27,7 +70,32 @@ class KeySet:
         # of the set if no kid is specified
         if kid is None and len(self.keys) == 1:
             return self.keys[0]
-        for k in self.keys:
-            if k.kid == kid:
-                return k
-        raise ValueError("Invalid JSON Web Key Set")
+
+        self._ensure_index()
+        key = self._kid_index.get(kid)
+        if key is None:
+            raise ValueError("Invalid JSON Web Key Set")
+        return key
+
+    def find_keys(self, kty, alg=None, use=None):
+        """Find the keys which can be used for the given key type,
+        algorithm and use. Keys without an ``alg`` or ``use`` parameter
+        match any value, and ``None`` values match any key.
+
+        :param kty: A string of kty, e.g. "RSA"
+        :param alg: A string of alg, e.g. "RS256"
+        :param use: A string of use, "sig" or "enc"
+        :return: list of Key instances, in the order of the key set
+        """
+        self._ensure_index()
+        candidates = []
+        for (_kty, _alg, _use), items in self._type_index.items():
+            if _kty != kty:
+                continue
+            if alg is not None and _alg is not None and _alg != alg:
+                continue
+            if use is not None and _use is not None and _use != use:
+                continue
+            candidates.extend(items)
+        candidates.sort(key=lambda item: item[0])
+        return [k for _, k in candidates]
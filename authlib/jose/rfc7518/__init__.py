@@ -7,6 +7,7 @@ from .jwe_encs import JWE_ENC_ALGORITHMS
 from .jwe_encs import CBCHS2EncAlgorithm
 from .jwe_zips import DeflateZipAlgorithm
 from .jws_algs import JWS_ALGORITHMS
+from .key_pool import EphemeralKeyPool
 from .oct_key import OctKey
 from .rsa_key import RSAKey
 
@@ -36,4 +37,5 @@ __all__ = [
     "AESAlgorithm",
     "ECDHESAlgorithm",
     "CBCHS2EncAlgorithm",
+    "EphemeralKeyPool",
 ]
@@ -20,6 +20,8 @@ from ..rfc7517 import AsymmetricKey
 class ECKey(AsymmetricKey):
     """Key class of the ``EC`` key type."""
 
+    __slots__ = ()
+
     kty = "EC"
     DSS_CURVES = {
         "P-256": SECP256R1,
@@ -65,7 +67,7 @@ class ECKey(AsymmetricKey):
             curve,
         )
         private_numbers = EllipticCurvePrivateNumbers(
-            base64_to_int(self.tokens["d"]), public_numbers
+            base64_to_int(self._dict_data["d"]), public_numbers
         )
         return private_numbers.private_key(default_backend())
 
@@ -193,6 +193,9 @@ class ECDHESAlgorithm(JWEAlgorithm):
     EXTRA_HEADERS = ["epk", "apu", "apv"]
     ALLOWED_KEY_CLS = ECKey
 
+    #: Optional :class:`EphemeralKeyPool` of pre-generated ephemeral keys
+    EPHEMERAL_KEY_POOL = None
+
     # https://tools.ietf.org/html/rfc7518#section-4.6
     def __init__(self, key_size=None):
         if key_size is None:
@@ -253,6 +256,9 @@ class ECDHESAlgorithm(JWEAlgorithm):
         return self.compute_derived_key(shared_key, fixed_info, bit_size)
 
     def _generate_ephemeral_key(self, key):
+        pool = self.EPHEMERAL_KEY_POOL
+        if pool is not None:
+            return pool.get(type(key), key["crv"])
         return key.generate_key(key["crv"], is_private=True)
 
     def _prepare_headers(self, epk):
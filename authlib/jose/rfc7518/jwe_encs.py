@@ -92,6 +92,64 @@ class CBCHS2EncAlgorithm(JWEEncAlgorithm):
         unpad = PKCS7(AES.block_size).unpadder()
         return unpad.update(data) + unpad.finalize()
 
+    def encryptor(self, aad, iv, key):
+        self.check_iv(iv)
+        hkey = key[: self.key_len]
+        ekey = key[self.key_len :]
+        cipher = Cipher(AES(ekey), CBC(iv), backend=default_backend())
+        mac = hmac.new(hkey, aad + iv, self.hash_alg)
+        return CBCHS2Encryptor(self, cipher.encryptor(), mac, aad)
+
+    def decryptor(self, aad, iv, key):
+        self.check_iv(iv)
+        hkey = key[: self.key_len]
+        dkey = key[self.key_len :]
+        cipher = Cipher(AES(dkey), CBC(iv), backend=default_backend())
+        mac = hmac.new(hkey, aad + iv, self.hash_alg)
+        return CBCHS2Decryptor(self, cipher.decryptor(), mac, aad)
+
+
+class CBCHS2Encryptor:
+    def __init__(self, enc_alg, ctx, mac, aad):
+        self._enc_alg = enc_alg
+        self._ctx = ctx
+        self._mac = mac
+        self._aad = aad
+        self._padder = PKCS7(AES.block_size).padder()
+
+    def update(self, data):
+        ciphertext = self._ctx.update(self._padder.update(data))
+        self._mac.update(ciphertext)
+        return ciphertext
+
+    def finalize(self):
+        ciphertext = self._ctx.update(self._padder.finalize()) + self._ctx.finalize()
+        self._mac.update(ciphertext)
+        self._mac.update(encode_int(len(self._aad) * 8, 64))
+        tag = self._mac.digest()[: self._enc_alg.key_len]
+        return ciphertext, tag
+
+
+class CBCHS2Decryptor:
+    def __init__(self, enc_alg, ctx, mac, aad):
+        self._enc_alg = enc_alg
+        self._ctx = ctx
+        self._mac = mac
+        self._aad = aad
+        self._unpadder = PKCS7(AES.block_size).unpadder()
+
+    def update(self, ciphertext):
+        self._mac.update(ciphertext)
+        return self._unpadder.update(self._ctx.update(ciphertext))
+
+    def finalize(self, tag):
+        self._mac.update(encode_int(len(self._aad) * 8, 64))
+        _tag = self._mac.digest()[: self._enc_alg.key_len]
+        if not hmac.compare_digest(_tag, tag):
+            raise InvalidTag()
+        data = self._unpadder.update(self._ctx.finalize())
+        return data + self._unpadder.finalize()
+
 
 class GCMEncAlgorithm(JWEEncAlgorithm):
     # Use of an IV of size 96 bits is REQUIRED with this algorithm.
@@ -136,6 +194,43 @@ class GCMEncAlgorithm(JWEEncAlgorithm):
         d.authenticate_additional_data(aad)
         return d.update(ciphertext) + d.finalize()
 
+    def encryptor(self, aad, iv, key):
+        self.check_iv(iv)
+        cipher = Cipher(AES(key), GCM(iv), backend=default_backend())
+        enc = cipher.encryptor()
+        enc.authenticate_additional_data(aad)
+        return GCMEncryptor(enc)
+
+    def decryptor(self, aad, iv, key):
+        self.check_iv(iv)
+        cipher = Cipher(AES(key), GCM(iv), backend=default_backend())
+        d = cipher.decryptor()
+        d.authenticate_additional_data(aad)
+        return GCMDecryptor(d)
+
+
+class GCMEncryptor:
+    def __init__(self, ctx):
+        self._ctx = ctx
+
+    def update(self, data):
+        return self._ctx.update(data)
+
+    def finalize(self):
+        ciphertext = self._ctx.finalize()
+        return ciphertext, self._ctx.tag
+
+
+class GCMDecryptor:
+    def __init__(self, ctx):
+        self._ctx = ctx
+
+    def update(self, ciphertext):
+        return self._ctx.update(ciphertext)
+
+    def finalize(self, tag):
+        return self._ctx.finalize_with_tag(tag)
+
 
 JWE_ENC_ALGORITHMS = [
     CBCHS2EncAlgorithm(128, 256),  # A128CBC-HS256
@@ -1,5 +1,7 @@
 import zlib
 
+from ..errors import DecodeError
+from ..errors import ExceededSizeError
 from ..rfc7516 import JsonWebEncryption
 from ..rfc7516 import JWEZipAlgorithm
 
@@ -16,7 +18,59 @@ class DeflateZipAlgorithm(JWEZipAlgorithm):
 
     def decompress(self, s):
         """Decompress DEFLATE bytes data."""
-        return zlib.decompress(s, -zlib.MAX_WBITS)
+        try:
+            return zlib.decompress(s, -zlib.MAX_WBITS)
+        except zlib.error as error:
+            raise DecodeError("Invalid DEFLATE data") from error
+
+    def compressor(self):
+        return zlib.compressobj(wbits=-zlib.MAX_WBITS)
+
+    def decompressor(self, max_length=None, chunk_size=65536):
+        return DeflateDecompressor(max_length, chunk_size)
+
+
+class DeflateDecompressor:
+    """Incremental DEFLATE decompression. The output of each call is
+    limited to ``chunk_size`` bytes, so a small compressed input can not
+    expand into a huge buffer.
+    """
+
+    def __init__(self, max_length=None, chunk_size=65536):
+        self._obj = zlib.decompressobj(-zlib.MAX_WBITS)
+        self._remaining = max_length
+        self.chunk_size = chunk_size
+
+    def _check_size(self, data):
+        if self._remaining is not None:
+            self._remaining -= len(data)
+            if self._remaining < 0:
+                raise ExceededSizeError()
+
+    def decompress(self, data):
+        """Decompress DEFLATE bytes data, yield the decompressed chunks."""
+        while True:
+            try:
+                rv = self._obj.decompress(data, self.chunk_size)
+            except zlib.error as error:
+                raise DecodeError("Invalid DEFLATE data") from error
+            self._check_size(rv)
+            if rv:
+                yield rv
+            data = self._obj.unconsumed_tail
+            if not data and len(rv) < self.chunk_size:
+                return
+
+    def flush(self):
+        """Return the rest of the decompressed data."""
+        try:
+            rv = self._obj.flush()
+        except zlib.error as error:
+            raise DecodeError("Invalid DEFLATE data") from error
+        self._check_size(rv)
+        if not self._obj.eof:
+            raise DecodeError("Incomplete or truncated DEFLATE data")
+        return rv
 
 
 def register_jwe_rfc7518():
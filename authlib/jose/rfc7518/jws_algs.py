@@ -13,6 +13,7 @@ from cryptography.exceptions import InvalidSignature
 from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.primitives.asymmetric import padding
 from cryptography.hazmat.primitives.asymmetric.ec import ECDSA
+from cryptography.hazmat.primitives.asymmetric.utils import Prehashed
 from cryptography.hazmat.primitives.asymmetric.utils import decode_dss_signature
 from cryptography.hazmat.primitives.asymmetric.utils import encode_dss_signature
 
@@ -59,14 +60,40 @@ class HMACAlgorithm(JWSAlgorithm):
         return OctKey.import_key(raw_data)
 
     def sign(self, msg, key):
-        # it is faster than the one in cryptography
-        op_key = key.get_op_key("sign")
-        return hmac.new(op_key, msg, self.hash_alg).digest()
+        return self.prepare_signer(key)(msg)
 
     def verify(self, msg, sig, key):
-        op_key = key.get_op_key("verify")
-        v_sig = hmac.new(op_key, msg, self.hash_alg).digest()
-        return hmac.compare_digest(sig, v_sig)
+        return self.prepare_verifier(key)(msg, sig)
+
+    def prepare_signer(self, key):
+        # hmac is faster than the one in cryptography, the keyed state
+        # is copied for each message
+        state = hmac.new(key.get_op_key("sign"), digestmod=self.hash_alg)
+
+        def sign(msg):
+            h = state.copy()
+            h.update(msg)
+            return h.digest()
+
+        return sign
+
+    def prepare_verifier(self, key):
+        state = hmac.new(key.get_op_key("verify"), digestmod=self.hash_alg)
+
+        def verify(msg, sig):
+            h = state.copy()
+            h.update(msg)
+            return hmac.compare_digest(sig, h.digest())
+
+        return verify
+
+    def prepare_stream_signer(self, key):
+        h = hmac.new(key.get_op_key("sign"), digestmod=self.hash_alg)
+        return HashedStream(h.update, h.digest, lambda digest: digest)
+
+    def prepare_stream_verifier(self, key):
+        h = hmac.new(key.get_op_key("verify"), digestmod=self.hash_alg)
+        return HashedStream(h.update, h.digest, _compare_digest)
 
 
 class RSAAlgorithm(JWSAlgorithm):
@@ -91,16 +118,26 @@ class RSAAlgorithm(JWSAlgorithm):
         return RSAKey.import_key(raw_data)
 
     def sign(self, msg, key):
-        op_key = key.get_op_key("sign")
-        return op_key.sign(msg, self.padding, self.hash_alg())
+        return self.prepare_signer(key)(msg)
 
     def verify(self, msg, sig, key):
-        op_key = key.get_op_key("verify")
-        try:
-            op_key.verify(sig, msg, self.padding, self.hash_alg())
-            return True
-        except InvalidSignature:
-            return False
+        return self.prepare_verifier(key)(msg, sig)
+
+    def prepare_signer(self, key):
+        return _prepare_signer(key, self.padding, self.hash_alg())
+
+    def prepare_verifier(self, key):
+        return _prepare_verifier(key, self.padding, self.hash_alg())
+
+    def prepare_stream_signer(self, key):
+        h = hashes.Hash(self.hash_alg())
+        sign = _prepare_signer(key, self.padding, Prehashed(self.hash_alg()))
+        return HashedStream(h.update, h.finalize, sign)
+
+    def prepare_stream_verifier(self, key):
+        h = hashes.Hash(self.hash_alg())
+        verify = _prepare_verifier(key, self.padding, Prehashed(self.hash_alg()))
+        return HashedStream(h.update, h.finalize, verify)
 
 
 class ECAlgorithm(JWSAlgorithm):
@@ -130,29 +167,53 @@ class ECAlgorithm(JWSAlgorithm):
         return key
 
     def sign(self, msg, key):
+        return self.prepare_signer(key)(msg)
+
+    def verify(self, msg, sig, key):
+        return self.prepare_verifier(key)(msg, sig)
+
+    def prepare_signer(self, key):
+        return self._prepare_signer(key, ECDSA(self.hash_alg()))
+
+    def prepare_verifier(self, key):
+        return self._prepare_verifier(key, ECDSA(self.hash_alg()))
+
+    def prepare_stream_signer(self, key):
+        h = hashes.Hash(self.hash_alg())
+        sign = self._prepare_signer(key, ECDSA(Prehashed(self.hash_alg())))
+        return HashedStream(h.update, h.finalize, sign)
+
+    def prepare_stream_verifier(self, key):
+        h = hashes.Hash(self.hash_alg())
+        verify = self._prepare_verifier(key, ECDSA(Prehashed(self.hash_alg())))
+        return HashedStream(h.update, h.finalize, verify)
+
+    def _prepare_signer(self, key, ecdsa):
         op_key = key.get_op_key("sign")
-        der_sig = op_key.sign(msg, ECDSA(self.hash_alg()))
-        r, s = decode_dss_signature(der_sig)
         size = key.curve_key_size
-        return encode_int(r, size) + encode_int(s, size)
 
-    def verify(self, msg, sig, key):
-        key_size = key.curve_key_size
-        length = (key_size + 7) // 8
+        def sign(msg):
+            r, s = decode_dss_signature(op_key.sign(msg, ecdsa))
+            return encode_int(r, size) + encode_int(s, size)
 
-        if len(sig) != 2 * length:
-            return False
+        return sign
 
-        r = decode_int(sig[:length])
-        s = decode_int(sig[length:])
-        der_sig = encode_dss_signature(r, s)
+    def _prepare_verifier(self, key, ecdsa):
+        op_key = key.get_op_key("verify")
+        length = (key.curve_key_size + 7) // 8
 
-        try:
-            op_key = key.get_op_key("verify")
-            op_key.verify(der_sig, msg, ECDSA(self.hash_alg()))
-            return True
-        except InvalidSignature:
-            return False
+        def verify(msg, sig):
+            if len(sig) != 2 * length:
+                return False
+            r = decode_int(sig[:length])
+            s = decode_int(sig[length:])
+            try:
+                op_key.verify(encode_dss_signature(r, s), msg, ecdsa)
+                return True
+            except InvalidSignature:
+                return False
+
+        return verify
 
 
 class RSAPSSAlgorithm(JWSAlgorithm):
@@ -177,31 +238,77 @@ class RSAPSSAlgorithm(JWSAlgorithm):
         return RSAKey.import_key(raw_data)
 
     def sign(self, msg, key):
-        op_key = key.get_op_key("sign")
-        return op_key.sign(
-            msg,
-            padding.PSS(
-                mgf=padding.MGF1(self.hash_alg()), salt_length=self.hash_alg.digest_size
-            ),
-            self.hash_alg(),
-        )
+        return self.prepare_signer(key)(msg)
 
     def verify(self, msg, sig, key):
-        op_key = key.get_op_key("verify")
+        return self.prepare_verifier(key)(msg, sig)
+
+    def _get_padding(self):
+        return padding.PSS(
+            mgf=padding.MGF1(self.hash_alg()), salt_length=self.hash_alg.digest_size
+        )
+
+    def prepare_signer(self, key):
+        return _prepare_signer(key, self._get_padding(), self.hash_alg())
+
+    def prepare_verifier(self, key):
+        return _prepare_verifier(key, self._get_padding(), self.hash_alg())
+
+    def prepare_stream_signer(self, key):
+        h = hashes.Hash(self.hash_alg())
+        sign = _prepare_signer(key, self._get_padding(), Prehashed(self.hash_alg()))
+        return HashedStream(h.update, h.finalize, sign)
+
+    def prepare_stream_verifier(self, key):
+        h = hashes.Hash(self.hash_alg())
+        pad = self._get_padding()
+        verify = _prepare_verifier(key, pad, Prehashed(self.hash_alg()))
+        return HashedStream(h.update, h.finalize, verify)
+
+
+class HashedStream:
+    """Hash a message which is fed in chunks, the digest is passed to a
+    signer or verifier prepared with a ``Prehashed`` algorithm.
+
+    :param update: function to feed a chunk to the hash context
+    :param digest: function to get the digest of the hash context
+    :param func: function to sign or verify the digest
+    """
+
+    def __init__(self, update, digest, func):
+        self.update = update
+        self._digest = digest
+        self._func = func
+
+    def finalize(self, *args):
+        return self._func(self._digest(), *args)
+
+
+def _compare_digest(digest, sig):
+    return hmac.compare_digest(sig, digest)
+
+
+def _prepare_signer(key, pad, hash_alg):
+    op_key = key.get_op_key("sign")
+
+    def sign(msg):
+        return op_key.sign(msg, pad, hash_alg)
+
+    return sign
+
+
+def _prepare_verifier(key, pad, hash_alg):
+    op_key = key.get_op_key("verify")
+
+    def verify(msg, sig):
         try:
-            op_key.verify(
-                sig,
-                msg,
-                padding.PSS(
-                    mgf=padding.MGF1(self.hash_alg()),
-                    salt_length=self.hash_alg.digest_size,
-                ),
-                self.hash_alg(),
-            )
+            op_key.verify(sig, msg, pad, hash_alg)
             return True
         except InvalidSignature:
             return False
 
+    return verify
+
 
 JWS_ALGORITHMS = [
     NoneAlgorithm(),  # none
@@ -0,0 +1,136 @@
+import logging
+import os
+import threading
+import weakref
+from collections import deque
+
+log = logging.getLogger(__name__)
+
+
+class EphemeralKeyPool:
+    """A pool of pre-generated ephemeral private keys for the ECDH-ES and
+    ECDH-1PU key agreements. Generating a key pair is the most expensive
+    step of encrypting a JWE with these algorithms, the pool moves it out
+    of the request into a background thread::
+
+        pool = EphemeralKeyPool(size=32)
+        ECDHESAlgorithm.EPHEMERAL_KEY_POOL = pool
+
+    Keys are kept per key type and curve. Each key is handed out once and
+    removed from the pool. When the pool of a curve is empty, the key is
+    generated inline, and a background thread refills the pool once it
+    drops to ``refill_threshold`` keys.
+
+    A forked child process starts with an empty pool, the keys generated
+    in the parent process are never handed out by its children.
+
+    :param size: max number of keys kept for each curve
+    :param refill_threshold: refill when this many keys are left,
+        defaults to half of ``size``
+    """
+
+    def __init__(self, size=16, refill_threshold=None):
+        if size < 1:
+            raise ValueError("size must be a positive integer")
+        if refill_threshold is None:
+            refill_threshold = size // 2
+        self.size = size
+        self.refill_threshold = refill_threshold
+        self.hits = 0
+        self.misses = 0
+        self._pools = {}
+        # held by the refill thread while it generates keys
+        self._lock = threading.Lock()
+        self._counter_lock = threading.Lock()
+        if hasattr(os, "register_at_fork"):
+            ref = weakref.ref(self)
+            os.register_at_fork(after_in_child=lambda: _reset_after_fork(ref))
+
+    def get(self, key_cls, crv):
+        """Take an ephemeral private key of the curve from the pool, or
+        generate one when the pool is empty.
+
+        :param key_cls: key class, e.g. ECKey or OKPKey
+        :param crv: curve name, e.g. "P-256" or "X25519"
+        :return: private key instance
+        """
+        pool = self._pools.get((key_cls, crv))
+        if pool is None:
+            pool = self._pools.setdefault((key_cls, crv), deque())
+
+        try:
+            # popleft is atomic, a key is never handed out twice
+            key = pool.popleft()
+        except IndexError:
+            key = None
+
+        with self._counter_lock:
+            if key is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+
+        if len(pool) <= self.refill_threshold:
+            self._refill_in_background()
+        if key is None:
+            key = key_cls.generate_key(crv, is_private=True)
+        return key
+
+    def fill(self, key_cls, crv):
+        """Fill the pool of the curve in the current thread, e.g. to warm
+        it up when the application starts.
+
+        :param key_cls: key class, e.g. ECKey or OKPKey
+        :param crv: curve name, e.g. "P-256" or "X25519"
+        """
+        pool = self._pools.setdefault((key_cls, crv), deque())
+        _fill_pool(pool, key_cls, crv, self.size)
+
+    def clear(self):
+        """Remove all the pre-generated keys."""
+        for pool in list(self._pools.values()):
+            pool.clear()
+
+    def _reset(self):
+        # the parent's keys and refill thread are not shared with a child
+        self._pools = {}
+        self._lock = threading.Lock()
+        self._counter_lock = threading.Lock()
+
+    def __len__(self):
+        return sum(len(pool) for pool in list(self._pools.values()))
+
+    def _refill(self):
+        for (key_cls, crv), pool in list(self._pools.items()):
+            _fill_pool(pool, key_cls, crv, self.size)
+
+    def _refill_in_background(self):
+        if not self._lock.acquire(blocking=False):
+            # the pools are being refilled
+            return
+
+        def refill():
+            try:
+                self._refill()
+            except Exception:
+                log.exception("Failed to generate ephemeral keys")
+            finally:
+                self._lock.release()
+
+        try:
+            thread = threading.Thread(target=refill, daemon=True)
+            thread.start()
+        except Exception:
+            self._lock.release()
+            raise
+
+
+def _reset_after_fork(ref):
+    pool = ref()
+    if pool is not None:
+        pool._reset()
+
+
+def _fill_pool(pool, key_cls, crv, size):
+    while len(pool) < size:
+        pool.append(key_cls.generate_key(crv, is_private=True))
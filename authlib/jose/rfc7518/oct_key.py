@@ -20,6 +20,8 @@ POSSIBLE_UNSAFE_KEYS = (
 class OctKey(Key):
     """Key class of the ``oct`` key type."""
 
+    __slots__ = ("raw_key",)
+
     kty = "oct"
     REQUIRED_JSON_FIELDS = ["k"]
 
@@ -44,11 +46,12 @@ class OctKey(Key):
         return self.raw_key
 
     def load_raw_key(self):
-        self.raw_key = urlsafe_b64decode(to_bytes(self.tokens["k"]))
+        self.raw_key = urlsafe_b64decode(to_bytes(self._get_tokens()["k"]))
 
     def load_dict_key(self):
         k = to_unicode(urlsafe_b64encode(self.raw_key))
         self._dict_data = {"kty": self.kty, "k": k}
+        self._tokens = None
 
     def as_dict(self, is_private=False, **params):
         tokens = self.tokens
@@ -18,6 +18,8 @@ from ..rfc7517 import AsymmetricKey
 class RSAKey(AsymmetricKey):
     """Key class of the ``RSA`` key type."""
 
+    __slots__ = ()
+
     kty = "RSA"
     PUBLIC_KEY_CLS = RSAPublicKey
     PRIVATE_KEY_CLS = RSAPrivateKeyWithSerialization
@@ -8,7 +8,9 @@ https://tools.ietf.org/html/rfc7519
 """
 
 from .claims import BaseClaims
+from .claims import ClaimsOptions
 from .claims import JWTClaims
 from .jwt import JsonWebToken
+from .jwt import JWTTemplate
 
-__all__ = ["JsonWebToken", "BaseClaims", "JWTClaims"]
+__all__ = ["JsonWebToken", "JWTTemplate", "BaseClaims", "ClaimsOptions", "JWTClaims"]
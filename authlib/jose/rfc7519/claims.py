@@ -1,4 +1,5 @@
 import time
+from collections.abc import Mapping
 
 from authlib.jose.errors import ExpiredTokenError
 from authlib.jose.errors import InvalidClaimError
@@ -11,7 +12,7 @@ class BaseClaims(dict):
 
     :param payload: the payload dict of JWT
     :param header: the header dict of JWT
-    :param options: validate options
+    :param options: validate options, a dict or :class:`ClaimsOptions`
     :param params: other params
 
     An example on ``options`` parameter, the format is inspired by
@@ -52,28 +53,40 @@ class BaseClaims(dict):
             raise error
 
     def _validate_essential_claims(self):
-        for k in self.options:
-            if self.options[k].get("essential"):
-                if k not in self:
-                    raise MissingClaimError(k)
-                elif not self.get(k):
-                    raise InvalidClaimError(k)
+        if isinstance(self.options, ClaimsOptions):
+            essential_claims = self.options.essential_claims
+        else:
+            essential_claims = [
+                k for k in self.options if self.options[k].get("essential")
+            ]
+
+        for k in essential_claims:
+            if k not in self:
+                raise MissingClaimError(k)
+            elif not self.get(k):
+                raise InvalidClaimError(k)
 
     def _validate_claim_value(self, claim_name):
-        option = self.options.get(claim_name)
-        if not option:
-            return
+        if isinstance(self.options, ClaimsOptions):
+            check = self.options.get_check(claim_name)
+            if check is None:
+                return
+            option_value, option_values, validate = check
+        else:
+            option = self.options.get(claim_name)
+            if not option:
+                return
+            option_value = option.get("value")
+            option_values = option.get("values")
+            validate = option.get("validate")
 
         value = self.get(claim_name)
-        option_value = option.get("value")
         if option_value and value != option_value:
             raise InvalidClaimError(claim_name)
 
-        option_values = option.get("values")
-        if option_values and value not in option_values:
+        if option_values and not _contains(option_values, value):
             raise InvalidClaimError(claim_name)
 
-        validate = option.get("validate")
         if validate and not validate(self, value):
             raise InvalidClaimError(claim_name)
 
@@ -104,9 +117,12 @@ class JWTClaims(BaseClaims):
         self.validate_jti()
 
         # Validate custom claims
-        for key in self.options.keys():
-            if key not in self.REGISTERED_CLAIMS:
-                self._validate_claim_value(key)
+        if isinstance(self.options, ClaimsOptions):
+            custom_claims = self.options.get_custom_claims(type(self))
+        else:
+            custom_claims = [k for k in self.options if k not in self.REGISTERED_CLAIMS]
+        for key in custom_claims:
+            self._validate_claim_value(key)
 
     def validate_iss(self):
         """The "iss" (issuer) claim identifies the principal that issued the
@@ -145,11 +161,10 @@ class JWTClaims(BaseClaims):
         if not aud_option or not aud:
             return
 
-        aud_values = aud_option.get("values")
-        if not aud_values:
-            aud_value = aud_option.get("value")
-            if aud_value:
-                aud_values = [aud_value]
+        if isinstance(self.options, ClaimsOptions):
+            aud_values = self.options.aud_values
+        else:
+            aud_values = _get_aud_values(aud_option)
 
         if not aud_values:
             return
@@ -159,7 +174,11 @@ class JWTClaims(BaseClaims):
         else:
             aud_list = [self["aud"]]
 
-        if not any([v in aud_list for v in aud_values]):
+        if isinstance(aud_values, frozenset):
+            matched = any(_contains(aud_values, v) for v in aud_list)
+        else:
+            matched = any([v in aud_list for v in aud_values])
+        if not matched:
             raise InvalidClaimError("aud")
 
     def validate_exp(self, now, leeway):
@@ -223,5 +242,101 @@ class JWTClaims(BaseClaims):
         self._validate_claim_value("jti")
 
 
+class ClaimsOptions(Mapping):
+    """Compiled ``options`` of :class:`BaseClaims`. The essential claims,
+    the allowed values and the custom claims to validate are computed
+    once, instead of interpreting the options for each token::
+
+        claims_options = ClaimsOptions(
+            {
+                "iss": {"essential": True, "values": ["https://example.com"]},
+                "aud": {"essential": True, "value": "client-id"},
+            }
+        )
+        claims = jwt.decode(s, key, claims_options=claims_options)
+        claims.validate()
+
+    The ``values`` lists are frozen into sets. A compiled options object
+    is read only and can be shared by all the tokens.
+
+    :param options: a dict of claims options
+    """
+
+    def __init__(self, options):
+        self._options = {k: dict(option) for k, option in options.items()}
+        self.essential_claims = tuple(
+            k for k, option in self._options.items() if option.get("essential")
+        )
+        self._checks = {}
+        for k, option in self._options.items():
+            value = option.get("value")
+            values = _freeze_values(option.get("values"))
+            validate = option.get("validate")
+            if value or values or validate:
+                self._checks[k] = (value, values, validate)
+
+        aud_values = _get_aud_values(self._options.get("aud") or {})
+        if aud_values:
+            aud_values = _freeze_values(list(aud_values))
+        self.aud_values = aud_values
+        self._custom_claims = {}
+
+    def __getitem__(self, key):
+        return self._options[key]
+
+    def __iter__(self):
+        return iter(self._options)
+
+    def __len__(self):
+        return len(self._options)
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self._options!r})"
+
+    def get_check(self, claim_name):
+        """Get the ``(value, values, validate)`` of a claim, or None when
+        the claim has nothing to check.
+        """
+        return self._checks.get(claim_name)
+
+    def get_custom_claims(self, claims_cls):
+        """Get the names of the options which are not registered claims
+        of the claims class.
+        """
+        rv = self._custom_claims.get(claims_cls)
+        if rv is None:
+            registered = claims_cls.REGISTERED_CLAIMS
+            rv = tuple(k for k in self._options if k not in registered)
+            self._custom_claims[claims_cls] = rv
+        return rv
+
+
+def _get_aud_values(aud_option):
+    aud_values = aud_option.get("values")
+    if not aud_values:
+        aud_value = aud_option.get("value")
+        if aud_value:
+            aud_values = [aud_value]
+    return aud_values
+
+
+def _freeze_values(values):
+    if isinstance(values, (list, tuple, set, frozenset)):
+        try:
+            return frozenset(values)
+        except TypeError:
+            # unhashable values are compared one by one
+            pass
+    return values
+
+
+def _contains(values, value):
+    try:
+        return value in values
+    except TypeError:
+        # an unhashable claim value is not in a frozenset
+        return False
+
+
 def _validate_numeric_time(s):
     return isinstance(s, (int, float))
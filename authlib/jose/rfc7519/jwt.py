@@ -1,5 +1,6 @@
 import calendar
 import datetime
+import json
 import random
 import re
 
@@ -10,6 +11,7 @@ from authlib.common.encoding import to_unicode
 
 from ..errors import DecodeError
 from ..errors import InsecureClaimError
+from ..errors import JoseError
 from ..rfc7515 import JsonWebSignature
 from ..rfc7516 import JsonWebEncryption
 from ..rfc7517 import Key
@@ -34,8 +36,15 @@ class JsonWebToken:
         re.DOTALL,
     )
 
-    def __init__(self, algorithms, private_headers=None):
-        self._jws = JsonWebSignature(algorithms, private_headers=private_headers)
+    def __init__(
+        self, algorithms, private_headers=None, key_cache=None, signing_pool=None
+    ):
+        self._jws = JsonWebSignature(
+            algorithms,
+            private_headers=private_headers,
+            key_cache=key_cache,
+            signing_pool=signing_pool,
+        )
         self._jwe = JsonWebEncryption(algorithms, private_headers=private_headers)
 
     def check_sensitive_data(self, payload):
@@ -59,23 +68,60 @@ class JsonWebToken:
         :param check: check if sensitive data in payload
         :return: bytes
         """
-        header.setdefault("typ", "JWT")
+        text, key = self._prepare_encode(header, payload, key, check)
+        if "enc" in header:
+            return self._jwe.serialize_compact(header, text, key)
+        else:
+            return self._jws.serialize_compact(header, text, key)
+
+    async def encode_async(self, header, payload, key, check=True, executor=None):
+        """An awaitable version of :meth:`encode`. The token is signed or
+        encrypted in the ``executor``, unless the algorithm is cheap, see
+        :meth:`JsonWebSignature.serialize_compact_async`.
+
+        :param header: A dict of JWS header
+        :param payload: A dict to be encoded
+        :param key: key used to sign the signature
+        :param check: check if sensitive data in payload
+        :param executor: optional ``concurrent.futures`` executor
+        :return: bytes
+        """
+        text, key = self._prepare_encode(header, payload, key, check)
+        if "enc" in header:
+            return await self._jwe.serialize_compact_async(
+                header, text, key, executor=executor
+            )
+        return await self._jws.serialize_compact_async(
+            header, text, key, executor=executor
+        )
 
-        for k in ["exp", "iat", "nbf"]:
-            # convert datetime into timestamp
-            claim = payload.get(k)
-            if isinstance(claim, datetime.datetime):
-                payload[k] = calendar.timegm(claim.utctimetuple())
+    def _prepare_encode(self, header, payload, key, check):
+        header.setdefault("typ", "JWT")
+        convert_timestamps(payload)
 
         if check:
             self.check_sensitive_data(payload)
 
         key = find_encode_key(key, header)
-        text = to_bytes(json_dumps(payload))
-        if "enc" in header:
-            return self._jwe.serialize_compact(header, text, key)
-        else:
-            return self._jws.serialize_compact(header, text, key)
+        return to_bytes(json_dumps(payload)), key
+
+    def template(self, header, claims, key, check=True):
+        """Create a :class:`JWTTemplate` of the static header and claims.
+        The static part is checked, serialized and the key is prepared
+        only once, only the dynamic claims are serialized for each token::
+
+            template = jwt.template(header, {"iss": issuer, "aud": client_id}, key)
+            token = template.encode({"sub": user_id, "iat": now, "exp": now + 3600})
+
+        The output is the same as ``encode(header, {**claims, **dynamic}, key)``.
+
+        :param header: A dict of JWS or JWE header
+        :param claims: A dict of static claims
+        :param key: key used to sign the signature
+        :param check: check if sensitive data in claims
+        :return: JWTTemplate
+        """
+        return JWTTemplate(self, header, claims, key, check)
 
     def decode(self, s, key, claims_cls=None, claims_options=None, claims_params=None):
         """Decode the JWT with the given key. This is similar with
@@ -113,6 +159,213 @@ class JsonWebToken:
             params=claims_params,
         )
 
+    async def decode_async(
+        self,
+        s,
+        key,
+        claims_cls=None,
+        claims_options=None,
+        claims_params=None,
+        executor=None,
+    ):
+        """An awaitable version of :meth:`decode`. The key can be a
+        coroutine function, e.g. an async JWK set fetcher::
+
+            async def load_key(header, payload):
+                jwk_set = await fetch_jwk_set(payload["iss"])
+                return jwk_set.find_by_kid(header["kid"])
+
+
+            claims = await jwt.decode_async(s, load_key)
+
+        The signature is verified, or the token is decrypted, in the
+        ``executor``, unless the algorithm is cheap, e.g. HMAC.
+
+        :param s: text of JWT
+        :param key: key used to verify the signature
+        :param claims_cls: class to be used for JWT claims
+        :param claims_options: `options` parameters for claims_cls
+        :param claims_params: `params` parameters for claims_cls
+        :param executor: optional ``concurrent.futures`` executor
+        :return: claims_cls instance
+        :raise: BadSignatureError
+        """
+        if claims_cls is None:
+            claims_cls = JWTClaims
+
+        if callable(key):
+            load_key = key
+        else:
+            load_key = create_load_key(prepare_raw_key(key))
+
+        s = to_bytes(s)
+        dot_count = s.count(b".")
+        if dot_count == 2:
+            data = await self._jws.deserialize_compact_async(
+                s, load_key, decode_payload, executor=executor
+            )
+        elif dot_count == 4:
+            data = await self._jwe.deserialize_compact_async(
+                s, load_key, decode_payload, executor=executor
+            )
+        else:
+            raise DecodeError("Invalid input segments length")
+        return claims_cls(
+            data["payload"],
+            data["header"],
+            options=claims_options,
+            params=claims_params,
+        )
+
+    def decode_many(
+        self,
+        tokens,
+        key,
+        claims_cls=None,
+        claims_options=None,
+        claims_params=None,
+        executor=None,
+    ):
+        """Decode a batch of JWTs with the given key. JWS tokens are
+        verified with :meth:`JsonWebSignature.verify_many`, which groups
+        the tokens by ``alg`` and key, and can verify the signatures in an
+        ``executor``::
+
+            from concurrent.futures import ThreadPoolExecutor
+
+            with ThreadPoolExecutor() as executor:
+                results = jwt.decode_many(tokens, key_set, executor=executor)
+
+        :param tokens: list of JWT texts
+        :param key: key used to verify the signatures
+        :param claims_cls: class to be used for JWT claims
+        :param claims_options: `options` parameters for claims_cls
+        :param claims_params: `params` parameters for claims_cls
+        :param executor: optional executor to verify the signatures
+        :return: list of claims_cls instances or the JoseError raised for
+            each token, in the order of ``tokens``
+        """
+        if claims_cls is None:
+            claims_cls = JWTClaims
+
+        if callable(key):
+            load_key = key
+        else:
+            load_key = create_load_key(prepare_raw_key(key))
+
+        results = [None] * len(tokens)
+        jws_indexes = []
+        jws_tokens = []
+        for index, s in enumerate(tokens):
+            s = to_bytes(s)
+            dot_count = s.count(b".")
+            if dot_count == 2:
+                jws_indexes.append(index)
+                jws_tokens.append(s)
+                continue
+
+            try:
+                if dot_count == 4:
+                    results[index] = self._jwe.deserialize_compact(
+                        s, load_key, decode_payload
+                    )
+                else:
+                    raise DecodeError("Invalid input segments length")
+            except (JoseError, ValueError) as error:
+                results[index] = error
+
+        data = self._jws.verify_many(
+            jws_tokens, load_key, decode_payload, executor=executor
+        )
+        for index, rv in zip(jws_indexes, data):
+            results[index] = rv
+
+        for index, rv in enumerate(results):
+            if not isinstance(rv, Exception):
+                results[index] = claims_cls(
+                    rv["payload"],
+                    rv["header"],
+                    options=claims_options,
+                    params=claims_params,
+                )
+        return results
+
+
+class JWTTemplate:
+    """A template to encode JWTs which share the same header and static
+    claims, created by :meth:`JsonWebToken.template`. The header and key
+    are resolved once, when the key is a key set without a ``kid`` header,
+    the same key is used for all tokens.
+    """
+
+    def __init__(self, jwt, header, claims, key, check=True):
+        header = dict(header)
+        header.setdefault("typ", "JWT")
+        claims = convert_timestamps(dict(claims))
+        if check:
+            jwt.check_sensitive_data(claims)
+
+        key = find_encode_key(key, header)
+        self.header = header
+        self.claims = claims
+        self.check = check
+        self._jwt = jwt
+        self._fragments = {k: _dump_claims({k: v})[1:-1] for k, v in claims.items()}
+        self._text = _dump_claims(claims)
+        if "enc" in header:
+            self._key = key
+            self._signer = None
+        else:
+            self._key = None
+            self._signer = jwt._jws.signer(header, key)
+
+    def encode(self, claims=None):
+        """Encode a JWT of the static claims updated with the given
+        dynamic claims, e.g. ``iat``, ``exp``, ``jti`` and ``sub``.
+
+        :param claims: A dict of dynamic claims
+        :return: bytes
+        """
+        if not claims:
+            text = self._text
+        else:
+            claims = convert_timestamps(dict(claims))
+            if self.check:
+                self._jwt.check_sensitive_data(claims)
+            text = self._merge(claims)
+
+        if self._signer is None:
+            header = dict(self.header)
+            return self._jwt._jwe.serialize_compact(header, to_bytes(text), self._key)
+        return self._signer.serialize_compact(to_bytes(text))
+
+    def _merge(self, claims):
+        if not self._fragments:
+            return _dump_claims(claims)
+
+        if self._fragments.keys().isdisjoint(claims):
+            # dynamic claims are appended after the static ones
+            return self._text[:-1] + "," + _dump_claims(claims)[1:]
+
+        # dynamic claims keep the position of the static ones
+        fragments = self._fragments.copy()
+        for k, v in claims.items():
+            fragments[k] = _dump_claims({k: v})[1:-1]
+        return "{" + ",".join(fragments.values()) + "}"
+
+
+# the same output of json_dumps, without creating an encoder for each call
+_dump_claims = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+
+
+def convert_timestamps(payload):
+    for k in ["exp", "iat", "nbf"]:
+        # convert datetime into timestamp
+        claim = payload.get(k)
+        if isinstance(claim, datetime.datetime):
+            payload[k] = calendar.timegm(claim.utctimetuple())
+    return payload
+
 
 def decode_payload(bytes_payload):
     try:
@@ -23,6 +23,21 @@ class EdDSAAlgorithm(JWSAlgorithm):
         except InvalidSignature:
             return False
 
+    def prepare_signer(self, key):
+        return key.get_op_key("sign").sign
+
+    def prepare_verifier(self, key):
+        op_key = key.get_op_key("verify")
+
+        def verify(msg, sig):
+            try:
+                op_key.verify(sig, msg)
+                return True
+            except InvalidSignature:
+                return False
+
+        return verify
+
 
 def register_jws_rfc8037(cls):
     cls.register_algorithm(EdDSAAlgorithm())
@@ -35,6 +35,8 @@ PRIVATE_KEYS_MAP = {
 class OKPKey(AsymmetricKey):
     """Key class of the ``OKP`` key type."""
 
+    __slots__ = ()
+
     kty = "OKP"
     REQUIRED_JSON_FIELDS = ["crv", "x"]
     PUBLIC_KEY_FIELDS = REQUIRED_JSON_FIELDS
@@ -1,10 +1,20 @@
+import asyncio
+import base64
 import binascii
+import inspect
 
 from authlib.common.encoding import json_loads
+from authlib.common.encoding import to_bytes
 from authlib.common.encoding import to_unicode
 from authlib.common.encoding import urlsafe_b64decode
+from authlib.common.encoding import urlsafe_b64encode
+from authlib.common.lru import LRUCache
 from authlib.jose.errors import DecodeError
 
+_SCALAR_TYPES = (str, int, float, bool, type(None))
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
 
 def extract_header(header_segment, error_cls):
     header_data = extract_segment(header_segment, error_cls, "header")
@@ -19,6 +29,65 @@ def extract_header(header_segment, error_cls):
     return header
 
 
+class HeaderCache:
+    """A bounded, thread-safe cache of the parsed protected headers of
+    compact serializations. Tokens of the same issuer share the same
+    protected header segment, entries are keyed by the raw segment and
+    keep the parsed header together with the algorithms resolved from
+    it, so that a cache hit costs a dict lookup::
+
+        JsonWebSignature.HEADER_CACHE = HeaderCache(maxsize=1024)
+
+    Only small headers with scalar values are cached, the least recently
+    used entry is discarded once ``maxsize`` is reached. Entries are
+    also keyed by a ``namespace``, e.g. the algorithm registries which
+    resolved them, so that classes with different registries can share
+    a cache.
+
+    :param maxsize: max number of headers to keep
+    """
+
+    #: header segments longer than this, e.g. with an embedded "jwk" or
+    #: "x5c", are never cached
+    max_segment_size = 512
+
+    def __init__(self, maxsize=256):
+        self._cache = LRUCache(maxsize)
+
+    @property
+    def maxsize(self):
+        return self._cache.maxsize
+
+    @property
+    def hits(self):
+        return self._cache.hits
+
+    @property
+    def misses(self):
+        return self._cache.misses
+
+    def get(self, segment, namespace=None):
+        """Get the ``(header, *algorithms)`` tuple of a header segment.
+        The returned header is shared, it MUST be copied before use.
+        """
+        return self._cache.get((namespace, segment))
+
+    def set(self, segment, header, *algorithms, namespace=None):
+        if len(segment) > self.max_segment_size:
+            return
+        if not all(isinstance(v, _SCALAR_TYPES) for v in header.values()):
+            # a shallow copy of nested values can not protect the entry
+            return
+        self._cache.set((namespace, segment), (dict(header), *algorithms))
+
+    def clear(self):
+        """Remove all the cached headers."""
+        self._cache.clear()
+
+    def __len__(self):
+        return len(self._cache)
+
+
 def extract_segment(segment, error_cls, name="payload"):
     try:
         return urlsafe_b64decode(segment)
@@ -38,3 +107,84 @@ def ensure_dict(s, structure_name):
         raise DecodeError(f"Invalid {structure_name}")
 
     return s
+
+
+def iter_chunks(data, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Iterate bytes chunks of a file-like object, an iterable of
+    bytes or a single bytes/string value.
+    """
+    if isinstance(data, (bytes, str)):
+        if data:
+            yield to_bytes(data)
+    elif hasattr(data, "read"):
+        while True:
+            chunk = data.read(chunk_size)
+            if not chunk:
+                return
+            yield to_bytes(chunk)
+    else:
+        for chunk in data:
+            if chunk:
+                yield to_bytes(chunk)
+
+
+async def load_key_async(key, header, payload):
+    """Call a key loader with the header and payload, the loader can be
+    a coroutine function. Other keys are returned as they are.
+    """
+    if callable(key):
+        key = key(header, payload)
+        if inspect.isawaitable(key):
+            key = await key
+    return key
+
+
+async def run_async(inline, executor, func, *args):
+    """Call ``func`` on the event loop when ``inline`` is true, otherwise
+    in the executor, ``None`` is the default executor of the loop.
+    """
+    if inline:
+        return func(*args)
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(executor, func, *args)
+
+
+class Base64Encoder:
+    """Incremental BASE64URL encoder without padding."""
+
+    def __init__(self):
+        self._buf = b""
+
+    def update(self, data):
+        data = self._buf + data
+        size = len(data) - len(data) % 3
+        self._buf = data[size:]
+        return base64.urlsafe_b64encode(data[:size])
+
+    def finalize(self):
+        return urlsafe_b64encode(self._buf)
+
+
+class Base64Decoder:
+    """Incremental BASE64URL decoder of unpadded data."""
+
+    def __init__(self, name="payload"):
+        self.name = name
+        self._buf = b""
+
+    def update(self, data):
+        data = self._buf + data
+        size = len(data) - len(data) % 4
+        self._buf = data[size:]
+        return self._decode(data[:size])
+
+    def finalize(self):
+        data = self._buf
+        self._buf = b""
+        return self._decode(data + b"=" * (-len(data) % 4))
+
+    def _decode(self, data):
+        try:
+            return base64.urlsafe_b64decode(data)
+        except (TypeError, binascii.Error) as exc:
+            raise DecodeError(f"Invalid {self.name} padding") from exc
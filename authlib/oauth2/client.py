@@ -1,3 +1,7 @@
+import logging
+import threading
+import time
+
 from authlib.common.security import generate_token
 from authlib.common.urls import url_decode
 
@@ -11,6 +15,8 @@ from .rfc6749.parameters import prepare_token_request
 from .rfc7009 import prepare_revoke_token_request
 from .rfc7636 import create_s256_code_challenge
 
+log = logging.getLogger(__name__)
+
 DEFAULT_HEADERS = {
     "Accept": "application/json",
     "Content-Type": "application/x-www-form-urlencoded;charset=UTF-8",
@@ -41,6 +47,9 @@ class OAuth2Client:
     :param leeway: Time window in seconds before the actual expiration of the
         authentication token, that the token is considered expired and will
         be refreshed.
+    :param refresh_ratio: Fraction of the token lifetime, e.g. ``0.8``, after
+        which the token is refreshed in a background thread, so that requests
+        don't wait for the refresh. Only used by synchronous clients.
     """
 
     client_auth_class = ClientAuth
@@ -65,6 +74,7 @@ class OAuth2Client:
         token_placement="header",
         update_token=None,
         leeway=60,
+        refresh_ratio=None,
         **metadata,
     ):
         self.session = session
@@ -113,6 +123,9 @@ class OAuth2Client:
         self._auth_methods = {}
 
         self.leeway = leeway
+        self.refresh_ratio = refresh_ratio
+        # concurrent threads refresh an expired token only once
+        self._token_lock = threading.Lock()
 
     def register_client_auth_method(self, auth):
         """Extend client authenticate for token endpoint.
@@ -301,7 +314,54 @@ class OAuth2Client:
         if token is None:
             token = self.token
         if not token.is_expired(leeway=self.leeway):
+            if self._should_refresh_ahead(token):
+                self._renew_token_in_background(token)
             return True
+
+        with self._token_lock:
+            current = self.token
+            if (
+                current is not None
+                and current is not token
+                and not current.is_expired(leeway=self.leeway)
+            ):
+                # refreshed by another thread
+                return True
+            return self._renew_token(token)
+
+    def _should_refresh_ahead(self, token):
+        if not self.refresh_ratio:
+            return False
+        expires_at = token.get("expires_at")
+        expires_in = token.get("expires_in")
+        if not expires_at or not expires_in:
+            return False
+        expires_in = int(expires_in)
+        issued_at = expires_at - expires_in
+        return time.time() >= issued_at + expires_in * self.refresh_ratio
+
+    def _renew_token_in_background(self, token):
+        if not self._token_lock.acquire(blocking=False):
+            # the token is being refreshed
+            return
+
+        def renew():
+            try:
+                if self.token is token:
+                    self._renew_token(token)
+            except Exception:
+                log.exception("Failed to refresh the token")
+            finally:
+                self._token_lock.release()
+
+        try:
+            thread = threading.Thread(target=renew, daemon=True)
+            thread.start()
+        except Exception:
+            self._token_lock.release()
+            raise
+
+    def _renew_token(self, token):
         refresh_token = token.get("refresh_token")
         url = self.metadata.get("token_endpoint")
         if refresh_token and url:
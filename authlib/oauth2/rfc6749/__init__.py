@@ -38,7 +38,10 @@ from .models import ClientMixin
 from .models import TokenMixin
 from .requests import JsonRequest
 from .requests import OAuth2Request
+from .requests import RequestParameters
 from .resource_protector import ResourceProtector
+from .resource_protector import ScopeRegistry
+from .resource_protector import ScopeRequirement
 from .resource_protector import TokenValidator
 from .token_endpoint import TokenEndpoint
 from .util import list_to_scope
@@ -48,6 +51,7 @@ from .wrappers import OAuth2Token
 __all__ = [
     "OAuth2Token",
     "OAuth2Request",
+    "RequestParameters",
     "JsonRequest",
     "OAuth2Error",
     "AccessDeniedError",
@@ -71,6 +75,8 @@ __all__ = [
     "ClientAuthentication",
     "AuthorizationServer",
     "ResourceProtector",
+    "ScopeRegistry",
+    "ScopeRequirement",
     "TokenValidator",
     "TokenEndpoint",
     "BaseGrant",
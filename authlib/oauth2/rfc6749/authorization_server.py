@@ -5,6 +5,8 @@ from .errors import InvalidScopeError
 from .errors import OAuth2Error
 from .errors import UnsupportedGrantTypeError
 from .errors import UnsupportedResponseTypeError
+from .grants.base import AuthorizationEndpointMixin
+from .grants.base import TokenEndpointMixin
 from .requests import JsonRequest
 from .requests import OAuth2Request
 from .util import scope_to_list
@@ -21,8 +23,8 @@ class AuthorizationServer:
         self.scopes_supported = scopes_supported
         self._token_generators = {}
         self._client_auth = None
-        self._authorization_grants = []
-        self._token_grants = []
+        self._authorization_grants = _GrantRegistry("check_authorization_endpoint")
+        self._token_grants = _GrantRegistry("check_token_endpoint")
         self._endpoints = {}
 
     def query_client(self, client_id):
@@ -198,13 +200,30 @@ class AuthorizationServer:
 
             authorization_server.register_grant(AuthorizationCodeGrant)
 
+        Grants which keep the default ``check_authorization_endpoint`` and
+        ``check_token_endpoint`` methods are indexed by their
+        ``RESPONSE_TYPES`` and ``GRANT_TYPE`` when they are registered.
+
         :param grant_cls: a grant class.
         :param extensions: extensions for the grant class.
         """
+        extensions = tuple(extensions) if extensions else ()
         if hasattr(grant_cls, "check_authorization_endpoint"):
-            self._authorization_grants.append((grant_cls, extensions))
+            if _has_default_check(
+                grant_cls, AuthorizationEndpointMixin, "check_authorization_endpoint"
+            ):
+                keys = {_normalize_response_type(rt) for rt in grant_cls.RESPONSE_TYPES}
+            else:
+                keys = None
+            self._authorization_grants.add(grant_cls, extensions, keys)
         if hasattr(grant_cls, "check_token_endpoint"):
-            self._token_grants.append((grant_cls, extensions))
+            if _has_default_check(
+                grant_cls, TokenEndpointMixin, "check_token_endpoint"
+            ):
+                keys = {grant_cls.GRANT_TYPE}
+            else:
+                keys = None
+            self._token_grants.add(grant_cls, extensions, keys)
 
     def register_endpoint(self, endpoint):
         """Add extra endpoint to authorization server. e.g.
@@ -228,9 +247,9 @@ class AuthorizationServer:
         :param request: OAuth2Request instance.
         :return: grant instance
         """
-        for grant_cls, extensions in self._authorization_grants:
-            if grant_cls.check_authorization_endpoint(request):
-                return _create_grant(grant_cls, extensions, request, self)
+        rv = self._authorization_grants.find(request.response_type, request)
+        if rv:
+            return _create_grant(*rv, request, self)
 
         raise UnsupportedResponseTypeError(
             f"The response type '{request.response_type}' is not supported by the server.",
@@ -264,9 +283,9 @@ class AuthorizationServer:
         :param request: OAuth2Request instance.
         :return: grant instance
         """
-        for grant_cls, extensions in self._token_grants:
-            if grant_cls.check_token_endpoint(request):
-                return _create_grant(grant_cls, extensions, request, self)
+        rv = self._token_grants.find(request.grant_type, request)
+        if rv:
+            return _create_grant(*rv, request, self)
         raise UnsupportedGrantTypeError(request.grant_type)
 
     def create_endpoint_response(self, name, request=None):
@@ -339,9 +358,58 @@ class AuthorizationServer:
         return self.handle_response(*error(self.get_error_uri(request, error)))
 
 
+class _GrantRegistry:
+    """Registered grant classes of an endpoint, indexed by ``grant_type``
+    or ``response_type``. Grant classes with a custom check method are not
+    indexed, they are checked for every request. The grants are checked in
+    the order of registration, the first matching grant wins.
+
+    :param check_name: name of the check method of the grant classes
+    """
+
+    def __init__(self, check_name):
+        self.check_name = check_name
+        self.grants = []
+        self.index = {}
+        self.unindexed = []
+
+    def add(self, grant_cls, extensions, keys=None):
+        position = len(self.grants)
+        self.grants.append((grant_cls, extensions))
+        if keys is None:
+            self.unindexed.append(position)
+        else:
+            for key in keys:
+                self.index.setdefault(key, []).append(position)
+
+    def find(self, key, request):
+        positions = self.index.get(key)
+        if positions is None:
+            positions = self.unindexed
+        elif self.unindexed:
+            positions = sorted(positions + self.unindexed)
+
+        for position in positions:
+            grant_cls, extensions = self.grants[position]
+            if getattr(grant_cls, self.check_name)(request):
+                return grant_cls, extensions
+        return None
+
+
+def _has_default_check(grant_cls, mixin_cls, name):
+    func = getattr(getattr(grant_cls, name), "__func__", None)
+    return func is getattr(mixin_cls, name).__func__
+
+
+def _normalize_response_type(response_type):
+    # the same as OAuth2Request.response_type
+    if response_type and " " in response_type:
+        return " ".join(sorted(response_type.split()))
+    return response_type
+
+
 def _create_grant(grant_cls, extensions, request, server):
     grant = grant_cls(request, server)
-    if extensions:
-        for ext in extensions:
-            ext(grant)
+    for ext in extensions:
+        ext(grant)
     return grant
@@ -1,4 +1,6 @@
 from collections import defaultdict
+from collections.abc import Mapping
+from functools import cached_property
 
 from authlib.common.encoding import json_loads
 from authlib.common.urls import url_decode
@@ -7,6 +9,68 @@ from authlib.common.urls import urlparse
 from .errors import InsecureTransportError
 
 
+class RequestParameters(Mapping):
+    """An immutable view of the query and body parameters of a request,
+    built in one pass over the parameters. As a mapping, the last value
+    of a parameter wins, body parameters override query parameters::
+
+        params = RequestParameters([("scope", "openid"), ("state", "s")])
+        params["scope"]
+        params.getlist("state")
+        "state" in params.duplicates
+
+    :param items: iterable of ``(key, value)`` pairs
+    """
+
+    __slots__ = ("_values", "_lists", "duplicates")
+
+    def __init__(self, items):
+        values = {}
+        lists = {}
+        duplicates = set()
+        for k, v in items:
+            if k in lists:
+                lists[k].append(v)
+                duplicates.add(k)
+            else:
+                lists[k] = [v]
+            values[k] = v
+        self._values = values
+        self._lists = lists
+        #: names of the parameters which are included more than once
+        self.duplicates = frozenset(duplicates)
+
+    def __getitem__(self, key):
+        return self._values[key]
+
+    def __iter__(self):
+        return iter(self._values)
+
+    def __len__(self):
+        return len(self._values)
+
+    def __contains__(self, key):
+        return key in self._values
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self._values!r})"
+
+    def get(self, key, default=None):
+        return self._values.get(key, default)
+
+    def getlist(self, key):
+        """Return all the values of a parameter in a new list."""
+        return list(self._lists.get(key, ()))
+
+    def copy(self):
+        """Return the parameters as a new dict."""
+        return dict(self._values)
+
+    def to_datalist(self) -> defaultdict[str, list]:
+        """Return all the values of the parameters as a dict of lists."""
+        return defaultdict(list, {k: list(v) for k, v in self._lists.items()})
+
+
 class OAuth2Request:
     def __init__(self, method: str, uri: str, body=None, headers=None):
         InsecureTransportError.check(uri)
@@ -26,7 +90,7 @@ class OAuth2Request:
 
         self._parsed_query = None
 
-    @property
+    @cached_property
     def args(self):
         if self._parsed_query is None:
             self._parsed_query = url_decode(urlparse.urlparse(self.uri).query)
@@ -36,26 +100,37 @@ class OAuth2Request:
     def form(self):
         return self.body or {}
 
-    @property
-    def data(self):
-        data = {}
-        data.update(self.args)
-        data.update(self.form)
-        return data
+    @cached_property
+    def parameters(self) -> RequestParameters:
+        """The query parameters and the body of the request, parsed once
+        and shared by :attr:`data` and :attr:`datalist`. Duplicated
+        parameters are checked with :attr:`datalist`, which subclasses
+        may override.
+        """
+        return RequestParameters(self.iter_parameters())
 
-    @property
+    def iter_parameters(self):
+        """Iterate ``(key, value)`` pairs of the query parameters, then
+        the body of the request.
+        """
+        if self._parsed_query is None:
+            self._parsed_query = url_decode(urlparse.urlparse(self.uri).query)
+        yield from self._parsed_query
+        yield from self.form.items()
+
+    @cached_property
+    def data(self) -> dict:
+        """The query parameters and the body of the request as a dict,
+        the body parameters override the query parameters.
+        """
+        return self.parameters.copy()
+
+    @cached_property
     def datalist(self) -> defaultdict[str, list]:
         """Return all the data in query parameters and the body of the request as a dictionary
         with all the values in lists.
         """
-        if self._parsed_query is None:
-            self._parsed_query = url_decode(urlparse.urlparse(self.uri).query)
-        values = defaultdict(list)
-        for k, v in self._parsed_query:
-            values[k].append(v)
-        for k, v in self.form.items():
-            values[k].append(v)
-        return values
+        return self.parameters.to_datalist()
 
     @property
     def client_id(self) -> str:
@@ -6,10 +6,137 @@ Implementation of Accessing Protected Resources per `Section 7`_.
 .. _`Section 7`: https://tools.ietf.org/html/rfc6749#section-7
 """
 
+import inspect
+
+from authlib.common.lru import LRUCache
+
 from .errors import MissingAuthorizationError
 from .errors import UnsupportedTokenTypeError
 from .util import scope_to_list
 
+# parsed scope strings of tokens, shared by all the requirements
+_scope_sets = LRUCache(1024)
+
+
+def scope_to_set(scope):
+    """Convert a space separated string or a list of scopes to a frozenset.
+    The sets of scope strings are cached, tokens with the same scope share
+    the same set.
+    """
+    if isinstance(scope, str):
+        rv = _scope_sets.get(scope)
+        if rv is None:
+            rv = frozenset(scope.split())
+            _scope_sets.set(scope, rv)
+        return rv
+    if scope is None:
+        return frozenset()
+    if isinstance(scope, frozenset):
+        return scope
+    return frozenset(scope_to_list(scope))
+
+
+class ScopeRegistry:
+    """A fixed registry of the supported scopes, which encodes scopes into
+    bitmasks. With a registry, a :class:`ScopeRequirement` is matched with
+    a few integer operations::
+
+        registry = ScopeRegistry(["openid", "profile", "email", "admin"])
+        require_oauth = ResourceProtector(scope_registry=registry)
+
+    Required scopes MUST be in the registry. Scopes of a token which are
+    not in the registry are ignored, they can not match a requirement.
+
+    :param scopes_supported: list of the supported scopes
+    :param cache_size: max number of encoded scope strings to keep
+    """
+
+    def __init__(self, scopes_supported, cache_size=1024):
+        self.bits = {}
+        for scope in scopes_supported:
+            self.bits.setdefault(scope, 1 << len(self.bits))
+        self._cache = LRUCache(cache_size)
+
+    def encode(self, scopes):
+        """Encode the scopes of a token into a bitmask, the masks of scope
+        strings are cached.
+
+        :param scopes: a space separated string or a list of scopes
+        :return: int
+        """
+        if isinstance(scopes, str):
+            mask = self._cache.get(scopes)
+            if mask is None:
+                mask = self._encode(scopes.split())
+                self._cache.set(scopes, mask)
+            return mask
+        return self._encode(scope_to_list(scopes) or [])
+
+    def encode_required(self, scopes):
+        """Encode required scopes into a bitmask.
+
+        :param scopes: a space separated string or a list of scopes
+        :return: int
+        :raise: ValueError if a scope is not in the registry
+        """
+        mask = 0
+        for scope in scope_to_set(scopes):
+            if scope not in self.bits:
+                raise ValueError(f'Scope "{scope}" is not in the registry')
+            mask |= self.bits[scope]
+        return mask
+
+    def _encode(self, scopes):
+        mask = 0
+        for scope in scopes:
+            mask |= self.bits.get(scope, 0)
+        return mask
+
+
+class ScopeRequirement(list):
+    """Required scopes of a protected resource, compiled once when a
+    resource is decorated by ``require_oauth``. It is a list of
+    alternatives, the token MUST have all the scopes of one of them::
+
+        # "profile", or both "email" and "openid"
+        requirement = ScopeRequirement(["profile", "email openid"])
+        requirement.match("openid email")
+
+    The scope sets of the alternatives are computed once. With a
+    :class:`ScopeRegistry`, they are encoded into bitmasks.
+
+    :param scopes: a scope string or a list of scope alternatives
+    :param registry: optional ScopeRegistry
+    """
+
+    def __init__(self, scopes, registry=None):
+        if isinstance(scopes, str):
+            scopes = [scopes]
+        super().__init__(scopes)
+        self.registry = registry
+        self.scope_sets = tuple(scope_to_set(scope) for scope in self)
+        if registry is not None:
+            self.masks = tuple(registry.encode_required(s) for s in self.scope_sets)
+        else:
+            self.masks = None
+
+    def match(self, token_scopes):
+        """Check if the scopes of a token satisfy the requirement.
+
+        :param token_scopes: a space separated string or a list of scopes
+        :return: bool
+        """
+        if self.masks is not None:
+            mask = self.registry.encode(token_scopes)
+            if not mask:
+                return False
+            return any(mask & m == m for m in self.masks)
+
+        token_scopes = scope_to_set(token_scopes)
+        if not token_scopes:
+            return False
+        return any(scopes <= token_scopes for scopes in self.scope_sets)
+
 
 class TokenValidator:
     """Base token validator class. Subclass this validator to register
@@ -27,17 +154,9 @@ class TokenValidator:
         if not required_scopes:
             return False
 
-        token_scopes = scope_to_list(token_scopes)
-        if not token_scopes:
-            return True
-
-        token_scopes = set(token_scopes)
-        for scope in required_scopes:
-            resource_scopes = set(scope_to_list(scope))
-            if token_scopes.issuperset(resource_scopes):
-                return False
-
-        return True
+        if not isinstance(required_scopes, ScopeRequirement):
+            required_scopes = ScopeRequirement(required_scopes)
+        return not required_scopes.match(token_scopes)
 
     def authenticate_token(self, token_string):
         """A method to query token from database with the given token string.
@@ -84,10 +203,18 @@ class TokenValidator:
 
 
 class ResourceProtector:
-    def __init__(self):
+    """Base resource protector. The required scopes of the protected
+    resources are compiled into :class:`ScopeRequirement` objects, pass
+    a :class:`ScopeRegistry` to match them with bitmasks.
+
+    :param scope_registry: optional ScopeRegistry of the supported scopes
+    """
+
+    def __init__(self, scope_registry=None):
         self._token_validators = {}
         self._default_realm = None
         self._default_auth_type = None
+        self.scope_registry = scope_registry
 
     def register_token_validator(self, validator: TokenValidator):
         """Register a token validator for a given Authorization type.
@@ -139,10 +266,43 @@ class ResourceProtector:
         validator = self.get_token_validator(token_type)
         return validator, token_string
 
+    def compile_requirement(self, scopes):
+        """Compile the required scopes of a protected resource into a
+        :class:`ScopeRequirement`. Empty values are returned as they are.
+
+        :param scopes: a scope string or a list of scope alternatives
+        :return: ScopeRequirement
+        """
+        if not scopes or isinstance(scopes, ScopeRequirement):
+            return scopes
+        if isinstance(scopes, (str, list, tuple, set)):
+            return ScopeRequirement(scopes, self.scope_registry)
+        return scopes
+
     def validate_request(self, scopes, request, **kwargs):
         """Validate the request and return a token."""
         validator, token_string = self.parse_request_authorization(request)
         validator.validate_request(request)
         token = validator.authenticate_token(token_string)
+        if inspect.isawaitable(token):
+            if inspect.iscoroutine(token):
+                token.close()
+            raise RuntimeError(
+                f"{type(validator).__name__} authenticates tokens asynchronously, "
+                "use validate_request_async"
+            )
+        validator.validate_token(token, scopes, request, **kwargs)
+        return token
+
+    async def validate_request_async(self, scopes, request, **kwargs):
+        """An awaitable version of :meth:`validate_request`, for token
+        validators whose ``authenticate_token`` is a coroutine, e.g.
+        :class:`~authlib.oauth2.rfc7662.AsyncCachingIntrospectTokenValidator`.
+        """
+        validator, token_string = self.parse_request_authorization(request)
+        validator.validate_request(request)
+        token = validator.authenticate_token(token_string)
+        if inspect.isawaitable(token):
+            token = await token
         validator.validate_token(token, scopes, request, **kwargs)
         return token
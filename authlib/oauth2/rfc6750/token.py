@@ -81,7 +81,26 @@ class BearerTokenGenerator:
         )
         if expires_in is None:
             expires_in = self._get_expires_in(client, grant_type)
+        return self._create_token(
+            grant_type,
+            client,
+            user,
+            scope,
+            access_token,
+            expires_in,
+            include_refresh_token,
+        )
 
+    def _create_token(
+        self,
+        grant_type,
+        client,
+        user,
+        scope,
+        access_token,
+        expires_in,
+        include_refresh_token,
+    ):
         token = {
             "token_type": "Bearer",
             "access_token": access_token,
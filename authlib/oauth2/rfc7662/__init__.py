@@ -9,6 +9,14 @@ https://tools.ietf.org/html/rfc7662
 
 from .introspection import IntrospectionEndpoint
 from .models import IntrospectionToken
+from .token_validator import AsyncCachingIntrospectTokenValidator
+from .token_validator import CachingIntrospectTokenValidator
 from .token_validator import IntrospectTokenValidator
 
-__all__ = ["IntrospectionEndpoint", "IntrospectionToken", "IntrospectTokenValidator"]
+__all__ = [
+    "IntrospectionEndpoint",
+    "IntrospectionToken",
+    "IntrospectTokenValidator",
+    "CachingIntrospectTokenValidator",
+    "AsyncCachingIntrospectTokenValidator",
+]
@@ -1,3 +1,12 @@
+import asyncio
+import copy
+import threading
+import time
+from concurrent.futures import Future
+
+from authlib.common.lru import LRUCache
+from authlib.common.security import hash_token
+
 from ..rfc6749 import TokenValidator
 from ..rfc6750 import InsufficientScopeError
 from ..rfc6750 import InvalidTokenError
@@ -32,3 +41,175 @@ class IntrospectTokenValidator(TokenValidator):
             )
         if self.scope_insufficient(token.get("scope"), scopes):
             raise InsufficientScopeError()
+
+
+class _IntrospectionCache:
+    def __init__(self, maxsize, ttl, inactive_ttl):
+        self.ttl = ttl
+        self.inactive_ttl = inactive_ttl
+        self._cache = LRUCache(maxsize)
+
+    @property
+    def hits(self):
+        return self._cache.hits
+
+    @property
+    def misses(self):
+        return self._cache.misses
+
+    def get(self, key):
+        return self._cache.get(key)
+
+    def set(self, key, token):
+        now = time.time()
+        if token and token.get("active"):
+            expires_at = now + self.ttl
+            exp = token.get("exp")
+            if isinstance(exp, (int, float)) and not isinstance(exp, bool):
+                expires_at = min(expires_at, exp)
+        else:
+            expires_at = now + self.inactive_ttl
+
+        if expires_at > now:
+            self._cache.set(key, (token,), expires_at)
+
+    def clear(self):
+        self._cache.clear()
+
+
+class _BaseCachingIntrospectTokenValidator(IntrospectTokenValidator):
+    #: max seconds to cache an active token
+    cache_ttl = 300
+    #: seconds to cache an inactive token, 0 to disable
+    inactive_cache_ttl = 10
+    #: max number of cached tokens
+    cache_maxsize = 1024
+
+    def __init__(self, realm=None, **extra_attributes):
+        super().__init__(realm, **extra_attributes)
+        self.cache = _IntrospectionCache(
+            self.cache_maxsize, self.cache_ttl, self.inactive_cache_ttl
+        )
+        self._pending = {}
+
+    def _get_cached(self, key):
+        cached = self.cache.get(key)
+        if cached is not None:
+            # the cached token is shared, never hand it out
+            return True, copy.deepcopy(cached[0])
+        return False, None
+
+    def _set_cached(self, key, token):
+        self.cache.set(key, copy.deepcopy(token))
+
+
+class CachingIntrospectTokenValidator(_BaseCachingIntrospectTokenValidator):
+    """An :class:`IntrospectTokenValidator` which caches the introspection
+    responses. Active tokens are cached until their ``exp`` value, and for
+    at most ``cache_ttl`` seconds. Inactive tokens are cached for
+    ``inactive_cache_ttl`` seconds. Concurrent introspections of the same
+    token are coalesced into one ``introspect_token`` call::
+
+        class MyIntrospectTokenValidator(CachingIntrospectTokenValidator):
+            cache_ttl = 120
+
+            def introspect_token(self, token_string):
+                url = "https://example.com/oauth/introspect"
+                resp = requests.post(url, data={"token": token_string})
+                resp.raise_for_status()
+                return resp.json()
+
+    Every call returns a new copy of the token.
+    """
+
+    def __init__(self, realm=None, **extra_attributes):
+        super().__init__(realm, **extra_attributes)
+        self._pending_lock = threading.Lock()
+
+    def authenticate_token(self, token_string):
+        key = hash_token(token_string)
+        found, token = self._get_cached(key)
+        if found:
+            return token
+
+        with self._pending_lock:
+            future = self._pending.get(key)
+            is_owner = future is None
+            if is_owner:
+                future = Future()
+                self._pending[key] = future
+
+        if not is_owner:
+            # the token is being introspected by another thread
+            return copy.deepcopy(future.result())
+
+        try:
+            token = self.introspect_token(token_string)
+            self._set_cached(key, token)
+            future.set_result(copy.deepcopy(token))
+            return token
+        except BaseException as error:
+            future.set_exception(error)
+            raise
+        finally:
+            with self._pending_lock:
+                self._pending.pop(key, None)
+
+
+class AsyncCachingIntrospectTokenValidator(_BaseCachingIntrospectTokenValidator):
+    """The asyncio version of :class:`CachingIntrospectTokenValidator`,
+    ``introspect_token`` and ``authenticate_token`` are coroutines::
+
+        class MyIntrospectTokenValidator(AsyncCachingIntrospectTokenValidator):
+            async def introspect_token(self, token_string):
+                url = "https://example.com/oauth/introspect"
+                async with httpx.AsyncClient() as client:
+                    resp = await client.post(url, data={"token": token_string})
+                resp.raise_for_status()
+                return resp.json()
+
+    Resource protectors MUST validate the requests with
+    :meth:`~authlib.oauth2.rfc6749.ResourceProtector.validate_request_async`.
+    """
+
+    async def introspect_token(self, token_string):
+        raise NotImplementedError()
+
+    async def authenticate_token(self, token_string):
+        key = hash_token(token_string)
+        while True:
+            found, token = self._get_cached(key)
+            if found:
+                return token
+
+            future = self._pending.get(key)
+            if future is None:
+                return await self._introspect_pending(key, token_string)
+
+            # the token is being introspected by another task
+            try:
+                return copy.deepcopy(await asyncio.shield(future))
+            except asyncio.CancelledError:
+                if not future.cancelled():
+                    raise
+                # the owner task was cancelled, retry the introspection
+
+    async def _introspect_pending(self, key, token_string):
+        future = asyncio.get_running_loop().create_future()
+        self._pending[key] = future
+        try:
+            token = await self.introspect_token(token_string)
+            self._set_cached(key, token)
+            future.set_result(copy.deepcopy(token))
+            return token
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as error:
+            future.set_exception(error)
+            # mark the exception as retrieved, it is raised in this task
+            future.exception()
+            raise
+        finally:
+            if self._pending.get(key) is future:
+                del self._pending[key]
@@ -1,11 +1,15 @@
 from .introspection import JWTIntrospectionEndpoint
 from .revocation import JWTRevocationEndpoint
 from .token import JWTBearerTokenGenerator
+from .token import SigningKeyManager
 from .token_validator import JWTBearerTokenValidator
+from .token_validator import VerifiedClaimsCache
 
 __all__ = [
     "JWTBearerTokenGenerator",
     "JWTBearerTokenValidator",
     "JWTIntrospectionEndpoint",
     "JWTRevocationEndpoint",
+    "SigningKeyManager",
+    "VerifiedClaimsCache",
 ]
@@ -1,17 +1,172 @@
+import itertools
+import random
+import threading
 import time
 from typing import Optional
 from typing import Union
 
+from authlib.common.encoding import json_dumps
 from authlib.common.security import generate_token
-from authlib.jose import jwt
+from authlib.jose import JsonWebKey
+from authlib.jose import JsonWebSignature
+from authlib.jose import KeySet
+from authlib.jose.rfc7519.jwt import convert_timestamps
 from authlib.oauth2.rfc6750.token import BearerTokenGenerator
 
+_ACCESS_TOKEN_TYP = "at+jwt"
+
+# the key type of the JWS algorithms by the prefix of their names
+_ALG_KEY_TYPES = {"HS": "oct", "RS": "RSA", "PS": "RSA", "ES": "EC", "Ed": "OKP"}
+
+
+class SigningKeyManager:
+    """Keep the imported private keys which sign JWT access tokens. The
+    JWK set is imported once and a pre-bound signer is created for each
+    key that can sign with ``alg``. A key is selected for every token,
+    either randomly by ``weights``, or in turn with ``"round_robin"``::
+
+        signing_keys = SigningKeyManager(
+            load_jwks("jwks.json"),
+            alg="RS256",
+            weights={"2024-01": 1, "2024-06": 3},
+        )
+
+    Keys can be rotated without a restart with :meth:`rotate`. A key
+    with a weight of 0 is published in the JWK set but not used to sign,
+    which is useful to introduce a new key before using it.
+
+    :param jwks: JWK set, a list of keys, or a single key
+    :param alg: JWS algorithm to sign tokens
+    :param weights: optional dict of weights by ``kid``, 1 by default
+    :param strategy: ``"weighted"`` or ``"round_robin"``
+    :param header: extra JWS header parameters, e.g. ``typ``
+    """
+
+    STRATEGIES = ("weighted", "round_robin")
+
+    def __init__(
+        self, jwks, alg="RS256", weights=None, strategy="weighted", header=None
+    ):
+        if strategy not in self.STRATEGIES:
+            raise ValueError(f'Invalid strategy "{strategy}"')
+        self.alg = alg
+        self.strategy = strategy
+        self._header = header
+        self._jws = JsonWebSignature(algorithms=[alg])
+        self._counter = itertools.count()
+        self._signers = ()
+        self._cum_weights = ()
+        self.rotate(jwks, weights)
+
+    @property
+    def header(self):
+        """The extra JWS header parameters, setting it re-creates the
+        signers of the keys in use.
+        """
+        return self._header
+
+    @header.setter
+    def header(self, header):
+        self._header = header
+        self._create_signers(self._keys, self._weights)
+
+    @property
+    def kids(self):
+        """The ``kid`` values of the keys in use."""
+        return [signer.header.get("kid") for signer in self._signers]
+
+    def rotate(self, jwks, weights=None):
+        """Replace the signing keys. Tokens being signed keep using the
+        previous keys, new tokens are signed with the new ones.
+
+        :param jwks: JWK set, a list of keys, or a single key
+        :param weights: optional dict of weights by ``kid``
+        """
+        self._create_signers(self._import_keys(jwks), weights)
+
+    def _create_signers(self, keys, weights):
+        signers = []
+        cum_weights = []
+        total = 0
+        for key in keys:
+            weight = weights.get(key.kid, 1) if weights else 1
+            if weight <= 0:
+                continue
+
+            signer = self._create_signer(key)
+            if signer is not None:
+                total += weight
+                signers.append(signer)
+                cum_weights.append(total)
+
+        if not signers:
+            raise ValueError(f'No signing key for "{self.alg}"')
+        # replace both at once, readers may be selecting a key
+        self._signers, self._cum_weights = tuple(signers), tuple(cum_weights)
+        self._keys, self._weights = keys, weights
+
+    def select(self):
+        """Select the signer of the next token.
+
+        :return: JWSSigner
+        """
+        signers, cum_weights = self._signers, self._cum_weights
+        if len(signers) == 1:
+            return signers[0]
+        if self.strategy == "round_robin":
+            return signers[next(self._counter) % len(signers)]
+        return random.choices(signers, cum_weights=cum_weights)[0]
+
+    def sign(self, payload):
+        """Sign the payload dict with the selected key.
+
+        :param payload: A dict of claims
+        :return: bytes
+        """
+        text = json_dumps(convert_timestamps(payload))
+        return self.select().serialize_compact(text)
+
+    def _import_keys(self, jwks):
+        if isinstance(jwks, KeySet):
+            return jwks.keys
+        if isinstance(jwks, (list, tuple)) or (
+            isinstance(jwks, dict) and "keys" in jwks
+        ):
+            return JsonWebKey.import_key_set(jwks).keys
+        algorithm = self._jws.ALGORITHMS_REGISTRY[self.alg]
+        return [algorithm.prepare_key(jwks)]
+
+    def _create_signer(self, key):
+        if key.kty != _ALG_KEY_TYPES.get(self.alg[:2], key.kty):
+            return None
+
+        tokens = key.tokens
+        if tokens.get("use", "sig") != "sig":
+            return None
+        if tokens.get("alg", self.alg) != self.alg:
+            return None
+
+        header = {"alg": self.alg}
+        if self._header:
+            header.update(self._header)
+        if key.kid:
+            header["kid"] = key.kid
+        try:
+            return self._jws.signer(header, key)
+        except ValueError:
+            # a public key, or a key of another curve
+            return None
+
 
 class JWTBearerTokenGenerator(BearerTokenGenerator):
     r"""A JWT formatted access token generator.
 
     :param issuer: The issuer identifier. Will appear in the JWT ``iss`` claim.
 
+    :param signing_keys: An optional :class:`SigningKeyManager`, its header
+        gets the ``typ`` of JWT access tokens. By default, it is created from
+        :meth:`get_jwks` and reloaded every ``signing_keys_expires_in`` seconds.
+
     :param \\*\\*kwargs: Other parameters are inherited from
         :class:`~authlib.oauth2.rfc6750.token.BearerTokenGenerator`.
 
@@ -31,18 +186,29 @@ class JWTBearerTokenGenerator(BearerTokenGenerator):
         )
     """
 
+    #: seconds to keep the signing keys loaded from :meth:`get_jwks`
+    signing_keys_expires_in = 300
+
     def __init__(
         self,
         issuer,
         alg="RS256",
         refresh_token_generator=None,
         expires_generator=None,
+        signing_keys=None,
     ):
         super().__init__(
             self.access_token_generator, refresh_token_generator, expires_generator
         )
         self.issuer = issuer
         self.alg = alg
+        if signing_keys is not None:
+            _set_access_token_typ(signing_keys)
+        self.signing_keys = signing_keys
+        self._signing_keys_managed = signing_keys is None
+        self._signing_keys_jwks = None
+        self._signing_keys_expires_at = 0
+        self._signing_keys_lock = threading.Lock()
 
     def get_jwks(self):
         """Return the JWKs that will be used to sign the JWT access token.
@@ -53,6 +219,41 @@ class JWTBearerTokenGenerator(BearerTokenGenerator):
         """
         raise NotImplementedError()
 
+    def get_signing_keys(self):
+        """Return the :class:`SigningKeyManager` which signs the tokens.
+        Unless a manager is given to the constructor, the JWK set of
+        :meth:`get_jwks` is imported once and checked again every
+        ``signing_keys_expires_in`` seconds, a changed JWK set rotates the
+        signing keys.
+        """
+        if not self._signing_keys_managed:
+            return self.signing_keys
+        if time.time() < self._signing_keys_expires_at:
+            return self.signing_keys
+
+        with self._signing_keys_lock:
+            if time.time() >= self._signing_keys_expires_at:
+                self._load_signing_keys()
+        return self.signing_keys
+
+    def _load_signing_keys(self):
+        jwks = self.get_jwks()
+        if self.signing_keys is None:
+            # This specification registers the 'application/at+jwt' media type, which can
+            # be used to indicate that the content is a JWT access token. JWT access tokens
+            # MUST include this media type in the 'typ' header parameter to explicitly
+            # declare that the JWT represents an access token complying with this profile.
+            # Per the definition of 'typ' in Section 4.1.9 of [RFC7515], it is RECOMMENDED
+            # that the 'application/' prefix be omitted. Therefore, the 'typ' value used
+            # SHOULD be 'at+jwt'.
+            self.signing_keys = SigningKeyManager(
+                jwks, alg=self.alg, header={"typ": _ACCESS_TOKEN_TYP}
+            )
+        elif jwks is not self._signing_keys_jwks and jwks != self._signing_keys_jwks:
+            self.signing_keys.rotate(jwks)
+        self._signing_keys_jwks = jwks
+        self._signing_keys_expires_at = time.time() + self.signing_keys_expires_in
+
     def get_extra_claims(self, client, grant_type, user, scope):
         """Return extra claims to add in the JWT access token. Developers MAY
         re-implement this method to add identity claims like the ones in
@@ -128,11 +329,67 @@ class JWTBearerTokenGenerator(BearerTokenGenerator):
 
     def access_token_generator(self, client, grant_type, user, scope):
         now = int(time.time())
-        expires_in = now + self._get_expires_in(client, grant_type)
+        expires_in = self._get_expires_in(client, grant_type)
+        token_data = self.get_token_data(
+            client, grant_type, user, scope, now, expires_in
+        )
+        return self.get_signing_keys().sign(token_data).decode()
 
+    def generate_many(
+        self,
+        grant_type,
+        client,
+        requests,
+        expires_in=None,
+        include_refresh_token=True,
+    ):
+        """Generate bearer tokens of one client for a batch of ``(user,
+        scope)`` pairs, e.g. for a token exchange fan-out. The signing key
+        manager, the issue time and ``expires_in`` are resolved once::
+
+            tokens = token_generator.generate_many(
+                "urn:ietf:params:oauth:grant-type:token-exchange",
+                client,
+                [(user, "read"), (user, "write")],
+                include_refresh_token=False,
+            )
+
+        :param grant_type: current requested grant_type.
+        :param client: the client that making the request.
+        :param requests: list of ``(user, scope)`` tuples.
+        :param expires_in: if provided, use this value as expires_in.
+        :param include_refresh_token: should refresh_token be included.
+        :return: list of token dicts, in the order of ``requests``
+        """
+        now = int(time.time())
+        if expires_in is None:
+            expires_in = self._get_expires_in(client, grant_type)
+        signing_keys = self.get_signing_keys()
+
+        tokens = []
+        for user, scope in requests:
+            scope = self.get_allowed_scope(client, scope)
+            token_data = self.get_token_data(
+                client, grant_type, user, scope, now, expires_in
+            )
+            access_token = signing_keys.sign(token_data).decode()
+            token = self._create_token(
+                grant_type,
+                client,
+                user,
+                scope,
+                access_token,
+                expires_in,
+                include_refresh_token,
+            )
+            tokens.append(token)
+        return tokens
+
+    def get_token_data(self, client, grant_type, user, scope, now, expires_in):
+        """Return the claims of the JWT access token issued at ``now``."""
         token_data = {
             "iss": self.issuer,
-            "exp": expires_in,
+            "exp": now + expires_in,
             "client_id": client.get_client_id(),
             "iat": now,
             "jti": self.get_jti(client, grant_type, user, scope),
@@ -198,21 +455,11 @@ class JWTBearerTokenGenerator(BearerTokenGenerator):
         # subsystem. Please refer to Sections 4.2 and 4.3 of [RFC7519] for details.
 
         token_data.update(self.get_extra_claims(client, grant_type, user, scope))
+        return token_data
 
-        # This specification registers the 'application/at+jwt' media type, which can
-        # be used to indicate that the content is a JWT access token. JWT access tokens
-        # MUST include this media type in the 'typ' header parameter to explicitly
-        # declare that the JWT represents an access token complying with this profile.
-        # Per the definition of 'typ' in Section 4.1.9 of [RFC7515], it is RECOMMENDED
-        # that the 'application/' prefix be omitted. Therefore, the 'typ' value used
-        # SHOULD be 'at+jwt'.
-
-        header = {"alg": self.alg, "typ": "at+jwt"}
-
-        access_token = jwt.encode(
-            header,
-            token_data,
-            key=self.get_jwks(),
-            check=False,
-        )
-        return access_token.decode()
+
+def _set_access_token_typ(signing_keys):
+    # JWT access tokens MUST have the "at+jwt" typ, RFC9068 section 2.1
+    header = signing_keys.header or {}
+    if header.get("typ") not in (_ACCESS_TOKEN_TYP, "application/at+jwt"):
+        signing_keys.header = {**header, "typ": _ACCESS_TOKEN_TYP}
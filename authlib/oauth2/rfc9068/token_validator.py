@@ -6,6 +6,12 @@ Implementation of Validating JWT Access Tokens per `Section 4`_.
 .. _`Section 7`: https://www.rfc-editor.org/rfc/rfc9068.html#name-validating-jwt-access-token
 """
 
+import copy
+import time
+
+from authlib.common.lru import LRUCache
+from authlib.common.security import hash_token
+from authlib.jose import ClaimsOptions
 from authlib.jose import jwt
 from authlib.jose.errors import DecodeError
 from authlib.jose.errors import JoseError
@@ -16,12 +22,72 @@ from authlib.oauth2.rfc6750.validator import BearerTokenValidator
 from .claims import JWTAccessTokenClaims
 
 
+class VerifiedClaimsCache:
+    """A bounded cache of the claims of JWT access tokens whose signature
+    has been verified, keyed by a hash of the token string. An entry is
+    kept for at most ``ttl`` seconds, and never after the ``exp`` claim
+    of the token::
+
+        validator = MyJWTBearerTokenValidator(
+            issuer="https://authorization-server.example.org",
+            resource_server="https://resource-server.example.org",
+            claims_cache=VerifiedClaimsCache(maxsize=4096, ttl=300),
+        )
+
+    :param maxsize: max number of tokens to keep
+    :param ttl: max seconds to keep a token
+    """
+
+    def __init__(self, maxsize=1024, ttl=300):
+        self.ttl = ttl
+        self._cache = LRUCache(maxsize)
+
+    @property
+    def hits(self):
+        return self._cache.hits
+
+    @property
+    def misses(self):
+        return self._cache.misses
+
+    def get(self, token_string):
+        """Get the ``(header, payload)`` of a verified token.
+
+        :param token_string: text of the JWT access token
+        :return: tuple of header and payload dicts, or None
+        """
+        value = self._cache.get(hash_token(token_string))
+        if value is not None:
+            return copy.deepcopy(value)
+
+    def set(self, token_string, header, payload):
+        """Keep the header and payload of a verified token. Tokens without
+        a numeric ``exp`` claim are not cached.
+        """
+        exp = payload.get("exp")
+        if not isinstance(exp, (int, float)) or isinstance(exp, bool):
+            return
+        expires_at = min(exp, time.time() + self.ttl)
+        value = copy.deepcopy((dict(header), dict(payload)))
+        self._cache.set(hash_token(token_string), value, expires_at)
+
+    def clear(self):
+        """Remove all tokens and reset the counters."""
+        self._cache.clear()
+
+    def __len__(self):
+        return len(self._cache)
+
+
 class JWTBearerTokenValidator(BearerTokenValidator):
     """JWTBearerTokenValidator can protect your resource server endpoints.
 
     :param issuer: The issuer from which tokens will be accepted.
     :param resource_server: An identifier for the current resource server,
         which must appear in the JWT ``aud`` claim.
+    :param claims_cache: An optional :class:`VerifiedClaimsCache`, to skip
+        the signature verification of tokens which have been verified.
+        The claims are still validated for every request.
 
     Developers needs to implement the missing methods::
 
@@ -49,11 +115,50 @@ class JWTBearerTokenValidator(BearerTokenValidator):
         def resource_endpoint(): ...
     """
 
-    def __init__(self, issuer, resource_server, *args, **kwargs):
+    def __init__(self, issuer, resource_server, *args, claims_cache=None, **kwargs):
         self.issuer = issuer
         self.resource_server = resource_server
+        self.claims_cache = claims_cache
+        self._claims_options = None
         super().__init__(*args, **kwargs)
 
+    @property
+    def claims_options(self):
+        """The :class:`~authlib.jose.ClaimsOptions` of the access tokens,
+        shared by the claims of all the tokens. They are compiled again
+        when ``resource_server`` is changed, ``issuer`` is read when the
+        claims are validated.
+        """
+        resource_server = self.resource_server
+        if isinstance(resource_server, list):
+            # a list changed in place is a new value
+            resource_server = list(resource_server)
+        cached = self._claims_options
+        if cached is None or cached[0] != resource_server:
+            cached = (resource_server, self._compile_claims_options(resource_server))
+            self._claims_options = cached
+        return cached[1]
+
+    def _compile_claims_options(self, resource_server):
+        return ClaimsOptions(
+            {
+                "iss": {"essential": True, "validate": self.validate_iss},
+                "exp": {"essential": True},
+                "aud": {"essential": True, "value": resource_server},
+                "sub": {"essential": True},
+                "client_id": {"essential": True},
+                "iat": {"essential": True},
+                "jti": {"essential": True},
+                "auth_time": {"essential": False},
+                "acr": {"essential": False},
+                "amr": {"essential": False},
+                "scope": {"essential": False},
+                "groups": {"essential": False},
+                "roles": {"essential": False},
+                "entitlements": {"essential": False},
+            }
+        )
+
     def get_jwks(self):
         """Return the JWKs that will be used to check the JWT access token signature.
         Developers MUST re-implement this method. Typically the JWKs are statically
@@ -81,22 +186,13 @@ class JWTBearerTokenValidator(BearerTokenValidator):
         """"""
         # empty docstring avoids to display the irrelevant parent docstring
 
-        claims_options = {
-            "iss": {"essential": True, "validate": self.validate_iss},
-            "exp": {"essential": True},
-            "aud": {"essential": True, "value": self.resource_server},
-            "sub": {"essential": True},
-            "client_id": {"essential": True},
-            "iat": {"essential": True},
-            "jti": {"essential": True},
-            "auth_time": {"essential": False},
-            "acr": {"essential": False},
-            "amr": {"essential": False},
-            "scope": {"essential": False},
-            "groups": {"essential": False},
-            "roles": {"essential": False},
-            "entitlements": {"essential": False},
-        }
+        claims_options = self.claims_options
+        if self.claims_cache is not None:
+            data = self.claims_cache.get(token_string)
+            if data is not None:
+                header, payload = data
+                return JWTAccessTokenClaims(payload, header, options=claims_options)
+
         jwks = self.get_jwks()
 
         # If the JWT access token is encrypted, decrypt it using the keys and algorithms
@@ -110,7 +206,7 @@ class JWTBearerTokenValidator(BearerTokenValidator):
         # of 'alg' is 'none'. The resource server MUST use the keys provided by the
         # authorization server.
         try:
-            return jwt.decode(
+            claims = jwt.decode(
                 token_string,
                 key=jwks,
                 claims_cls=JWTAccessTokenClaims,
@@ -121,6 +217,10 @@ class JWTBearerTokenValidator(BearerTokenValidator):
                 realm=self.realm, extra_attributes=self.extra_attributes
             ) from exc
 
+        if self.claims_cache is not None:
+            self.claims_cache.set(token_string, claims.header, claims)
+        return claims
+
     def validate_token(
         self, token, scopes, request, groups=None, roles=None, entitlements=None
     ):
@@ -0,0 +1,202 @@
+"""Micro-benchmarks of authlib.jose, run from the root of the repository::
+
+    python -m benchmarks.jose -o results.json -b benchmarks/baseline.json
+
+The keys are loaded from ``tests/files``, no network access is needed.
+The numbers of ``benchmarks/baseline.json`` were recorded on a single
+machine, write a baseline of your own machine before comparing.
+"""
+
+import sys
+
+from authlib.jose import JsonWebEncryption
+from authlib.jose import JsonWebKey
+from authlib.jose import JsonWebSignature
+from authlib.jose import JsonWebToken
+from authlib.jose import OctKey
+from authlib.jose.drafts import register_jwe_draft
+from tests.util import read_file_path
+
+from .runner import main
+
+PAYLOAD = b'{"iss":"https://authlib.org","sub":"123","scope":"openid profile email"}'
+
+SIG_KEYS = {
+    "HS256": ("oct", "oct"),
+    "RS256": ("rsa_private.pem", "rsa_public.pem"),
+    "PS256": ("rsa_private.pem", "rsa_public.pem"),
+    "ES256": ("secp256r1-private.json", "secp256r1-public.json"),
+    "ES512": ("secp521r1-private.json", "secp521r1-public.json"),
+    "ES256K": ("secp256k1-private.pem", "secp256k1-pub.pem"),
+    "EdDSA": ("ed25519-pkcs8.pem", "ed25519-pub.pem"),
+}
+
+JWE_ALGORITHMS = [
+    ("RSA-OAEP", "A128GCM", "rsa"),
+    ("A128KW", "A128GCM", "oct16"),
+    ("A256KW", "A128GCM", "oct32"),
+    ("A128GCMKW", "A128GCM", "oct16"),
+    ("A256GCMKW", "A128GCM", "oct32"),
+    ("ECDH-ES", "A128GCM", "ec"),
+    ("ECDH-ES+A128KW", "A128GCM", "ec"),
+    ("ECDH-1PU+A128KW", "A128CBC-HS256", "ec"),
+]
+
+
+def _import_key(name):
+    if name == "oct":
+        return OctKey.import_key(b"benchmark-secret-" * 2)
+    return JsonWebKey.import_key(read_file_path(name))
+
+
+def _jwe_keys(kind):
+    if kind == "rsa":
+        private_key = JsonWebKey.import_key(read_file_path("rsa_private.pem"))
+        return private_key, private_key.get_public_key()
+    if kind == "ec":
+        private_key = JsonWebKey.import_key(read_file_path("secp256r1-private.json"))
+        return private_key, JsonWebKey.import_key(
+            read_file_path("secp256r1-public.json")
+        )
+    size = 16 if kind == "oct16" else 32
+    key = OctKey.import_key(bytes(range(size)))
+    return key, key
+
+
+def jws_cases():
+    jws = JsonWebSignature()
+    for alg, (private_name, public_name) in SIG_KEYS.items():
+        private_key = _import_key(private_name)
+        public_key = (
+            private_key if public_name == private_name else _import_key(public_name)
+        )
+        header = {"alg": alg}
+        compact = jws.serialize_compact(header, PAYLOAD, private_key)
+        data = jws.serialize_json({"protected": header}, PAYLOAD, private_key)
+
+        yield (
+            f"jws.sign_compact.{alg}",
+            _bind(jws.serialize_compact, header, PAYLOAD, private_key),
+        )
+        yield (
+            f"jws.verify_compact.{alg}",
+            _bind(jws.deserialize_compact, compact, public_key),
+        )
+        yield (
+            f"jws.sign_json.{alg}",
+            _bind(jws.serialize_json, {"protected": header}, PAYLOAD, private_key),
+        )
+        yield f"jws.verify_json.{alg}", _bind(jws.deserialize_json, data, public_key)
+
+        signer = jws.signer(header, private_key)
+        verifier = jws.verifier(alg, public_key)
+        yield f"jws.signer.{alg}", _bind(signer.serialize_compact, PAYLOAD)
+        yield f"jws.verifier.{alg}", _bind(verifier.deserialize_compact, compact)
+
+
+def jwe_cases():
+    jwe = JsonWebEncryption()
+    register_jwe_draft(JsonWebEncryption)
+    for alg, enc, kind in JWE_ALGORITHMS:
+        private_key, public_key = _jwe_keys(kind)
+        # ECDH-1PU uses the same key pair as sender and recipient
+        is_1pu = alg.startswith("ECDH-1PU")
+        sender_key = private_key if is_1pu else None
+        sender_public = public_key if is_1pu else None
+        for zip_alg in (None, "DEF"):
+            header = {"alg": alg, "enc": enc}
+            suffix = alg
+            if zip_alg:
+                header["zip"] = zip_alg
+                suffix += "+DEF"
+            data = jwe.serialize_compact(
+                header, PAYLOAD, public_key, sender_key=sender_key
+            )
+            yield (
+                f"jwe.encrypt_compact.{suffix}",
+                _bind(
+                    jwe.serialize_compact,
+                    header,
+                    PAYLOAD,
+                    public_key,
+                    sender_key=sender_key,
+                ),
+            )
+            yield (
+                f"jwe.decrypt_compact.{suffix}",
+                _bind(
+                    jwe.deserialize_compact, data, private_key, sender_key=sender_public
+                ),
+            )
+
+
+def jwk_cases():
+    rsa_pem = read_file_path("rsa_private.pem")
+    ec_jwk = read_file_path("secp256r1-private.json")
+    okp_pem = read_file_path("ed25519-pkcs8.pem")
+    jwks = read_file_path("jwks_private.json")
+    yield "jwk.import_key.RSA-pem", _bind(_import_and_load_key, rsa_pem)
+    yield "jwk.import_key.EC-jwk", _bind(_import_and_load_key, ec_jwk)
+    yield "jwk.import_key.OKP-pem", _bind(_import_and_load_key, okp_pem)
+    yield (
+        "jwk.import_key.oct-jwk",
+        _bind(_import_and_load_key, {"kty": "oct", "k": "c2VjcmV0LWtleQ"}),
+    )
+    yield "jwk.import_key_set", _bind(JsonWebKey.import_key_set, jwks)
+
+
+def jwt_cases():
+    jwt = JsonWebToken(["HS256", "RS256"])
+    claims = {
+        "iss": "https://authlib.org",
+        "sub": "123",
+        "exp": 4102444800,
+        "iat": 1700000000,
+    }
+    keys = {
+        "HS256": (b"benchmark-secret-" * 2, b"benchmark-secret-" * 2),
+        "RS256": (read_file_path("rsa_private.pem"), read_file_path("rsa_public.pem")),
+    }
+    for alg, (private_key, public_key) in keys.items():
+        header = {"alg": alg}
+        token = jwt.encode(header, claims, private_key)
+        yield f"jwt.encode.{alg}", _bind(jwt.encode, header, claims, private_key)
+        yield f"jwt.decode.{alg}", _bind(_decode_and_validate, jwt, token, public_key)
+
+        template = jwt.template(header, {"iss": claims["iss"]}, private_key)
+        dynamic = {k: v for k, v in claims.items() if k != "iss"}
+        yield f"jwt.template.{alg}", _bind(template.encode, dynamic)
+
+
+def _import_and_load_key(raw):
+    # keys imported from a JWK dict are loaded on first use, load
+    # them here to time the whole import
+    key = JsonWebKey.import_key(raw)
+    key.get_op_key("sign")
+    return key
+
+
+def _decode_and_validate(jwt, token, key):
+    claims = jwt.decode(token, key)
+    claims.validate()
+    return claims
+
+
+def _bind(func, *args, **kwargs):
+    def call():
+        return func(*args, **kwargs)
+
+    return call
+
+
+def get_cases():
+    cases = []
+    cases.extend(jws_cases())
+    cases.extend(jwe_cases())
+    cases.extend(jwk_cases())
+    cases.extend(jwt_cases())
+    return cases
+
+
+if __name__ == "__main__":
+    sys.exit(main(get_cases(), description="authlib.jose micro-benchmarks"))
@@ -0,0 +1,171 @@
+import argparse
+import json
+import platform
+import sys
+import time
+
+import authlib
+
+
+class Benchmark:
+    """Time a list of ``(name, func)`` cases. Each case is called in a
+    loop for at least ``min_time`` seconds, the loop is repeated
+    ``repeat`` times and the best round is kept, which is the least
+    disturbed by other processes.
+
+    :param min_time: min seconds of a round
+    :param repeat: number of rounds of each case
+    """
+
+    def __init__(self, min_time=0.2, repeat=5):
+        self.min_time = min_time
+        self.repeat = repeat
+
+    def _calibrate(self, func):
+        number = 1
+        while True:
+            elapsed = _time_loop(func, number)
+            if elapsed >= self.min_time:
+                return number, elapsed
+            if elapsed <= 0:
+                number *= 10
+            else:
+                # aim a bit higher than the min time to avoid a new round
+                number = max(number + 1, int(number * self.min_time * 1.2 / elapsed))
+
+    def run_case(self, func):
+        number, elapsed = self._calibrate(func)
+        best = elapsed
+        for _ in range(self.repeat - 1):
+            best = min(best, _time_loop(func, number))
+        per_op = best / number
+        return {
+            "ops": round(1 / per_op, 2),
+            "mean_us": round(per_op * 1e6, 3),
+            "number": number,
+        }
+
+    def run(self, cases, pattern=None, out=None):
+        results = {}
+        for name, func in cases:
+            if pattern and pattern not in name:
+                continue
+            result = self.run_case(func)
+            results[name] = result
+            if out is not None:
+                out.write(
+                    f"{name:<48} {result['ops']:>12.1f} ops/s {result['mean_us']:>12.2f} us\n"
+                )
+                out.flush()
+        return results
+
+
+def _time_loop(func, number):
+    timer = time.perf_counter
+    start = timer()
+    for _ in range(number):
+        func()
+    return timer() - start
+
+
+def create_report(results):
+    return {
+        "meta": {
+            "authlib": authlib.__version__,
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+        },
+        "results": results,
+    }
+
+
+def compare(results, baseline, threshold=0.2):
+    """Compare the results with the baseline results. A case is a
+    regression when its ops/sec drops by more than ``threshold``.
+
+    :return: list of ``(name, baseline_ops, ops, ratio, regressed)``
+    """
+    rows = []
+    for name, result in results.items():
+        base = baseline.get(name)
+        if not base:
+            continue
+        ratio = result["ops"] / base["ops"]
+        rows.append((name, base["ops"], result["ops"], ratio, ratio < 1 - threshold))
+    return rows
+
+
+def compare_meta(meta, baseline_meta):
+    """Compare the environment of the results with the one of the baseline.
+    Numbers of another machine or Python are not comparable.
+
+    :return: list of messages of the differences
+    """
+    messages = []
+    for key in ("python", "implementation", "platform"):
+        if key in baseline_meta and baseline_meta[key] != meta[key]:
+            messages.append(
+                f"baseline {key} is {baseline_meta[key]!r}, current is {meta[key]!r}\n"
+            )
+    return messages
+
+
+def write_comparison(rows, out):
+    out.write(f"\n{'case':<48} {'baseline':>12} {'current':>12} {'change':>8}\n")
+    for name, base_ops, ops, ratio, regressed in rows:
+        mark = "  REGRESSION" if regressed else ""
+        out.write(
+            f"{name:<48} {base_ops:>12.1f} {ops:>12.1f} {ratio - 1:>+8.1%}{mark}\n"
+        )
+
+
+def main(cases, argv=None, description=None):
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument(
+        "-k", dest="pattern", help="only run cases containing this string"
+    )
+    parser.add_argument("-o", "--output", help="write the results as JSON to this file")
+    parser.add_argument(
+        "-b", "--baseline", help="compare the results with this JSON file"
+    )
+    parser.add_argument(
+        "--threshold", type=float, default=0.2, help="max allowed slowdown, default 0.2"
+    )
+    parser.add_argument(
+        "--fail-on-regression", action="store_true", help="exit with 1 on regressions"
+    )
+    parser.add_argument(
+        "--min-time", type=float, default=0.2, help="min seconds of a round"
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=5, help="number of rounds of each case"
+    )
+    args = parser.parse_args(argv)
+
+    bench = Benchmark(min_time=args.min_time, repeat=args.repeat)
+    results = bench.run(cases, args.pattern, sys.stdout)
+    report = create_report(results)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2, sort_keys=True)
+            f.write("\n")
+
+    if not args.baseline:
+        return 0
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    for line in compare_meta(report["meta"], baseline.get("meta", {})):
+        sys.stdout.write(f"\nWARNING: {line}")
+    rows = compare(results, baseline["results"], args.threshold)
+    write_comparison(rows, sys.stdout)
+    regressions = [row[0] for row in rows if row[4]]
+    if regressions:
+        sys.stdout.write(
+            f"\n{len(regressions)} regression(s) over {args.threshold:.0%}\n"
+        )
+        if args.fail_on_regression:
+            return 1
+    return 0
@@ -1,3 +1,4 @@
+import time
 from unittest import TestCase
 from unittest import mock
 
@@ -5,12 +6,15 @@ import pytest
 from cachelib import SimpleCache
 from flask import Flask
 from flask import session
+from requests import Session
 
 from authlib.common.urls import url_decode
 from authlib.common.urls import urlparse
 from authlib.integrations.flask_client import FlaskOAuth2App
 from authlib.integrations.flask_client import OAuth
 from authlib.integrations.flask_client import OAuthError
+from authlib.integrations.requests_client import ConnectionPool
+from authlib.integrations.requests_client import OAuth2Session
 from authlib.jose.rfc7517 import JsonWebKey
 from authlib.oidc.core.grants.util import generate_id_token
 
@@ -313,6 +317,81 @@ class FlaskOAuthTest(TestCase):
                 resp = client.authorize_redirect("https://b.com/bar")
                 assert resp.status_code == 302
 
+    def test_server_metadata_cache(self):
+        app = Flask(__name__)
+        cache = SimpleCache()
+        metadata_url = "https://i.b/.well-known/openid-configuration"
+        config = dict(
+            client_id="dev",
+            client_secret="dev",
+            server_metadata_url=metadata_url,
+        )
+        client = OAuth(app, cache=cache).register("dev", **config)
+
+        with mock.patch("requests.sessions.Session.send") as send:
+            send.return_value = mock_send_value({"issuer": "https://i.b"})
+            assert client.load_server_metadata()["issuer"] == "https://i.b"
+            assert client.load_server_metadata()["issuer"] == "https://i.b"
+            assert send.call_count == 1
+
+            # another process shares the metadata via cache
+            other = OAuth(app, cache=cache).register("dev", **config)
+            assert other.load_server_metadata()["issuer"] == "https://i.b"
+            assert send.call_count == 1
+
+            # stale metadata is refreshed in background
+            cache.clear()
+            send.return_value = mock_send_value({"issuer": "https://a.b"})
+            client._server_metadata_expires_at = time.time() - 1
+            assert client.load_server_metadata()["issuer"] == "https://i.b"
+            with client._server_metadata_lock:
+                assert send.call_count == 2
+            assert client.load_server_metadata()["issuer"] == "https://a.b"
+
+            # expired metadata is refreshed before using it
+            cache.clear()
+            send.return_value = mock_send_value({"issuer": "https://c.d"})
+            client._server_metadata_expires_at = time.time() - 3600
+            assert client.load_server_metadata()["issuer"] == "https://c.d"
+            assert send.call_count == 3
+
+    def test_server_metadata_refresh(self):
+        app = Flask(__name__)
+        client = OAuth(app).register(
+            "dev",
+            client_id="dev",
+            client_secret="dev",
+            server_metadata_url="https://i.b/.well-known/openid-configuration",
+            userinfo_endpoint="https://i.b/user",
+        )
+
+        with mock.patch("requests.sessions.Session.send") as send:
+            resp = mock_send_value(
+                {"issuer": "https://i.b", "jwks_uri": "https://i.b/k"}
+            )
+            resp.headers = {"Cache-Control": "no-cache"}
+            send.return_value = resp
+            now = time.time()
+            metadata = client.load_server_metadata()
+            assert metadata["jwks_uri"] == "https://i.b/k"
+            assert metadata["userinfo_endpoint"] == "https://i.b/user"
+            # no-cache responses are not cached
+            expires_in = client._server_metadata_expires_at - now
+            assert 0 <= expires_in < 1
+            client.server_metadata_min_expires_in = 60
+            client._server_metadata_expires_at = time.time() - 3600
+            now = time.time()
+            client.load_server_metadata()
+            expires_in = client._server_metadata_expires_at - now
+            assert 59 < expires_in < client.server_metadata_expires_in
+
+            # keys removed by the provider are removed from the metadata
+            send.return_value = mock_send_value({"issuer": "https://i.b"})
+            client._server_metadata_expires_at = time.time() - 3600
+            metadata = client.load_server_metadata()
+            assert "jwks_uri" not in metadata
+            assert metadata["userinfo_endpoint"] == "https://i.b/user"
+
     def test_oauth2_authorize_code_challenge(self):
         app = Flask(__name__)
         app.secret_key = "!"
@@ -498,6 +577,50 @@ class FlaskOAuthTest(TestCase):
                 resp = client.get("/api/user", token=expired_token)
                 assert resp.text == "hi"
 
+    def test_request_shares_connection_pool(self):
+        app = Flask(__name__)
+        app.secret_key = "!"
+        oauth = OAuth(app)
+        client = oauth.register(
+            "dev",
+            client_id="dev",
+            client_secret="dev",
+            api_base_url="https://i.b/api",
+            access_token_url="https://i.b/token",
+            authorize_url="https://i.b/authorize",
+        )
+        adapters = []
+        tokens = []
+
+        def fake_send(sess, req, **kwargs):
+            adapters.append(sess.get_adapter(req.url))
+            tokens.append(req.headers["Authorization"])
+            return mock_send_value("hi")
+
+        with app.test_request_context():
+            with mock.patch("requests.sessions.Session.send", fake_send):
+                client.get("/api/user", token={"access_token": "a"})
+                client.get("/api/user", token={"access_token": "b"})
+
+        assert adapters[0] is adapters[1]
+        assert adapters[0] is client._session_pool.adapter
+        assert tokens == ["Bearer a", "Bearer b"]
+
+        with mock.patch.object(client._session_pool.adapter, "close") as close:
+            client.close()
+            close.assert_called_once()
+
+    def test_connection_pool_client_kwargs(self):
+        pool = ConnectionPool({"verify": False, "proxies": {"https": "http://p"}})
+        session = pool.create_session(Session)
+        assert session.verify is False
+        assert session.proxies == {"https": "http://p"}
+        assert session.get_adapter("https://i.b") is pool.adapter
+
+        session = pool.create_session(OAuth2Session, verify="/ca.pem")
+        assert session.verify == "/ca.pem"
+        assert session.proxies == {"https": "http://p"}
+
     def test_request_without_token(self):
         app = Flask(__name__)
         app.secret_key = "!"
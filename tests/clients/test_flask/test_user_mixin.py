@@ -4,6 +4,9 @@ from unittest import mock
 import pytest
 from flask import Flask
 
+from authlib.integrations.base_client.jwks import JWKSManager
+from authlib.integrations.base_client.jwks import parse_max_age
+from authlib.integrations.flask_client import FlaskOAuth2App
 from authlib.integrations.flask_client import OAuth
 from authlib.jose import JsonWebKey
 from authlib.jose.errors import InvalidClaimError
@@ -182,3 +185,154 @@ class FlaskUserMixinTest(TestCase):
                 token["id_token"] = id_token
                 user = client.parse_id_token(token, nonce="n")
                 assert user.sub == "123"
+
+    def test_jwks_uri_cache_and_refresh_interval(self):
+        secret_keys = read_key_file("jwks_private.json")
+        token = get_bearer_token()
+        id_token = generate_id_token(
+            token,
+            {"sub": "123"},
+            secret_keys,
+            alg="RS256",
+            iss="https://i.b",
+            aud="dev",
+            exp=3600,
+            nonce="n",
+            kid="abc",
+        )
+        bad_token = get_bearer_token()
+        bad_token["id_token"] = generate_id_token(
+            bad_token,
+            {"sub": "123"},
+            secret_key,
+            alg="HS256",
+            iss="https://i.b",
+            aud="dev",
+            exp=3600,
+            nonce="n",
+        )
+
+        app = Flask(__name__)
+        app.secret_key = "!"
+        oauth = OAuth(app)
+        client = oauth.register(
+            "dev",
+            client_id="dev",
+            client_secret="dev",
+            fetch_token=get_bearer_token,
+            jwks_uri="https://i.b/jwks",
+            issuer="https://i.b",
+            id_token_signing_alg_values_supported=["HS256", "RS256"],
+        )
+
+        calls = []
+
+        def fake_send(sess, req, **kwargs):
+            calls.append(req.url)
+            resp = mock.MagicMock()
+            resp.json = lambda: read_key_file("jwks_public.json")
+            resp.headers = {"Cache-Control": "public, max-age=600"}
+            resp.status_code = 200
+            return resp
+
+        with app.test_request_context():
+            with mock.patch("requests.sessions.Session.send", fake_send):
+                token["id_token"] = id_token
+                for _ in range(3):
+                    user = client.parse_id_token(token, nonce="n")
+                    assert user.sub == "123"
+                assert len(calls) == 1
+
+                manager = client.get_jwks_manager()
+                expires_in = manager.expires_at - manager._refreshed_at
+                assert expires_in == pytest.approx(600)
+
+                # unknown kid values can not trigger a refetch in cooldown
+                for _ in range(3):
+                    with pytest.raises(ValueError):
+                        client.parse_id_token(bad_token, nonce="n")
+                assert len(calls) == 1
+
+                manager._refreshed_at -= manager.refresh_interval
+                with pytest.raises(ValueError):
+                    client.parse_id_token(bad_token, nonce="n")
+                assert len(calls) == 2
+
+                # expired JWK set is fetched again
+                manager.expires_at = 0
+                user = client.parse_id_token(token, nonce="n")
+                assert user.sub == "123"
+                assert len(calls) == 3
+
+                # the fetched JWK set is not stored in the metadata
+                assert client.fetch_jwk_set() == read_key_file("jwks_public.json")
+                assert len(calls) == 4
+                assert "jwks" not in client.server_metadata
+                user = client.parse_id_token(token, nonce="n")
+                assert len(calls) == 4
+
+    def test_override_fetch_jwk_set(self):
+        secret_keys = read_key_file("jwks_private.json")
+        token = get_bearer_token()
+        token["id_token"] = generate_id_token(
+            token,
+            {"sub": "123"},
+            secret_keys,
+            alg="RS256",
+            iss="https://i.b",
+            aud="dev",
+            exp=3600,
+            nonce="n",
+            kid="abc",
+        )
+        calls = []
+
+        class MyOAuth2App(FlaskOAuth2App):
+            def fetch_jwk_set(self, force=False):
+                calls.append(force)
+                return read_key_file("jwks_public.json")
+
+        app = Flask(__name__)
+        app.secret_key = "!"
+        oauth = OAuth(app)
+        client = oauth.register(
+            "dev",
+            client_id="dev",
+            client_secret="dev",
+            client_cls=MyOAuth2App,
+            issuer="https://i.b",
+        )
+        with app.test_request_context():
+            for _ in range(2):
+                user = client.parse_id_token(token, nonce="n")
+                assert user.sub == "123"
+        assert calls == [False]
+        manager = client.get_jwks_manager()
+        expires_in = manager.expires_at - manager._refreshed_at
+        assert expires_in == pytest.approx(client.jwks_expires_in)
+
+
+def test_jwks_manager_no_cache():
+    calls = []
+
+    def fetch(force):
+        calls.append(force)
+        return read_key_file("jwks_public.json"), 0
+
+    manager = JWKSManager(fetch)
+    manager.get_key_set()
+    manager.get_key_set()
+    assert calls == [False, True]
+
+    manager = JWKSManager(fetch, min_expires_in=60)
+    manager.get_key_set()
+    manager.get_key_set()
+    assert calls == [False, True, False]
+
+
+def test_parse_max_age():
+    assert parse_max_age({}) is None
+    assert parse_max_age({"Cache-Control": "public, max-age=300"}) == 300
+    assert parse_max_age({"Cache-Control": 'max-age="30", must-revalidate'}) == 30
+    assert parse_max_age({"Cache-Control": "no-store"}) == 0
+    assert parse_max_age({"Cache-Control": "s-maxage=20"}) is None
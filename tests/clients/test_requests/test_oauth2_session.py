@@ -1,3 +1,4 @@
+import threading
 import time
 from copy import deepcopy
 from unittest import TestCase
@@ -397,6 +398,56 @@ class OAuth2SessionTest(TestCase):
         sess.get("https://i.b/user")
         assert update_token.called
 
+    def test_auto_refresh_token_single_flight(self):
+        refreshed = []
+        old_token = dict(
+            access_token="a", refresh_token="b", token_type="bearer", expires_at=100
+        )
+        sess = OAuth2Session("foo", token=old_token, token_endpoint="https://i.b/token")
+
+        def fake_send(r, **kwargs):
+            resp = mock.MagicMock()
+            resp.status_code = 200
+            if r.url == "https://i.b/token":
+                refreshed.append(r.body)
+                time.sleep(0.05)
+                resp.json = lambda: self.token
+            else:
+                resp.json = lambda: {"sub": "a"}
+            return resp
+
+        sess.send = fake_send
+        threads = [
+            threading.Thread(target=sess.get, args=("https://i.b/user",))
+            for _ in range(5)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert len(refreshed) == 1
+        assert sess.token["access_token"] == "a"
+
+    def test_refresh_token_ahead(self):
+        old_token = dict(
+            access_token="old",
+            refresh_token="b",
+            token_type="bearer",
+            expires_in=3600,
+            expires_at=int(time.time()) + 600,
+        )
+        sess = OAuth2Session(
+            "foo",
+            token=old_token,
+            token_endpoint="https://i.b/token",
+            refresh_ratio=0.8,
+        )
+        sess.send = mock_json_response(self.token)
+        sess.get("https://i.b/user")
+        # wait for the background refresh
+        with sess._token_lock:
+            assert sess.token["access_token"] == "a"
+
     def test_revoke_token(self):
         sess = OAuth2Session("a")
         answer = {"status": "ok"}
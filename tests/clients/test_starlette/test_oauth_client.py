@@ -1,5 +1,12 @@
+import asyncio
+import threading
+import time
+from unittest import mock
+
 import pytest
 from httpx import ASGITransport
+from httpx import MockTransport
+from httpx import Response
 from starlette.config import Config
 from starlette.requests import Request
 
@@ -267,6 +274,124 @@ async def test_request_withhold_token():
     assert resp.json()["sub"] == "123"
 
 
+@pytest.mark.asyncio
+async def test_request_shares_connection_pool():
+    oauth = OAuth()
+    client = oauth.register(
+        "dev",
+        client_id="dev",
+        client_secret="dev",
+        api_base_url="https://i.b/api",
+        access_token_url="https://i.b/token",
+        authorize_url="https://i.b/authorize",
+    )
+    tokens = []
+
+    def handler(request):
+        tokens.append(request.headers["Authorization"])
+        return Response(200, json={"sub": "123"})
+
+    transport = MockTransport(handler)
+    client._session_pool._transports[asyncio.get_running_loop()] = transport
+    resp = await client.get("/user", token={"access_token": "a"})
+    assert resp.json()["sub"] == "123"
+    resp = await client.get("/user", token={"access_token": "b"})
+    assert resp.json()["sub"] == "123"
+    assert tokens == ["Bearer a", "Bearer b"]
+
+    with mock.patch.object(transport, "aclose") as aclose:
+        await client.aclose()
+        aclose.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_connection_pool_with_custom_transport():
+    oauth = OAuth()
+    transport = ASGITransport(AsyncPathMapDispatch({"/user": {"body": {}}}))
+    client = oauth.register(
+        "dev",
+        client_id="dev",
+        client_secret="dev",
+        client_kwargs={"transport": transport},
+    )
+    assert client._session_pool.transport is None
+
+
+def test_connection_pool_per_event_loop():
+    oauth = OAuth()
+    client = oauth.register("dev", client_id="dev", client_secret="dev")
+    pool = client._session_pool
+    assert pool.transport is None
+
+    async def get_transport():
+        assert pool.transport is pool.transport
+        return pool.transport
+
+    transports = [asyncio.run(get_transport())]
+    thread = threading.Thread(
+        target=lambda: transports.append(asyncio.run(get_transport()))
+    )
+    thread.start()
+    thread.join()
+    assert transports[0] is not None
+    assert transports[1] is not None
+    assert transports[0] is not transports[1]
+
+
+@pytest.mark.asyncio
+async def test_server_metadata_stale_while_revalidate():
+    issuers = ["https://i.b", "https://a.b"]
+
+    def handler(request):
+        return Response(200, json={"issuer": issuers.pop(0)})
+
+    oauth = OAuth()
+    client = oauth.register(
+        "dev",
+        client_id="dev",
+        client_secret="dev",
+        server_metadata_url="https://i.b/.well-known/openid-configuration",
+        client_kwargs={"transport": MockTransport(handler)},
+    )
+    metadata = await client.load_server_metadata()
+    assert metadata["issuer"] == "https://i.b"
+
+    client._server_metadata_expires_at = time.time() - 1
+    metadata = await client.load_server_metadata()
+    assert metadata["issuer"] == "https://i.b"
+    await client._server_metadata_task
+    metadata = await client.load_server_metadata()
+    assert metadata["issuer"] == "https://a.b"
+    assert issuers == []
+
+
+@pytest.mark.asyncio
+async def test_server_metadata_single_refresh_task():
+    calls = []
+
+    def handler(request):
+        calls.append(request.url)
+        return Response(200, json={"issuer": "https://i.b"})
+
+    oauth = OAuth()
+    client = oauth.register(
+        "dev",
+        client_id="dev",
+        client_secret="dev",
+        server_metadata_url="https://i.b/.well-known/openid-configuration",
+        client_kwargs={"transport": MockTransport(handler)},
+    )
+    await client.load_server_metadata()
+    client._server_metadata_expires_at = time.time() - 1
+    tasks = set()
+    for _ in range(3):
+        await client.load_server_metadata()
+        tasks.add(client._server_metadata_task)
+    assert len(tasks) == 1
+    await client._server_metadata_task
+    assert len(calls) == 2
+
+
 @pytest.mark.asyncio
 async def test_oauth2_authorize_no_url():
     oauth = OAuth()
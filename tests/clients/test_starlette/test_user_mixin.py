@@ -1,3 +1,5 @@
+import asyncio
+
 import pytest
 from httpx import ASGITransport
 from starlette.requests import Request
@@ -145,3 +147,55 @@ async def test_force_fetch_jwks_uri():
     )
     user = await client.parse_id_token(token, nonce="n")
     assert user.sub == "123"
+
+
+@pytest.mark.asyncio
+async def test_jwks_uri_single_flight():
+    secret_keys = read_key_file("jwks_private.json")
+    token = get_bearer_token()
+    token["id_token"] = generate_id_token(
+        token,
+        {"sub": "123"},
+        secret_keys,
+        alg="RS256",
+        iss="https://i.b",
+        aud="dev",
+        exp=3600,
+        nonce="n",
+        kid="abc",
+    )
+
+    calls = []
+    dispatch = AsyncPathMapDispatch(
+        {
+            "/jwks": {
+                "body": read_key_file("jwks_public.json"),
+                "headers": {"Cache-Control": "max-age=300"},
+            }
+        }
+    )
+
+    async def app(scope, receive, send):
+        calls.append(scope["path"])
+        await dispatch(scope, receive, send)
+
+    oauth = OAuth()
+    client = oauth.register(
+        "dev",
+        client_id="dev",
+        client_secret="dev",
+        fetch_token=get_bearer_token,
+        jwks_uri="https://i.b/jwks",
+        issuer="https://i.b",
+        client_kwargs={
+            "transport": ASGITransport(app),
+        },
+    )
+    users = await asyncio.gather(
+        *[client.parse_id_token(token, nonce="n") for _ in range(5)]
+    )
+    assert [user.sub for user in users] == ["123"] * 5
+    assert calls == ["/jwks"]
+
+    manager = client.get_jwks_manager()
+    assert manager.expires_at - manager._refreshed_at == pytest.approx(300)
@@ -3,7 +3,15 @@ import unittest
 
 import pytest
 
+from authlib.oauth2.rfc6749 import AuthorizationServer
+from authlib.oauth2.rfc6749 import OAuth2Request
+from authlib.oauth2.rfc6749 import RequestParameters
+from authlib.oauth2.rfc6749 import ResourceProtector
+from authlib.oauth2.rfc6749 import ScopeRegistry
+from authlib.oauth2.rfc6749 import ScopeRequirement
+from authlib.oauth2.rfc6749 import TokenValidator
 from authlib.oauth2.rfc6749 import errors
+from authlib.oauth2.rfc6749 import grants
 from authlib.oauth2.rfc6749 import parameters
 from authlib.oauth2.rfc6749 import util
 
@@ -82,3 +90,157 @@ class OAuth2UtilTest(unittest.TestCase):
 
         text = "Basic {}".format(base64.b64encode(b"a:b").decode())
         assert util.extract_basic_authorization({"Authorization": text}) == ("a", "b")
+
+
+class ScopeRequirementTest(unittest.TestCase):
+    def test_match(self):
+        requirement = ScopeRequirement(["profile email", "user"])
+        assert requirement == ["profile email", "user"]
+        assert requirement.match("email profile")
+        assert requirement.match(["user"])
+        assert not requirement.match("profile")
+        assert not requirement.match("")
+        assert not requirement.match(None)
+
+        requirement = ScopeRequirement("profile email")
+        assert requirement == ["profile email"]
+        assert requirement.match("openid profile email")
+        assert not requirement.match("email")
+
+    def test_match_with_registry(self):
+        registry = ScopeRegistry(["openid", "profile", "email", "user"])
+        requirement = ScopeRequirement(["profile email", "user"], registry)
+        assert requirement.masks == (0b0110, 0b1000)
+        assert requirement.match("email profile")
+        assert requirement.match("unknown user")
+        assert requirement.match(["user"])
+        assert not requirement.match("profile")
+        assert not requirement.match("unknown")
+        assert not requirement.match(None)
+        assert registry.encode("openid email") == 0b0101
+
+        with pytest.raises(ValueError):
+            ScopeRequirement(["profile", "unknown"], registry)
+
+    def test_scope_insufficient(self):
+        validator = TokenValidator()
+        assert not validator.scope_insufficient("profile", None)
+        assert not validator.scope_insufficient("profile", [])
+        assert not validator.scope_insufficient("profile", ["profile", "user"])
+        assert validator.scope_insufficient("profile", ["profile email"])
+        assert validator.scope_insufficient(None, ["profile"])
+
+        requirement = ScopeRequirement(["profile"])
+        assert not validator.scope_insufficient("openid profile", requirement)
+        assert validator.scope_insufficient("openid", requirement)
+
+    def test_compile_requirement(self):
+        protector = ResourceProtector()
+        assert protector.compile_requirement(None) is None
+        assert protector.compile_requirement([]) == []
+
+        requirement = protector.compile_requirement(["profile email"])
+        assert isinstance(requirement, ScopeRequirement)
+        assert requirement.masks is None
+        assert protector.compile_requirement(requirement) is requirement
+
+        registry = ScopeRegistry(["profile", "email"])
+        protector = ResourceProtector(scope_registry=registry)
+        requirement = protector.compile_requirement("profile")
+        assert requirement.registry is registry
+        assert requirement.masks == (0b01,)
+
+
+class OAuth2RequestTest(unittest.TestCase):
+    def test_request_parameters(self):
+        params = RequestParameters([("a", "1"), ("b", "2"), ("a", "3")])
+        assert params["a"] == "3"
+        assert params.get("c") is None
+        assert params.getlist("a") == ["1", "3"]
+        assert params.getlist("c") == []
+        assert params.duplicates == {"a"}
+        assert dict(params) == {"a": "3", "b": "2"}
+        assert params.copy() == {"a": "3", "b": "2"}
+        assert params.to_datalist() == {"a": ["1", "3"], "b": ["2"]}
+        with pytest.raises(TypeError):
+            params["a"] = "4"
+
+    def test_parameters(self):
+        request = OAuth2Request(
+            "POST",
+            "https://i.b/?client_id=a&scope=profile&state=s&state=t",
+            body={"client_id": "b", "redirect_uri": "https://a.b/cb"},
+        )
+        assert type(request.data) is dict
+        assert request.data is request.data
+        assert request.data == {
+            "client_id": "b",
+            "scope": "profile",
+            "state": "t",
+            "redirect_uri": "https://a.b/cb",
+        }
+        assert request.args == {"client_id": "a", "scope": "profile", "state": "t"}
+        assert request.client_id == "b"
+        assert request.scope == "profile"
+        assert request.state == "t"
+        assert request.redirect_uri == "https://a.b/cb"
+        assert request.parameters.duplicates == {"client_id", "state"}
+        assert request.datalist["client_id"] == ["a", "b"]
+        assert request.datalist is request.datalist
+
+    def test_multiple_parameters_of_overridden_datalist(self):
+        class MyRequest(OAuth2Request):
+            @property
+            def datalist(self):
+                return {"state": ["s", "t"]}
+
+        request = MyRequest("GET", "https://i.b/?state=s")
+        with pytest.raises(errors.InvalidRequestError):
+            grants.AuthorizationEndpointMixin.validate_no_multiple_request_parameter(
+                request
+            )
+
+
+class AuthorizationServerTest(unittest.TestCase):
+    def test_grant_dispatch(self):
+        class CustomGrant(grants.BaseGrant, grants.TokenEndpointMixin):
+            @classmethod
+            def check_token_endpoint(cls, request):
+                return request.form.get("custom") == "yes"
+
+        extensions = []
+        server = AuthorizationServer()
+        server.register_grant(grants.AuthorizationCodeGrant, [extensions.append])
+        server.register_grant(CustomGrant)
+        server.register_grant(grants.ClientCredentialsGrant)
+        server.register_grant(grants.ImplicitGrant)
+
+        request = OAuth2Request("GET", "https://i.b/?response_type=code")
+        grant = server.get_authorization_grant(request)
+        assert isinstance(grant, grants.AuthorizationCodeGrant)
+        assert extensions == [grant]
+
+        request = OAuth2Request("GET", "https://i.b/?response_type=token")
+        grant = server.get_authorization_grant(request)
+        assert isinstance(grant, grants.ImplicitGrant)
+
+        request = OAuth2Request("GET", "https://i.b/?response_type=id_token")
+        with pytest.raises(errors.UnsupportedResponseTypeError):
+            server.get_authorization_grant(request)
+
+        body = {"grant_type": "client_credentials"}
+        grant = server.get_token_grant(OAuth2Request("POST", "https://i.b/", body))
+        assert isinstance(grant, grants.ClientCredentialsGrant)
+
+        # the custom grant is registered first
+        body = {"grant_type": "client_credentials", "custom": "yes"}
+        grant = server.get_token_grant(OAuth2Request("POST", "https://i.b/", body))
+        assert isinstance(grant, CustomGrant)
+
+        with pytest.raises(errors.UnsupportedGrantTypeError):
+            server.get_token_grant(OAuth2Request("GET", "https://i.b/", body={}))
+
+        # the token endpoint only accepts POST requests
+        body = {"grant_type": "authorization_code"}
+        with pytest.raises(errors.UnsupportedGrantTypeError):
+            server.get_token_grant(OAuth2Request("GET", "https://i.b/", body))
@@ -1,7 +1,17 @@
+import asyncio
+import threading
+import time
 import unittest
+from unittest import mock
 
 import pytest
 
+from authlib.oauth2.rfc6749 import OAuth2Request
+from authlib.oauth2.rfc6749 import ResourceProtector
+from authlib.oauth2.rfc6750 import InsufficientScopeError
+from authlib.oauth2.rfc6750 import InvalidTokenError
+from authlib.oauth2.rfc7662 import AsyncCachingIntrospectTokenValidator
+from authlib.oauth2.rfc7662 import CachingIntrospectTokenValidator
 from authlib.oauth2.rfc7662 import IntrospectionToken
 
 
@@ -57,3 +67,146 @@ class IntrospectionTokenTest(unittest.TestCase):
         token = IntrospectionToken()
         with pytest.raises(AttributeError):
             token.invalid  # noqa:B018
+
+
+class CountingValidator(CachingIntrospectTokenValidator):
+    def __init__(self, tokens):
+        super().__init__()
+        self.tokens = tokens
+        self.calls = []
+
+    def introspect_token(self, token_string):
+        self.calls.append(token_string)
+        time.sleep(0.05)
+        return self.tokens[token_string]
+
+
+class CachingIntrospectTokenValidatorTest(unittest.TestCase):
+    def test_cache_active_and_inactive_tokens(self):
+        now = time.time()
+        validator = CountingValidator(
+            {
+                "a": {"active": True, "exp": now + 3600},
+                "b": {"active": False},
+                "c": {"active": True, "exp": now - 1},
+            }
+        )
+        for _ in range(2):
+            assert validator.authenticate_token("a")["active"]
+            assert not validator.authenticate_token("b")["active"]
+            assert validator.authenticate_token("c")["active"]
+        assert validator.calls == ["a", "b", "c", "c"]
+        assert validator.cache.hits == 2
+
+        with mock.patch("time.time", return_value=now + 20):
+            validator.authenticate_token("a")
+            validator.authenticate_token("b")
+        assert validator.calls == ["a", "b", "c", "c", "b"]
+
+        with mock.patch("time.time", return_value=now + 400):
+            validator.authenticate_token("a")
+        assert validator.calls[-1] == "a"
+
+    def test_coalesce_concurrent_introspections(self):
+        validator = CountingValidator({"a": {"active": True}})
+        threads = [
+            threading.Thread(target=validator.authenticate_token, args=("a",))
+            for _ in range(5)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert validator.calls == ["a"]
+
+    def test_cached_tokens_are_copies(self):
+        validator = CountingValidator({"a": {"active": True, "scope": "profile"}})
+        token = validator.authenticate_token("a")
+        token["scope"] = "admin"
+        assert validator.authenticate_token("a")["scope"] == "profile"
+        assert validator.authenticate_token("a") is not validator.authenticate_token(
+            "a"
+        )
+        assert validator.calls == ["a"]
+
+
+@pytest.mark.asyncio
+async def test_async_caching_introspect_token_validator():
+    calls = []
+
+    class MyValidator(AsyncCachingIntrospectTokenValidator):
+        async def introspect_token(self, token_string):
+            calls.append(token_string)
+            await asyncio.sleep(0.01)
+            if token_string == "error":
+                raise ValueError(token_string)
+            return {"active": True}
+
+    validator = MyValidator()
+    results = await asyncio.gather(
+        *[validator.authenticate_token("a") for _ in range(5)]
+    )
+    assert results == [{"active": True}] * 5
+    assert await validator.authenticate_token("a") == {"active": True}
+    assert calls == ["a"]
+
+    results = await asyncio.gather(
+        validator.authenticate_token("error"),
+        validator.authenticate_token("error"),
+        return_exceptions=True,
+    )
+    assert all(isinstance(e, ValueError) for e in results)
+    assert calls == ["a", "error"]
+
+
+@pytest.mark.asyncio
+async def test_async_caching_validator_cancelled_owner():
+    calls = []
+
+    class MyValidator(AsyncCachingIntrospectTokenValidator):
+        async def introspect_token(self, token_string):
+            calls.append(token_string)
+            await asyncio.sleep(0.05)
+            return {"active": True}
+
+    validator = MyValidator()
+    owner = asyncio.ensure_future(validator.authenticate_token("a"))
+    await asyncio.sleep(0)
+    waiter = asyncio.ensure_future(validator.authenticate_token("a"))
+    await asyncio.sleep(0)
+    owner.cancel()
+
+    assert await waiter == {"active": True}
+    assert owner.cancelled()
+    assert calls == ["a", "a"]
+    assert validator._pending == {}
+
+
+class AsyncValidator(AsyncCachingIntrospectTokenValidator):
+    async def introspect_token(self, token_string):
+        return {"active": token_string == "a", "scope": "profile"}
+
+
+def _bearer_request(token_string):
+    return OAuth2Request(
+        "GET", "https://i.b/", headers={"Authorization": f"Bearer {token_string}"}
+    )
+
+
+@pytest.mark.asyncio
+async def test_async_caching_validator_through_protector():
+    protector = ResourceProtector()
+    protector.register_token_validator(AsyncValidator())
+
+    token = await protector.validate_request_async(["profile"], _bearer_request("a"))
+    assert token == {"active": True, "scope": "profile"}
+    token["scope"] = "admin"
+    token = await protector.validate_request_async(["profile"], _bearer_request("a"))
+    assert token["scope"] == "profile"
+
+    with pytest.raises(InsufficientScopeError):
+        await protector.validate_request_async(["admin"], _bearer_request("a"))
+    with pytest.raises(InvalidTokenError):
+        await protector.validate_request_async(["profile"], _bearer_request("b"))
+    with pytest.raises(RuntimeError):
+        protector.validate_request(["profile"], _bearer_request("a"))
@@ -2,6 +2,7 @@ import unittest
 
 import pytest
 
+from authlib.jose import ClaimsOptions
 from authlib.jose.errors import InvalidClaimError
 from authlib.jose.errors import MissingClaimError
 from authlib.oidc.core import CodeIDToken
@@ -21,6 +22,19 @@ class IDTokenTest(unittest.TestCase):
         )
         claims.validate(1000)
 
+    def test_claims_options(self):
+        options = ClaimsOptions({"iss": {"values": ["1"]}, "aud": {"value": "1"}})
+        payload = {"iss": "1", "sub": "1", "aud": "1", "exp": 10000, "iat": 100}
+        claims = CodeIDToken(payload, {}, options=options)
+        claims.validate(1000)
+
+        claims = ImplicitIDToken(dict(payload, nonce="a"), {}, options=options)
+        claims.validate(1000)
+
+        claims = CodeIDToken(dict(payload, iss="2"), {}, options=options)
+        with pytest.raises(InvalidClaimError):
+            claims.validate(1000)
+
     def test_validate_auth_time(self):
         claims = CodeIDToken(
             {"iss": "1", "sub": "1", "aud": "1", "exp": 10000, "iat": 100}, {}
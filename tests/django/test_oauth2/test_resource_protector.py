@@ -4,6 +4,7 @@ from django.http import JsonResponse
 
 from authlib.integrations.django_oauth2 import BearerTokenValidator
 from authlib.integrations.django_oauth2 import ResourceProtector
+from authlib.oauth2.rfc6749 import ScopeRegistry
 
 from .models import Client
 from .models import OAuth2Token
@@ -135,3 +136,30 @@ class ResourceProtectorTest(TestCase):
         assert resp.status_code == 200
         data = json.loads(resp.content)
         assert data["username"] == "foo"
+
+    def test_scope_registry(self):
+        self.prepare_data(scope="profile unknown")
+        registry = ScopeRegistry(["profile", "email"])
+        protector = ResourceProtector(scope_registry=registry)
+        protector.register_token_validator(BearerTokenValidator(OAuth2Token))
+
+        @protector(["profile email"])
+        def operator_and(request):
+            user = request.oauth_token.user
+            return JsonResponse(dict(sub=user.pk, username=user.username))
+
+        @protector(["profile", "email"])
+        def operator_or(request):
+            user = request.oauth_token.user
+            return JsonResponse(dict(sub=user.pk, username=user.username))
+
+        request = self.factory.get("/user", HTTP_AUTHORIZATION="bearer a1")
+        resp = operator_and(request)
+        assert resp.status_code == 403
+        data = json.loads(resp.content)
+        assert data["error"] == "insufficient_scope"
+
+        resp = operator_or(request)
+        assert resp.status_code == 200
+        data = json.loads(resp.content)
+        assert data["username"] == "foo"
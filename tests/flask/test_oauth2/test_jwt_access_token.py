@@ -1,4 +1,5 @@
 import time
+from unittest import mock
 
 import pytest
 from flask import json
@@ -19,6 +20,8 @@ from authlib.oauth2.rfc9068 import JWTBearerTokenGenerator
 from authlib.oauth2.rfc9068 import JWTBearerTokenValidator
 from authlib.oauth2.rfc9068 import JWTIntrospectionEndpoint
 from authlib.oauth2.rfc9068 import JWTRevocationEndpoint
+from authlib.oauth2.rfc9068 import SigningKeyManager
+from authlib.oauth2.rfc9068 import VerifiedClaimsCache
 from tests.util import read_file_path
 
 from .models import Client
@@ -393,6 +396,87 @@ class JWTAccessTokenGenerationTest(TestCase):
         assert claims["amr"] == "amr"
         assert claims["acr"] == "acr"
 
+    def test_signing_key_manager(self):
+        kid = "bilbo.baggins@hobbiton.example"
+        signing_keys = SigningKeyManager(
+            self.jwks, strategy="round_robin", header={"typ": "at+jwt"}
+        )
+        assert signing_keys.kids == ["abc", kid]
+
+        tokens = [signing_keys.sign({"n": i}) for i in range(4)]
+        headers = [jwt.decode(token, self.jwks).header for token in tokens]
+        assert [h["kid"] for h in headers] == ["abc", kid, "abc", kid]
+        assert headers[0] == {"alg": "RS256", "typ": "at+jwt", "kid": "abc"}
+
+        # a key with weight 0 is published but not used to sign
+        signing_keys.rotate(self.jwks, weights={"abc": 0})
+        assert signing_keys.kids == [kid]
+        with pytest.raises(ValueError):
+            signing_keys.rotate(read_file_path("jwks_public.json"))
+        assert signing_keys.kids == [kid]
+
+        with pytest.raises(ValueError):
+            SigningKeyManager(self.jwks, alg="ES256")
+        with pytest.raises(ValueError):
+            SigningKeyManager(self.jwks, strategy="unknown")
+
+    def test_reload_signing_keys(self):
+        jwks = {"keys": self.jwks["keys"][:1]}
+        calls = []
+
+        def get_jwks():
+            calls.append(1)
+            return jwks
+
+        self.token_generator.get_jwks = get_jwks
+        for _ in range(2):
+            token = self.token_generator.access_token_generator(
+                self.oauth_client, "authorization_code", self.user, "profile"
+            )
+            assert jwt.decode(token, self.jwks).header["kid"] == "abc"
+        assert len(calls) == 1
+
+        # rotate the keys once the loaded JWK set expires
+        jwks = {"keys": self.jwks["keys"][1:]}
+        self.token_generator.signing_keys_expires_in = 0
+        self.token_generator._signing_keys_expires_at = 0
+        token = self.token_generator.access_token_generator(
+            self.oauth_client, "authorization_code", self.user, "profile"
+        )
+        header = jwt.decode(token, self.jwks).header
+        assert header["kid"] == "bilbo.baggins@hobbiton.example"
+        assert len(calls) == 2
+
+    def test_generate_many(self):
+        tokens = self.token_generator.generate_many(
+            "authorization_code",
+            self.oauth_client,
+            [(self.user, "profile"), (None, "profile"), (self.user, "invalid")],
+            include_refresh_token=False,
+        )
+        assert len(tokens) == 3
+        claims = [jwt.decode(t["access_token"], self.jwks) for t in tokens]
+        assert claims[0]["sub"] == self.user.id
+        assert claims[1]["sub"] == self.oauth_client.client_id
+        assert claims[0]["iat"] == claims[1]["iat"]
+        assert tokens[0]["scope"] == "profile"
+        assert tokens[0]["expires_in"] == 864000
+        assert "scope" not in tokens[2]
+        assert claims[2]["scope"] == ""
+
+    def test_signing_key_manager_typ(self):
+        signing_keys = SigningKeyManager(self.jwks, header={"x": "y"})
+        token_generator = JWTBearerTokenGenerator(
+            issuer=self.issuer, signing_keys=signing_keys
+        )
+        assert signing_keys.header == {"x": "y", "typ": "at+jwt"}
+        token = token_generator.access_token_generator(
+            self.oauth_client, "authorization_code", self.user, "profile"
+        )
+        header = jwt.decode(token, self.jwks).header
+        assert header["typ"] == "at+jwt"
+        assert header["x"] == "y"
+
 
 class JWTAccessTokenResourceServerTest(TestCase):
     def setUp(self):
@@ -521,6 +605,65 @@ class JWTAccessTokenResourceServerTest(TestCase):
         resp = json.loads(rv.data)
         assert resp["error"] == "invalid_token"
 
+    def test_claims_cache(self):
+        cache = VerifiedClaimsCache(maxsize=2, ttl=60)
+        self.token_validator.claims_cache = cache
+        headers = {"Authorization": f"Bearer {self.access_token}"}
+        rv = self.client.get("/protected", headers=headers)
+        assert json.loads(rv.data)["username"] == "foo"
+        assert cache.misses == 1
+
+        with mock.patch.object(self.token_validator, "get_jwks") as get_jwks:
+            rv = self.client.get("/protected", headers=headers)
+            assert json.loads(rv.data)["username"] == "foo"
+            assert not get_jwks.called
+        assert cache.hits == 1
+
+        # claims are still validated for cached tokens
+        self.token_validator.issuer = "https://other.example.org/"
+        rv = self.client.get("/protected", headers=headers)
+        assert json.loads(rv.data)["error"] == "invalid_token"
+        assert cache.hits == 2
+
+    def test_change_resource_server(self):
+        headers = {"Authorization": f"Bearer {self.access_token}"}
+        options = self.token_validator.claims_options
+        assert self.token_validator.claims_options is options
+
+        self.token_validator.resource_server = "other-resource-server"
+        rv = self.client.get("/protected", headers=headers)
+        assert json.loads(rv.data)["error"] == "invalid_token"
+
+        self.token_validator.resource_server = self.resource_server
+        rv = self.client.get("/protected", headers=headers)
+        assert json.loads(rv.data)["username"] == "foo"
+
+    def test_claims_cache_expiration(self):
+        cache = VerifiedClaimsCache(ttl=60)
+        cache.set("a", {"alg": "RS256"}, {"exp": time.time() - 1})
+        assert cache.get("a") is None
+        assert cache.misses == 1
+        assert cache.hits == 0
+        cache.set("b", {"alg": "RS256"}, {})
+        assert len(cache) == 0
+
+        cache.set("c", {"alg": "RS256"}, {"exp": time.time() + 3600})
+        assert cache.get("c") == ({"alg": "RS256"}, {"exp": mock.ANY})
+        with mock.patch("time.time", return_value=time.time() + 61):
+            assert cache.get("c") is None
+        assert len(cache) == 0
+
+    def test_claims_cache_nested_claims(self):
+        cache = VerifiedClaimsCache(ttl=60)
+        payload = {"exp": time.time() + 3600, "groups": ["admins"]}
+        cache.set("a", {"alg": "RS256"}, payload)
+        payload["groups"].append("users")
+
+        header, cached = cache.get("a")
+        assert cached["groups"] == ["admins"]
+        cached["groups"].append("users")
+        assert cache.get("a")[1]["groups"] == ["admins"]
+
     def test_scope_restriction(self):
         """If an authorization request includes a scope parameter, the corresponding
         issued JWT access token SHOULD include a 'scope' claim as defined in Section
@@ -640,9 +783,9 @@ class JWTAccessTokenIntrospectionTest(TestCase):
         assert resp["iss"] == self.issuer
 
     def test_introspection_username(self):
-        self.introspection_endpoint.get_username = lambda user_id: db.session.get(
-            User, user_id
-        ).username
+        self.introspection_endpoint.get_username = lambda user_id: (
+            db.session.get(User, user_id).username
+        )
 
         headers = self.create_basic_header(
             self.oauth_client.client_id, self.oauth_client.client_secret
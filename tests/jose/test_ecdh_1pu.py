@@ -1,5 +1,8 @@
+import multiprocessing
 import unittest
 from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import ThreadPoolExecutor
 
 import pytest
 from cryptography.hazmat.primitives.keywrap import InvalidUnwrap
@@ -10,8 +13,10 @@ from authlib.common.encoding import to_bytes
 from authlib.common.encoding import urlsafe_b64decode
 from authlib.common.encoding import urlsafe_b64encode
 from authlib.jose import ECKey
+from authlib.jose import EphemeralKeyPool
 from authlib.jose import JsonWebEncryption
 from authlib.jose import OKPKey
+from authlib.jose.drafts import ECDH1PUAlgorithm
 from authlib.jose.drafts import register_jwe_draft
 from authlib.jose.errors import InvalidAlgorithmForMultipleRecipientsMode
 from authlib.jose.errors import InvalidEncryptionAlgorithmForECDH1PUWithKeyWrappingError
@@ -536,6 +541,57 @@ class ECDH1PUTest(unittest.TestCase):
         rv = jwe.deserialize_json(data, bob_key, sender_key=alice_key)
         assert rv["payload"] == b"hello"
 
+    def test_ecdh_1pu_with_ephemeral_key_pool(self):
+        jwe = JsonWebEncryption()
+        alice_key = OKPKey.generate_key("X25519", is_private=True)
+        bob_key = OKPKey.generate_key("X25519", is_private=True)
+        pool = EphemeralKeyPool(size=2)
+        pool.fill(OKPKey, "X25519")
+
+        ECDH1PUAlgorithm.EPHEMERAL_KEY_POOL = pool
+        try:
+            for alg, enc in [
+                ("ECDH-1PU", "A128GCM"),
+                ("ECDH-1PU+A128KW", "A128CBC-HS256"),
+            ]:
+                protected = {"alg": alg, "enc": enc}
+                data = jwe.serialize_compact(
+                    protected, b"hello", bob_key, sender_key=alice_key
+                )
+                rv = jwe.deserialize_compact(data, bob_key, sender_key=alice_key)
+                assert rv["payload"] == b"hello"
+        finally:
+            ECDH1PUAlgorithm.EPHEMERAL_KEY_POOL = None
+        assert pool.hits == 2
+
+    def test_ecdh_1pu_json_with_executor(self):
+        jwe = JsonWebEncryption()
+        alice_key = OKPKey.generate_key("X25519", is_private=True)
+        keys = [OKPKey.generate_key("X25519", is_private=True) for _ in range(3)]
+        header_obj = {"protected": {"alg": "ECDH-1PU+A128KW", "enc": "A128CBC-HS256"}}
+        executors = [
+            ThreadPoolExecutor(max_workers=2),
+            ProcessPoolExecutor(max_workers=2),
+            # the draft algorithms are not registered in spawned workers
+            ProcessPoolExecutor(
+                max_workers=2, mp_context=multiprocessing.get_context("spawn")
+            ),
+        ]
+        for executor in executors:
+            with executor:
+                data = jwe.serialize_json(
+                    header_obj,
+                    b"hello",
+                    keys,
+                    sender_key=alice_key,
+                    executor=executor,
+                )
+                for key in keys:
+                    rv = jwe.deserialize_json(
+                        data, key, sender_key=alice_key, executor=executor
+                    )
+                    assert rv["payload"] == b"hello"
+
     def test_ecdh_1pu_jwe_in_key_agreement_with_key_wrapping_mode(self):
         jwe = JsonWebEncryption()
         alice_key = {
@@ -1,6 +1,11 @@
+import io
 import json
 import os
 import unittest
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
 
 import pytest
 from cryptography.exceptions import InvalidTag
@@ -9,10 +14,16 @@ from cryptography.hazmat.primitives.keywrap import InvalidUnwrap
 from authlib.common.encoding import json_b64encode
 from authlib.common.encoding import to_bytes
 from authlib.common.encoding import to_unicode
+from authlib.common.encoding import urlsafe_b64decode
 from authlib.common.encoding import urlsafe_b64encode
+from authlib.jose import ECDHESAlgorithm
+from authlib.jose import ECKey
+from authlib.jose import EphemeralKeyPool
+from authlib.jose import HeaderCache
 from authlib.jose import JsonWebEncryption
 from authlib.jose import OctKey
 from authlib.jose import OKPKey
+from authlib.jose import RSAKey
 from authlib.jose import errors
 from authlib.jose.drafts import register_jwe_draft
 from authlib.jose.errors import DecodeError
@@ -165,6 +176,102 @@ class JWETest(unittest.TestCase):
         with pytest.raises(ValueError):
             jwe.deserialize_compact(data, bob_key, sender_key=alice_key)
 
+    @pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+    def test_ephemeral_key_pool_after_fork(self):
+        pool = EphemeralKeyPool(size=2)
+        pool.fill(ECKey, "P-256")
+        assert len(pool) == 2
+
+        # fork while the parent is refilling the pool
+        with pool._lock:
+            pid = os.fork()
+            if pid == 0:
+                # the child process never hands out the parent's keys
+                code = 0 if len(pool) == 0 and not pool._lock.locked() else 1
+                os._exit(code)
+        _, status = os.waitpid(pid, 0)
+        assert os.waitstatus_to_exitcode(status) == 0
+        assert len(pool) == 2
+
+    def test_ephemeral_key_pool(self):
+        pool = EphemeralKeyPool(size=4, refill_threshold=1)
+        key = ECKey.generate_key("P-256", is_private=True)
+        jwe = JsonWebEncryption()
+
+        pool.fill(ECKey, "P-256")
+        assert len(pool) == 4
+        ECDHESAlgorithm.EPHEMERAL_KEY_POOL = pool
+        try:
+            epks = set()
+            for _ in range(3):
+                protected = {"alg": "ECDH-ES+A128KW", "enc": "A128GCM"}
+                data = jwe.serialize_compact(protected, b"hello", key)
+                rv = jwe.deserialize_compact(data, key)
+                assert rv["payload"] == b"hello"
+                epks.add(rv["header"]["epk"]["x"])
+            # every ephemeral key is used once
+            assert len(epks) == 3
+            assert pool.hits == 3
+            assert pool.misses == 0
+        finally:
+            ECDHESAlgorithm.EPHEMERAL_KEY_POOL = None
+
+        # wait for the background refill
+        with pool._lock:
+            assert len(pool) == 4
+
+        pool.clear()
+        assert len(pool) == 0
+        epk = pool.get(OKPKey, "X25519")
+        assert epk.kty == "OKP"
+        assert pool.misses == 1
+        with pool._lock:
+            assert len(pool) == 8
+
+        with pytest.raises(ValueError):
+            EphemeralKeyPool(size=0)
+
+    def test_ephemeral_key_pool_counters(self):
+        pool = EphemeralKeyPool(size=8)
+        pool.fill(OKPKey, "X25519")
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            keys = list(executor.map(lambda _: pool.get(OKPKey, "X25519"), range(40)))
+        assert len({key.as_dict()["x"] for key in keys}) == 40
+        assert pool.hits + pool.misses == 40
+
+    def test_json_with_executor(self):
+        jwe = JsonWebEncryption()
+        cases = [
+            ("RSA-OAEP", RSAKey, 2048),
+            ("ECDH-ES+A128KW", ECKey, "P-256"),
+        ]
+        for alg, key_cls, crv_or_size in cases:
+            keys = [key_cls.generate_key(crv_or_size, is_private=True) for _ in "abc"]
+            other_key = key_cls.generate_key(crv_or_size, is_private=True)
+            header_obj = {
+                "protected": {"alg": alg, "enc": "A128GCM"},
+                "recipients": [{"header": {"kid": kid}} for kid in "abc"],
+            }
+            public_keys = [k.get_public_key() for k in keys]
+            data = jwe.serialize_json(header_obj, b"hello", public_keys)
+            # the error of the last recipient is raised
+            with pytest.raises(Exception) as exc_info:
+                jwe.deserialize_json(data, other_key)
+            error_cls = type(exc_info.value)
+
+            for executor_cls in (ThreadPoolExecutor, ProcessPoolExecutor):
+                with executor_cls(max_workers=2) as executor:
+                    data = jwe.serialize_json(
+                        header_obj, b"hello", public_keys, executor=executor
+                    )
+                    kids = [r["header"]["kid"] for r in data["recipients"]]
+                    assert kids == ["a", "b", "c"]
+                    for key in keys:
+                        rv = jwe.deserialize_json(data, key, executor=executor)
+                        assert rv["payload"] == b"hello"
+                    with pytest.raises(error_cls):
+                        jwe.deserialize_json(data, other_key, executor=executor)
+
     def test_compact_rsa(self):
         jwe = JsonWebEncryption()
         s = jwe.serialize_compact(
@@ -209,6 +316,142 @@ class JWETest(unittest.TestCase):
                 rv = jwe.deserialize_compact(data, key)
                 assert rv["payload"] == b"hello"
 
+    def test_header_cache(self):
+        jwe = JsonWebEncryption()
+        jwe.HEADER_CACHE = cache = HeaderCache()
+        key = OctKey.generate_key(128, is_private=True)
+        protected = {"alg": "A128KW", "enc": "A128GCM", "zip": "DEF"}
+        data = jwe.serialize_compact(protected, b"hello", key)
+        for _ in range(2):
+            rv = jwe.deserialize_compact(data, key)
+            assert rv["payload"] == b"hello"
+            assert rv["header"] == protected
+            rv["header"]["zip"] = "x"
+        assert len(cache) == 1
+
+        strict = JsonWebEncryption(algorithms=["A128KW", "A128GCM"])
+        strict.HEADER_CACHE = cache
+        with pytest.raises(errors.UnsupportedCompressionAlgorithmError):
+            strict.deserialize_compact(data, key)
+
+    def test_compact_stream(self):
+        jwe = JsonWebEncryption()
+        public_key = read_file_path("rsa_public.pem")
+        private_key = read_file_path("rsa_private.pem")
+        payload = os.urandom(5000) + b"a" * 5000
+        for enc in ["A128CBC-HS256", "A256CBC-HS512", "A128GCM", "A256GCM"]:
+            for zip_alg in (None, "DEF"):
+                protected = {"alg": "RSA-OAEP", "enc": enc}
+                if zip_alg:
+                    protected["zip"] = zip_alg
+                out = io.BytesIO()
+                header = jwe.serialize_compact_stream(
+                    protected, io.BytesIO(payload), public_key, out, chunk_size=1000
+                )
+                assert header == protected
+                data = out.getvalue()
+                rv = jwe.deserialize_compact(data, private_key)
+                assert rv["payload"] == payload
+
+                out = io.BytesIO()
+                chunks = [data[i : i + 333] for i in range(0, len(data), 333)]
+                header = jwe.deserialize_compact_stream(
+                    chunks, private_key, out, chunk_size=100
+                )
+                assert header == protected
+                assert out.getvalue() == payload
+
+                data = jwe.serialize_compact(protected, payload, public_key)
+                out = io.BytesIO()
+                jwe.deserialize_compact_stream(
+                    io.BytesIO(data + b"\n"), private_key, out
+                )
+                assert out.getvalue() == payload
+
+    def test_compact_stream_max_size(self):
+        jwe = JsonWebEncryption()
+        key = OctKey.generate_key(128, is_private=True)
+        for protected in (
+            {"alg": "A128KW", "enc": "A128GCM"},
+            {"alg": "A128KW", "enc": "A128GCM", "zip": "DEF"},
+        ):
+            data = jwe.serialize_compact(protected, b"a" * 100000, key)
+            out = io.BytesIO()
+            jwe.deserialize_compact_stream(data, key, out, max_size=100000)
+            assert len(out.getvalue()) == 100000
+            with pytest.raises(errors.ExceededSizeError):
+                jwe.deserialize_compact_stream(data, key, io.BytesIO(), max_size=99999)
+
+    def test_compact_stream_invalid_data(self):
+        jwe = JsonWebEncryption()
+        key = OctKey.generate_key(128, is_private=True)
+        protected = {"alg": "A128KW", "enc": "A128CBC-HS256"}
+        out = io.BytesIO()
+        jwe.serialize_compact_stream(protected, [b"hello", b"world"], key, out)
+        data = out.getvalue()
+        assert jwe.deserialize_compact(data, key)["payload"] == b"helloworld"
+
+        with pytest.raises(InvalidTag):
+            jwe.deserialize_compact_stream(data[:-2] + b"AA", key, io.BytesIO())
+        with pytest.raises(errors.DecodeError):
+            jwe.deserialize_compact_stream(data.rsplit(b".", 1)[0], key, io.BytesIO())
+        with pytest.raises(errors.DecodeError):
+            jwe.deserialize_compact_stream(data + b".a", key, io.BytesIO())
+
+    def test_compact_stream_invalid_deflate(self):
+        jwe = JsonWebEncryption()
+        key = OctKey.generate_key(128, is_private=True)
+        protected = {"alg": "A128KW", "enc": "A128GCM", "zip": "DEF"}
+        data = jwe.serialize_compact(protected, os.urandom(2000), key)
+        header_s, ek_s, iv_s, ciphertext_s, tag_s = data.split(b".")
+        ciphertext = bytearray(urlsafe_b64decode(ciphertext_s))
+        # forged ciphertext is rejected by the tag, never by the decompression
+        for i in range(0, len(ciphertext), 50):
+            forged = bytearray(ciphertext)
+            forged[i] ^= 0xFF
+            forged_s = urlsafe_b64encode(bytes(forged))
+            forged_data = b".".join([header_s, ek_s, iv_s, forged_s, tag_s])
+            with pytest.raises(InvalidTag):
+                jwe.deserialize_compact_stream(forged_data, key, io.BytesIO())
+
+        # authenticated data which is not DEFLATE
+        zip_alg = JsonWebEncryption.ZIP_REGISTRY["DEF"]
+        with mock.patch.object(zip_alg, "compress", lambda s: b"invalid"):
+            data = jwe.serialize_compact(protected, b"hello", key)
+        with pytest.raises(errors.DecodeError):
+            jwe.deserialize_compact_stream(data, key, io.BytesIO())
+        with pytest.raises(errors.DecodeError):
+            jwe.deserialize_compact(data, key)
+
+        with mock.patch.object(zip_alg, "compress", lambda s: zlib.compress(s)[2:-8]):
+            data = jwe.serialize_compact(protected, b"hello" * 100, key)
+        with pytest.raises(errors.DecodeError):
+            jwe.deserialize_compact_stream(data, key, io.BytesIO())
+
+    def test_compact_stream_ecdh_1pu(self):
+        jwe = JsonWebEncryption()
+        alice_key = OKPKey.generate_key("X25519", is_private=True)
+        bob_key = OKPKey.generate_key("X25519", is_private=True)
+
+        protected = {"alg": "ECDH-1PU", "enc": "A128GCM"}
+        out = io.BytesIO()
+        jwe.serialize_compact_stream(
+            protected, b"hello", bob_key, out, sender_key=alice_key
+        )
+        rv = jwe.deserialize_compact(out.getvalue(), bob_key, sender_key=alice_key)
+        assert rv["payload"] == b"hello"
+
+        protected = {"alg": "ECDH-1PU+A128KW", "enc": "A128CBC-HS256"}
+        with pytest.raises(ValueError):
+            jwe.serialize_compact_stream(
+                protected, b"hello", bob_key, io.BytesIO(), sender_key=alice_key
+            )
+        data = jwe.serialize_compact(protected, b"hello", bob_key, sender_key=alice_key)
+        with pytest.raises(ValueError):
+            jwe.deserialize_compact_stream(
+                data, bob_key, io.BytesIO(), sender_key=alice_key
+            )
+
     def test_aes_jwe_invalid_key(self):
         jwe = JsonWebEncryption()
         protected = {"alg": "A128KW", "enc": "A128GCM"}
@@ -10,6 +10,7 @@ from authlib.jose import KeySet
 from authlib.jose import OctKey
 from authlib.jose import OKPKey
 from authlib.jose import RSAKey
+from authlib.jose import errors
 from tests.util import read_file_path
 
 
@@ -46,6 +47,32 @@ class OctKeyTest(unittest.TestCase):
         key2 = OctKey.import_key(key, {"use": "sig"})
         assert "use" in key2.as_dict()
 
+    def test_key_tokens_follow_options(self):
+        key = OctKey.generate_key(options={"kid": "a"})
+        assert key.kid == "a"
+        key.options["kid"] = "b"
+        assert key.kid == "b"
+        key.options.pop("kid")
+        assert key.kid is None
+
+        # the options dict of the caller is kept
+        options = {"kid": "d", "key_ops": ["sign"]}
+        key.options = options
+        assert key.options is options
+        options["kid"] = "e"
+        assert key.kid == "e"
+        options["key_ops"].append("verify")
+        assert key["key_ops"] == ["sign", "verify"]
+
+        key.options = {"use": "enc"}
+        with pytest.raises(errors.InvalidUseError):
+            key.get_op_key("sign")
+
+        # tokens is a copy of the JWK parameters
+        key.tokens["kid"] = "c"
+        assert key.kid is None
+        assert not hasattr(key, "__dict__")
+
 
 class RSAKeyTest(unittest.TestCase):
     def test_import_ssh_pem(self):
@@ -263,6 +290,49 @@ class JWKTest(unittest.TestCase):
         with pytest.raises(ValueError):
             JsonWebKey.import_key_set("invalid")
 
+    def test_key_set_find_by_kid(self):
+        keys = [
+            RSAKey.generate_key(options={"kid": "a", "use": "sig"}),
+            ECKey.generate_key(options={"kid": "b", "alg": "ES256"}),
+            RSAKey.generate_key(options={"kid": "c", "use": "enc"}),
+        ]
+        key_set = JsonWebKey.import_key_set({"keys": [k.as_dict() for k in keys]})
+        assert key_set.find_by_kid("b").kty == "EC"
+        assert key_set.find_by_kid("c")["use"] == "enc"
+        with pytest.raises(ValueError):
+            key_set.find_by_kid("d")
+        with pytest.raises(ValueError):
+            key_set.find_by_kid(None)
+
+        # the index is rebuilt when keys are added
+        key_set.keys.append(OctKey.generate_key(options={"kid": "d"}))
+        assert key_set.find_by_kid("d").kty == "oct"
+
+        # or when keys is assigned, e.g. after replacing a key in place
+        key_set.keys[3] = OctKey.generate_key(options={"kid": "e"})
+        key_set.keys = key_set.keys
+        assert key_set.find_by_kid("e").kty == "oct"
+        with pytest.raises(ValueError):
+            key_set.find_by_kid("d")
+        key_set.keys = key_set.keys[:3] + [OctKey.generate_key(options={"kid": "d"})]
+        assert key_set.find_by_kid("d").kty == "oct"
+        with pytest.raises(ValueError):
+            key_set.find_by_kid("e")
+
+        # the key set keeps the given list
+        oct_keys = [OctKey.generate_key(options={"kid": "a"})]
+        oct_set = KeySet(oct_keys)
+        oct_keys.append(OctKey.generate_key(options={"kid": "b"}))
+        assert oct_set.find_by_kid("b") is oct_keys[1]
+
+        rsa_keys = key_set.find_keys("RSA", "RS256", "sig")
+        assert [k.kid for k in rsa_keys] == ["a"]
+        rsa_keys = key_set.find_keys("RSA")
+        assert [k.kid for k in rsa_keys] == ["a", "c"]
+        ec_keys = key_set.find_keys("EC", "ES256", "sig")
+        assert [k.kid for k in ec_keys] == ["b"]
+        assert key_set.find_keys("EC", "ES384") == []
+
     def test_thumbprint(self):
         # https://tools.ietf.org/html/rfc7638#section-3.1
         data = read_file_path("thumbprint_example.json")
@@ -1,10 +1,22 @@
+import io
 import json
 import unittest
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import ThreadPoolExecutor
 
 import pytest
 
+from authlib.common.encoding import to_bytes
+from authlib.jose import HeaderCache
+from authlib.jose import JsonWebKey
 from authlib.jose import JsonWebSignature
+from authlib.jose import JsonWebToken
+from authlib.jose import OctKey
+from authlib.jose import PreparedKeyCache
+from authlib.jose import RSAKey
+from authlib.jose import SigningPool
 from authlib.jose import errors
+from authlib.jose.rfc7518.jws_algs import HMACAlgorithm
 from tests.util import read_file_path
 
 
@@ -186,6 +198,13 @@ class JWSTest(unittest.TestCase):
         with pytest.raises(errors.DecodeError):
             jws.deserialize_json(s, "")
 
+        # empty signatures
+        s = {"payload": "aGVsbG8", "signatures": []}
+        with pytest.raises(errors.DecodeError):
+            jws.deserialize_json(s, "secret")
+        with pytest.raises(ValueError):
+            jws.serialize_json([], b"hello", "secret")
+
     def test_validate_header(self):
         jws = JsonWebSignature(private_headers=[])
         protected = {"alg": "HS256", "invalid": "k"}
@@ -225,3 +244,449 @@ class JWSTest(unittest.TestCase):
         header, payload = data["header"], data["payload"]
         assert payload == b"hello"
         assert header["alg"] == "ES256K"
+
+    def test_prepared_key_cache(self):
+        cache = PreparedKeyCache(maxsize=2)
+        jws = JsonWebSignature(key_cache=cache)
+        private_key = read_file_path("rsa_private.pem")
+        public_key = read_file_path("rsa_public.pem")
+        s = jws.serialize({"alg": "RS256"}, "hello", private_key)
+        assert cache.misses == 1
+
+        for _ in range(3):
+            data = jws.deserialize(s, public_key)
+            assert data["payload"] == b"hello"
+        assert cache.misses == 2
+        assert cache.hits == 2
+
+        # algorithm is a part of the cache key
+        s = jws.serialize({"alg": "RS384"}, "hello", private_key)
+        jws.deserialize(s, public_key)
+        assert cache.misses == 4
+        assert len(cache) == 2
+
+        cache.clear()
+        assert len(cache) == 0
+        assert cache.hits == 0
+
+    def test_prepared_key_cache_dict_key(self):
+        cache = PreparedKeyCache()
+        jws = JsonWebSignature(key_cache=cache)
+        private_key = read_file_path("jwk_private.json")
+        public_key = read_file_path("jwk_public.json")
+        s = jws.serialize({"alg": "RS256"}, "hello", private_key)
+        jws.deserialize(s, public_key)
+        jws.deserialize(s, dict(public_key))
+        assert cache.hits == 1
+        assert cache.misses == 2
+
+    def test_verify_many(self):
+        jws = JsonWebSignature()
+        private_key = read_file_path("rsa_private.pem")
+        public_key = read_file_path("rsa_public.pem")
+        s1 = jws.serialize_compact({"alg": "RS256"}, "a", private_key)
+        s2 = jws.serialize_compact({"alg": "HS256"}, "b", "secret")
+        s3 = jws.serialize_compact({"alg": "RS256"}, "c", private_key)
+        calls = []
+
+        def load_key(header, payload):
+            calls.append(header["alg"])
+            return public_key
+
+        tokens = [s1, s2, b"invalid", s3, s1[:-4] + b"AAAA"]
+        results = jws.verify_many(tokens, load_key)
+        # the key is loaded for every token
+        assert calls == ["RS256", "HS256", "RS256", "RS256"]
+        assert results[0]["payload"] == b"a"
+        # an RSA public key can not be used as a HMAC key
+        assert isinstance(results[1], ValueError)
+        assert isinstance(results[2], errors.DecodeError)
+        assert results[3]["payload"] == b"c"
+        assert isinstance(results[4], errors.BadSignatureError)
+
+    def test_verify_many_key_by_payload(self):
+        jws = JsonWebSignature()
+        keys = {b"a": "secret-a", b"b": "secret-b"}
+        s1 = jws.serialize_compact({"alg": "HS256"}, "a", keys[b"a"])
+        s2 = jws.serialize_compact({"alg": "HS256"}, "b", keys[b"b"])
+        # signed with the key of "a", but the payload claims "b"
+        s3 = jws.serialize_compact({"alg": "HS256"}, "b", keys[b"a"])
+
+        def load_key(header, payload):
+            return keys[payload]
+
+        results = jws.verify_many([s1, s2, s3], load_key)
+        assert results[0]["payload"] == b"a"
+        assert results[1]["payload"] == b"b"
+        assert isinstance(results[2], errors.BadSignatureError)
+
+    def test_verify_many_failed_task(self):
+        class FailingExecutor(ThreadPoolExecutor):
+            def submit(self, fn, *args, **kwargs):
+                if len(args[2]) == 1:
+                    fn = fail
+                return super().submit(fn, *args, **kwargs)
+
+        def fail(*args):
+            raise RuntimeError("worker died")
+
+        jws = JsonWebSignature()
+        tokens = [
+            jws.serialize_compact({"alg": "HS256"}, str(i), "secret") for i in range(3)
+        ]
+        with FailingExecutor(max_workers=2) as executor:
+            results = jws.verify_many(tokens, "secret", executor=executor, chunk_size=2)
+        assert results[0]["payload"] == b"0"
+        assert results[1]["payload"] == b"1"
+        assert isinstance(results[2], RuntimeError)
+
+    def test_verify_many_in_executor(self):
+        jws = JsonWebSignature()
+        private_key = read_file_path("rsa_private.pem")
+        public_key = read_file_path("rsa_public.pem")
+        tokens = [
+            jws.serialize_compact({"alg": "RS256"}, str(i), private_key)
+            for i in range(5)
+        ]
+        tokens.append(tokens[0][:-4] + b"AAAA")
+        for executor_cls in (ThreadPoolExecutor, ProcessPoolExecutor):
+            with executor_cls(max_workers=2) as executor:
+                results = jws.verify_many(
+                    tokens, public_key, executor=executor, chunk_size=2
+                )
+            assert [r["payload"] for r in results[:5]] == [
+                str(i).encode() for i in range(5)
+            ]
+            assert isinstance(results[5], errors.BadSignatureError)
+
+    def test_header_cache(self):
+        jws = JsonWebSignature()
+        jws.HEADER_CACHE = cache = HeaderCache(maxsize=2)
+        s = jws.serialize({"alg": "HS256", "kid": "a"}, "hello", "secret")
+        data = jws.deserialize(s, "secret")
+        assert len(cache) == 1
+
+        # the cached header is not shared with the returned data
+        data["header"]["kid"] = "b"
+        data = jws.deserialize(s, "secret")
+        assert data["header"] == {"alg": "HS256", "kid": "a"}
+        assert len(cache) == 1
+
+        # algorithms of the instance are checked on a cache hit
+        strict = JsonWebSignature(algorithms=["RS256"])
+        strict.HEADER_CACHE = cache
+        with pytest.raises(errors.UnsupportedAlgorithmError):
+            strict.deserialize(s, "secret")
+
+        for kid in ("c", "d"):
+            s = jws.serialize({"alg": "HS256", "kid": kid}, "hello", "secret")
+            jws.deserialize(s, "secret")
+        assert len(cache) == 2
+
+        # headers with nested values are not cached
+        cache.clear()
+        s = jws.serialize({"alg": "HS256", "crit": ["kid"]}, "hello", "secret")
+        jws.deserialize(s, "secret")
+        assert len(cache) == 0
+
+    def test_header_cache_of_other_registry(self):
+        verified = []
+
+        class MyHMACAlgorithm(HMACAlgorithm):
+            def verify(self, msg, sig, key):
+                verified.append(self.name)
+                return super().verify(msg, sig, key)
+
+        class MyJWS(JsonWebSignature):
+            ALGORITHMS_REGISTRY = {
+                "HS256": MyHMACAlgorithm(256),
+            }
+
+        jws = JsonWebSignature()
+        jws.HEADER_CACHE = cache = HeaderCache()
+        s = jws.serialize_compact({"alg": "HS256"}, "hello", "secret")
+        jws.deserialize_compact(s, "secret")
+        assert verified == []
+
+        MyJWS.HEADER_CACHE = cache
+        MyJWS().deserialize_compact(s, "secret")
+        assert verified == ["HS256"]
+        assert len(cache) == 2
+
+    def test_signer_and_verifier(self):
+        jws = JsonWebSignature()
+        keys = [
+            ("HS256", "secret", "secret"),
+            ("RS256", "rsa_private.pem", "rsa_public.pem"),
+            ("PS256", "rsa_private.pem", "rsa_public.pem"),
+            ("ES256", "secp256r1-private.json", "secp256r1-public.json"),
+            ("ES512", "secp521r1-private.json", "secp521r1-public.json"),
+            ("EdDSA", "ed25519-pkcs8.pem", "ed25519-pub.pem"),
+        ]
+        for alg, private_name, public_name in keys:
+            if alg == "HS256":
+                private_key = public_key = "secret"
+            else:
+                private_key = read_file_path(private_name)
+                public_key = read_file_path(public_name)
+
+            header = {"alg": alg, "kid": "k1"}
+            signer = jws.signer(header, private_key)
+            verifier = jws.verifier(alg, public_key)
+            for payload in (b"hello", "world"):
+                s = signer.serialize_compact(payload)
+                if alg in ("HS256", "RS256", "EdDSA"):
+                    # deterministic signatures
+                    assert s == jws.serialize_compact(header, payload, private_key)
+                data = verifier.deserialize_compact(s)
+                assert data["header"] == header
+                assert data["payload"] == to_bytes(payload)
+                assert jws.deserialize_compact(s, public_key) == data
+
+            with pytest.raises(errors.BadSignatureError):
+                verifier.deserialize_compact(s[:-4] + b"AAAA")
+
+        s = jws.serialize_compact({"alg": "HS384"}, "hello", "secret")
+        with pytest.raises(errors.UnsupportedAlgorithmError):
+            jws.verifier("HS256", "secret").deserialize_compact(s)
+
+    def test_signer_validates_header(self):
+        jws = JsonWebSignature(algorithms=["HS256"], private_headers=[])
+        with pytest.raises(errors.UnsupportedAlgorithmError):
+            jws.signer({"alg": "HS384"}, "secret")
+        with pytest.raises(errors.UnsupportedAlgorithmError):
+            jws.verifier("HS384", "secret")
+        with pytest.raises(errors.InvalidHeaderParameterNameError):
+            jws.signer({"alg": "HS256", "foo": "bar"}, "secret")
+        with pytest.raises(ValueError):
+            jws.signer({"alg": "HS256"}, read_file_path("rsa_public.pem"))
+
+    def test_unencoded_payload(self):
+        # https://www.rfc-editor.org/rfc/rfc7797#section-4
+        jws = JsonWebSignature()
+        key = OctKey.import_key(
+            {
+                "kty": "oct",
+                "k": "AyM1SysPpbyDfgZld3umj1qzKObwVMkoqQ-EstJQLr_T-1qS0gZH75aKtMN3Yj0iPS4hcgUuTwjAzZr1Z9CAow",
+            }
+        )
+        header = {"alg": "HS256", "b64": False, "crit": ["b64"]}
+        s = jws.serialize_compact(header, "$.02", key, detached=True)
+        assert s == (
+            b"eyJhbGciOiJIUzI1NiIsImI2NCI6ZmFsc2UsImNyaXQiOlsiYjY0Il19"
+            b"..A5dxf2s96_n5FLueVuW1Z_vh161FwXZC4YLPff6dmDY"
+        )
+        data = jws.deserialize_compact(s, key, detached_payload="$.02")
+        assert data["payload"] == b"$.02"
+        data = jws.deserialize_compact(s, key, detached_payload=[b"$", b".02"])
+        assert data["payload"] is None
+        with pytest.raises(errors.BadSignatureError):
+            jws.deserialize_compact(s, key, detached_payload="$.03")
+
+        s = jws.serialize_compact({"alg": "HS256"}, "$.02", key, detached=True)
+        assert s == b"eyJhbGciOiJIUzI1NiJ9..5mvfOroL-g7HyqJoozehmsaqmvTYGEq5jTI1gVvoEoQ"
+        data = jws.deserialize_compact(s, key, detached_payload=io.BytesIO(b"$.02"))
+        assert data["header"] == {"alg": "HS256"}
+
+        # attached unencoded payload
+        s = jws.serialize_compact(header, "hello", key)
+        assert s.split(b".")[1] == b"hello"
+        assert jws.deserialize_compact(s, key)["payload"] == b"hello"
+        assert jws.signer(header, key).serialize_compact("hello") == s
+        with pytest.raises(ValueError):
+            jws.serialize_compact(header, "$.02", key)
+
+    def test_invalid_b64_header(self):
+        jws = JsonWebSignature()
+        with pytest.raises(ValueError):
+            jws.serialize_compact({"alg": "HS256", "b64": False}, "a", "secret")
+        with pytest.raises(ValueError):
+            jws.serialize_compact(
+                {"alg": "HS256", "b64": "no", "crit": ["b64"]}, "a", "secret"
+            )
+        with pytest.raises(ValueError):
+            jws.serialize_json(
+                [
+                    {"protected": {"alg": "HS256", "b64": False, "crit": ["b64"]}},
+                    {"protected": {"alg": "HS256"}},
+                ],
+                "a",
+                "secret",
+            )
+        # eyJhbGciOiJIUzI1NiIsImI2NCI6ZmFsc2V9: {"alg":"HS256","b64":false}
+        with pytest.raises(errors.DecodeError):
+            jws.deserialize_compact("eyJhbGciOiJIUzI1NiIsImI2NCI6ZmFsc2V9.a.YQ", "k")
+
+    def test_detached_stream(self):
+        jws = JsonWebSignature()
+        payload = b"".join(to_bytes(str(i)) for i in range(20000))
+        keys = [
+            ("HS256", "secret", "secret"),
+            ("RS256", "rsa_private.pem", "rsa_public.pem"),
+            ("PS256", "rsa_private.pem", "rsa_public.pem"),
+            ("ES256", "secp256r1-private.json", "secp256r1-public.json"),
+            ("EdDSA", "ed25519-pkcs8.pem", "ed25519-pub.pem"),
+        ]
+        for alg, private_name, public_name in keys:
+            if alg == "HS256":
+                private_key = public_key = "secret"
+            else:
+                private_key = read_file_path(private_name)
+                public_key = read_file_path(public_name)
+
+            for header in (
+                {"alg": alg},
+                {"alg": alg, "b64": False, "crit": ["b64"]},
+            ):
+                s = jws.serialize_compact(
+                    header, io.BytesIO(payload), private_key, detached=True
+                )
+                if alg in ("HS256", "RS256", "EdDSA"):
+                    # deterministic signatures
+                    attached = jws.serialize_compact(header, payload, private_key)
+                    assert s.split(b".")[2] == attached.split(b".")[2]
+
+                data = jws.deserialize_compact(
+                    s, public_key, detached_payload=io.BytesIO(payload)
+                )
+                assert data["header"] == header
+                data = jws.deserialize_compact(s, public_key, detached_payload=payload)
+                assert data["payload"] == payload
+                with pytest.raises(errors.BadSignatureError):
+                    jws.deserialize_compact(
+                        s, public_key, detached_payload=io.BytesIO(payload + b"0")
+                    )
+
+    def test_detached_json(self):
+        jws = JsonWebSignature()
+        private_key = read_file_path("rsa_private.pem")
+        public_key = read_file_path("rsa_public.pem")
+        protected = {"alg": "RS256", "b64": False, "crit": ["b64"]}
+        header_obj = [
+            {"protected": protected, "header": {"kid": "a"}},
+            {"protected": protected, "header": {"kid": "b"}},
+        ]
+        data = jws.serialize_json(header_obj, io.BytesIO(b"hello"), private_key, True)
+        assert "payload" not in data
+        assert len(data["signatures"]) == 2
+        rv = jws.deserialize_json(data, public_key, detached_payload=[b"he", b"llo"])
+        assert rv["payload"] is None
+        rv = jws.deserialize_json(data, public_key, detached_payload=b"hello")
+        assert rv["payload"] == b"hello"
+        assert rv.headers[1]["kid"] == "b"
+        with pytest.raises(errors.BadSignatureError):
+            jws.deserialize_json(data, public_key, detached_payload=b"world")
+        with pytest.raises(errors.DecodeError):
+            jws.deserialize_json(data, public_key)
+
+        header_obj = {"protected": protected, "header": {"kid": "a"}}
+        data = jws.serialize_json(header_obj, "$.02", private_key)
+        assert data["payload"] == "$.02"
+        rv = jws.deserialize_json(data, public_key)
+        assert rv["payload"] == b"$.02"
+        data["payload"] = "$.03"
+        with pytest.raises(errors.BadSignatureError):
+            jws.deserialize_json(data, public_key)
+        with pytest.raises(errors.DecodeError):
+            jws.deserialize_json(data, public_key, detached_payload=b"$.02")
+
+    def test_disable_prepared_key_cache(self):
+        jws = JsonWebSignature(key_cache=False)
+        cache = JsonWebSignature.KEY_CACHE
+        hits, misses = cache.hits, cache.misses
+        s = jws.serialize({"alg": "HS256"}, "hello", "secret")
+        jws.deserialize(s, "secret")
+        assert cache.hits == hits
+        assert cache.misses == misses
+
+
+@pytest.mark.asyncio
+async def test_compact_async():
+    jws = JsonWebSignature()
+    private_key = read_file_path("secp521r1-private.json")
+    public_key = read_file_path("secp521r1-public.json")
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        jws.EXECUTOR = executor
+        s = await jws.serialize_compact_async({"alg": "ES512"}, "hello", private_key)
+        data = await jws.deserialize_compact_async(s, lambda h, p: public_key)
+        assert data["payload"] == b"hello"
+
+        s = s[:-4] + b"AAAA"
+        with pytest.raises(errors.BadSignatureError):
+            await jws.deserialize_compact_async(s, public_key)
+
+
+@pytest.mark.asyncio
+async def test_compact_async_disallowed_algorithm():
+    calls = []
+
+    async def load_key(header, payload):
+        calls.append(header)
+        return "secret"
+
+    s = JsonWebSignature().serialize_compact({"alg": "HS256"}, "hello", "secret")
+    jws = JsonWebSignature(algorithms=["RS256"])
+    with pytest.raises(errors.UnsupportedAlgorithmError):
+        await jws.deserialize_compact_async(s, load_key)
+
+    s = b"eyJhbGciOiJ1bmtub3duIn0.aGVsbG8.c2ln"
+    with pytest.raises(errors.UnsupportedAlgorithmError):
+        await JsonWebSignature().deserialize_compact_async(s, load_key)
+    assert calls == []
+
+
+def test_signing_pool():
+    private_set = JsonWebKey.import_key_set(read_file_path("jwks_private.json"))
+    public_set = JsonWebKey.import_key_set(read_file_path("jwks_public.json"))
+    with SigningPool(private_set, max_workers=2) as pool:
+        assert "abc" in pool
+        jws = JsonWebSignature(signing_pool=pool)
+        header = {"alg": "RS256", "kid": "abc"}
+        s = jws.serialize_compact(header, "hello", None)
+        assert s == JsonWebSignature().serialize_compact(
+            header, "hello", private_set.find_by_kid("abc")
+        )
+        data = jws.deserialize_compact(s, public_set.find_by_kid("abc"))
+        assert data["payload"] == b"hello"
+
+        signer = jws.signer({"alg": "PS256", "kid": "abc"}, None)
+        s = signer.serialize_compact("hello")
+        data = jws.deserialize_compact(s, public_set.find_by_kid("abc"))
+        assert data["payload"] == b"hello"
+
+        # keys which are not in the pool sign in this process
+        s = jws.serialize_compact({"alg": "HS256", "kid": "abc"}, "hello", "secret")
+        assert jws.deserialize_compact(s, "secret")["payload"] == b"hello"
+        s = jws.serialize_compact({"alg": "RS256"}, "hello", private_set.keys[0])
+        assert jws.deserialize_compact(s, public_set.keys[0])["payload"] == b"hello"
+
+        # a given key is used instead of the pool key of the same kid
+        other_key = RSAKey.generate_key(2048, is_private=True)
+        s = jws.serialize_compact(header, "hello", other_key)
+        assert jws.deserialize_compact(s, other_key)["payload"] == b"hello"
+        signer = jws.signer(header, other_key)
+        s = signer.serialize_compact("hello")
+        assert jws.deserialize_compact(s, other_key)["payload"] == b"hello"
+
+        with pytest.raises(ValueError):
+            pool.sign("RS256", "unknown", b"hello")
+
+    with pytest.raises(ValueError):
+        SigningPool(public_set)
+
+
+@pytest.mark.asyncio
+async def test_signing_pool_async():
+    private_set = JsonWebKey.import_key_set(read_file_path("jwks_private.json"))
+    public_set = JsonWebKey.import_key_set(read_file_path("jwks_public.json"))
+    with SigningPool(private_set, max_workers=1) as pool:
+        jwt = JsonWebToken(["RS256"], signing_pool=pool)
+        header = {"alg": "RS256", "kid": "bilbo.baggins@hobbiton.example"}
+        token = await jwt.encode_async(header, {"sub": "123"}, None)
+        claims = jwt.decode(token, public_set)
+        assert claims["sub"] == "123"
+
+        other_key = RSAKey.generate_key(2048, is_private=True)
+        token = await jwt.encode_async(header, {"sub": "123"}, other_key)
+        claims = jwt.decode(token, other_key)
+        assert claims["sub"] == "123"
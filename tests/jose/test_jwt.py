@@ -1,8 +1,11 @@
+import asyncio
 import datetime
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 
 import pytest
 
+from authlib.jose import ClaimsOptions
 from authlib.jose import JsonWebKey
 from authlib.jose import JsonWebToken
 from authlib.jose import JWTClaims
@@ -93,6 +96,55 @@ class JWTTest(unittest.TestCase):
         claims.options = {"aud": {"values": []}}
         claims.validate()
 
+    def test_claims_options(self):
+        def validate_jti(claims, value):
+            return value.startswith("j")
+
+        options = {
+            "iss": {"essential": True, "values": ["foo", "bar"]},
+            "aud": {"essential": True, "values": ["a", "b"]},
+            "jti": {"validate": validate_jti},
+            "custom": {"value": "x"},
+            "roles": {"values": ["admin"]},
+        }
+        compiled = ClaimsOptions(options)
+        assert compiled.essential_claims == ("iss", "aud")
+        assert compiled.aud_values == frozenset(["a", "b"])
+        assert compiled.get_custom_claims(JWTClaims) == ("custom", "roles")
+        assert dict(compiled) == options
+
+        valid = {"iss": "foo", "aud": "a", "jti": "j0", "custom": "x", "roles": "admin"}
+        payloads = [
+            ({}, None),
+            ({"iss": "bar", "aud": ["c", "b"], "jti": "j1"}, None),
+            ({"iss": None}, errors.MissingClaimError),
+            ({"iss": ""}, errors.InvalidClaimError),
+            ({"iss": "baz"}, errors.InvalidClaimError),
+            ({"aud": ["c"]}, errors.InvalidClaimError),
+            ({"aud": [["a"]]}, errors.InvalidClaimError),
+            ({"jti": "k"}, errors.InvalidClaimError),
+            ({"custom": "y"}, errors.InvalidClaimError),
+            ({"roles": ["admin"]}, errors.InvalidClaimError),
+        ]
+        for changes, error_cls in payloads:
+            payload = {k: v for k, v in dict(valid, **changes).items() if v is not None}
+            for claims_options in (options, compiled):
+                claims = JWTClaims(payload, {}, options=claims_options)
+                if error_cls is None:
+                    claims.validate()
+                else:
+                    with pytest.raises(error_cls):
+                        claims.validate()
+
+        token = jwt.encode({"alg": "HS256"}, valid, "k")
+        claims = jwt.decode(token, "k", claims_options=compiled)
+        claims.validate()
+        assert claims.options is compiled
+
+        # compiled options are read only
+        with pytest.raises(TypeError):
+            compiled["sub"] = {"essential": True}
+
     def test_validate_exp(self):
         id_token = jwt.encode({"alg": "HS256"}, {"exp": "invalid"}, "k")
         claims = jwt.decode(id_token, "k")
@@ -210,6 +262,76 @@ class JWTTest(unittest.TestCase):
         claims = jwt.decode(data, pub_key)
         assert claims["name"] == "hi"
 
+    def test_decode_many(self):
+        private_key = read_file_path("jwks_private.json")
+        pub_key = JsonWebKey.import_key_set(read_file_path("jwks_public.json"))
+        kid = "bilbo.baggins@hobbiton.example"
+        s1 = jwt.encode({"alg": "RS256", "kid": "abc"}, {"n": 1}, private_key)
+        s2 = jwt.encode({"alg": "RS256", "kid": kid}, {"n": 2}, private_key)
+        s3 = jwt.encode({"alg": "RS256", "kid": "abc"}, {"n": 3}, private_key)
+        s4 = jwt.encode({"alg": "HS256", "kid": "404"}, {"n": 4}, "secret")
+        tokens = [s1, s2, "a.b", s3, s4]
+        results = jwt.decode_many(tokens, pub_key)
+        assert [r["n"] for r in results[:2]] == [1, 2]
+        assert isinstance(results[2], errors.DecodeError)
+        assert results[3]["n"] == 3
+        assert isinstance(results[4], ValueError)
+
+        # JWE tokens are decoded too
+        _jwt = JsonWebToken(["RSA-OAEP", "A256GCM"])
+        header = {"alg": "RSA-OAEP", "enc": "A256GCM"}
+        s5 = _jwt.encode(header, {"n": 5}, read_file_path("rsa_public.pem"))
+        results = _jwt.decode_many([s5, s1], read_file_path("rsa_private.pem"))
+        assert results[0]["n"] == 5
+        assert isinstance(results[1], errors.UnsupportedAlgorithmError)
+
+    def test_template(self):
+        private_key = read_file_path("jwks_private.json")
+        header = {"alg": "RS256", "kid": "abc"}
+        claims = {"iss": "https://a.b", "aud": "client", "sub": "", "name": "Ünï"}
+        template = jwt.template(header, claims, private_key)
+        assert header == {"alg": "RS256", "kid": "abc"}
+
+        dynamic = {
+            "sub": "123",
+            "iat": 1700000000,
+            "exp": datetime.datetime(2030, 1, 1),
+            "jti": "a1",
+        }
+        data = template.encode(dynamic)
+        expected = jwt.encode(dict(header), {**claims, **dynamic}, private_key)
+        assert data == expected
+        assert template.encode() == jwt.encode(dict(header), claims, private_key)
+
+        claims = jwt.decode(data, read_file_path("jwks_public.json"))
+        assert list(claims) == ["iss", "aud", "sub", "name", "iat", "exp", "jti"]
+        assert claims["exp"] == 1893456000
+
+        for static in ({}, {"iss": "https://a.b"}):
+            template = jwt.template(header, static, private_key)
+            expected = jwt.encode(dict(header), {**static, **dynamic}, private_key)
+            assert template.encode(dynamic) == expected
+
+    def test_template_sensitive_data(self):
+        with pytest.raises(errors.InsecureClaimError):
+            jwt.template({"alg": "HS256"}, {"password": ""}, "k")
+
+        template = jwt.template({"alg": "HS256"}, {"iss": "a"}, "k")
+        with pytest.raises(errors.InsecureClaimError):
+            template.encode({"token": "x"})
+
+        template = jwt.template({"alg": "HS256"}, {"iss": "a"}, "k", check=False)
+        template.encode({"token": "x"})
+
+    def test_template_with_jwe(self):
+        _jwt = JsonWebToken(["RSA-OAEP", "A256GCM"])
+        header = {"alg": "RSA-OAEP", "enc": "A256GCM"}
+        template = _jwt.template(header, {"iss": "a"}, read_file_path("rsa_public.pem"))
+        data = template.encode({"sub": "b"})
+        assert data.count(b".") == 4
+        claims = _jwt.decode(data, read_file_path("rsa_private.pem"))
+        assert claims == {"iss": "a", "sub": "b"}
+
     def test_use_jwks_single_kid(self):
         """Test that jwks can be decoded if a kid for decoding is given and encoded data has no kid and only one key is set."""
         header = {"alg": "RS256"}
@@ -243,3 +365,65 @@ class JWTTest(unittest.TestCase):
 
         claims = jwt.decode(data, pub_key)
         assert claims["name"] == "hi"
+
+
+class CountingExecutor(ThreadPoolExecutor):
+    def __init__(self):
+        super().__init__(max_workers=1)
+        self.count = 0
+
+    def submit(self, fn, *args, **kwargs):
+        self.count += 1
+        return super().submit(fn, *args, **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_encode_decode_async():
+    private_key = read_file_path("rsa_private.pem")
+    public_key = read_file_path("rsa_public.pem")
+
+    async def load_key(header, payload):
+        await asyncio.sleep(0)
+        assert header["kid"] == "k1"
+        assert payload["name"] == "hi"
+        return public_key
+
+    with CountingExecutor() as executor:
+        header = {"alg": "RS256", "kid": "k1"}
+        data = await jwt.encode_async(
+            header, {"name": "hi"}, private_key, executor=executor
+        )
+        assert data == jwt.encode(header, {"name": "hi"}, private_key)
+        claims = await jwt.decode_async(data, load_key, executor=executor)
+        assert claims["name"] == "hi"
+        assert executor.count == 2
+
+        # cheap algorithms run on the event loop
+        data = await jwt.encode_async(
+            {"alg": "HS256"}, {"name": "hi"}, "secret", executor=executor
+        )
+        claims = await jwt.decode_async(data, "secret", executor=executor)
+        assert claims["name"] == "hi"
+        assert executor.count == 2
+
+        with pytest.raises(errors.BadSignatureError):
+            await jwt.decode_async(data, "invalid", executor=executor)
+        with pytest.raises(errors.DecodeError):
+            await jwt.decode_async(b"a.b", "secret")
+
+
+@pytest.mark.asyncio
+async def test_encode_decode_async_jwe():
+    jwt = JsonWebToken(["RSA-OAEP", "A256GCM"])
+    private_key = read_file_path("rsa_private.pem")
+    public_key = read_file_path("rsa_public.pem")
+
+    async def load_key(header, payload):
+        assert payload is None
+        return private_key
+
+    header = {"alg": "RSA-OAEP", "enc": "A256GCM"}
+    data = await jwt.encode_async(header, {"name": "hi"}, public_key)
+    assert data.count(b".") == 4
+    claims = await jwt.decode_async(data, load_key)
+    assert claims["name"] == "hi"